@@ -0,0 +1,126 @@
+"""Idle CPU and message pickup latency benchmark for the agent run loop.
+
+Compares the previous run loop, which polled both queues and slept 100 ms
+when they were empty, with the current one that sleeps until a message
+lands. We count event loop iterations and CPU time while every agent is
+idle, then time how long each agent takes to start processing a message
+sent to it through the router.
+
+Usage:
+    python benchmarks/agent_run_loop.py --agents 400 --seconds 2
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from agile_ai_sdk.agents.base import BaseAgent
+from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.core.router import MessageRouter
+from agile_ai_sdk.models import AgentRole, HumanRole, Message
+
+
+class TimingAgent(BaseAgent):
+    """Agent that records when each batch reaches process_messages()."""
+
+    def __init__(self, router: MessageRouter, event_stream: EventStream):
+        super().__init__(AgentRole.DEV, router, event_stream)
+        self.picked_up = asyncio.Event()
+        self.pickup_time: float = 0.0
+
+    async def process_messages(self, messages: list[Message]) -> None:
+        self.pickup_time = time.perf_counter()
+        self.picked_up.set()
+
+
+class PollingAgent(TimingAgent):
+    """The pre-change run loop, kept here as the baseline."""
+
+    async def run_loop(self) -> None:
+        while self._running:
+            if not self.interrupt_queue.empty():
+                messages = await self._flush_queue(self.interrupt_queue)
+            elif not self.inbox.empty():
+                messages = await self._flush_queue(self.inbox)
+            else:
+                await asyncio.sleep(0.1)
+                continue
+
+            await self.process_messages(messages)
+
+
+def _count_loop_iterations(loop: asyncio.AbstractEventLoop) -> list[int]:
+    """Wrap the loop's internal _run_once to count iterations."""
+
+    counter = [0]
+    original = loop._run_once  # type: ignore[attr-defined]
+
+    def run_once() -> None:
+        counter[0] += 1
+        original()
+
+    loop._run_once = run_once  # type: ignore[attr-defined]
+    return counter
+
+
+async def _run(agent_cls: type[TimingAgent], agents: int, seconds: float) -> dict[str, float]:
+    loop = asyncio.get_running_loop()
+
+    # One router per agent, as with many single-agent teams in one process
+    team: list[tuple[MessageRouter, TimingAgent]] = []
+    for _ in range(agents):
+        stream = EventStream()
+        router = MessageRouter(stream)
+        agent = agent_cls(router, stream)
+        router.register_agent(AgentRole.DEV, agent)
+        team.append((router, agent))
+
+    tasks = [agent.spawn() for _, agent in team]
+    await asyncio.sleep(0.2)  # let agents settle
+
+    counter = _count_loop_iterations(loop)
+    cpu_start = time.process_time()
+    await asyncio.sleep(seconds)
+    cpu_used = time.process_time() - cpu_start
+    iterations = counter[0]
+
+    latencies = []
+    for router, agent in team:
+        sent = time.perf_counter()
+        await router.send(HumanRole.USER, AgentRole.DEV, "ping")
+        await agent.picked_up.wait()
+        latencies.append(agent.pickup_time - sent)
+
+    for _, agent in team:
+        agent.stop()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    latencies.sort()
+    return {
+        "wakeups_per_sec": iterations / seconds,
+        "cpu_percent": 100.0 * cpu_used / seconds,
+        "pickup_p50_ms": 1000.0 * statistics.median(latencies),
+        "pickup_max_ms": 1000.0 * latencies[-1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--agents", type=int, default=400)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{args.agents} idle agents, {args.seconds:.1f}s idle window\n")
+    print(f"{'variant':<10} {'wakeups/s':>12} {'cpu %':>8} {'pickup p50 ms':>15} {'pickup max ms':>15}")
+
+    for name, cls in (("polling", PollingAgent), ("event", TimingAgent)):
+        r = asyncio.run(_run(cls, args.agents, args.seconds))
+        print(
+            f"{name:<10} {r['wakeups_per_sec']:>12.1f} {r['cpu_percent']:>8.2f} "
+            f"{r['pickup_p50_ms']:>15.2f} {r['pickup_max_ms']:>15.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
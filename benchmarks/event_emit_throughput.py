@@ -0,0 +1,149 @@
+"""Event construction and emit() throughput benchmark.
+
+Compares the previous Event/Message models (uuid4() ids, two datetime.now()
+calls, message payloads validated as id-bearing models and dumped again) with
+the current ones, which keep the payload model and dump it only when data is
+read. Each variant builds events the way MessageRouter does for
+one routed message, a Message plus a "sent" and a "received" event, emits
+them through an EventStream, and a consumer drains the stream.
+
+Usage:
+    python benchmarks/event_emit_throughput.py --messages 20000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel as BasePydanticModel
+from pydantic import Field
+
+from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.models import (
+    AgentRole,
+    Event,
+    EventType,
+    HumanRole,
+    Message,
+    MessageReceivedData,
+    MessageSentData,
+    Priority,
+)
+
+
+class LegacyBaseModel(BasePydanticModel):
+    """The pre-change BaseModel, kept here as the baseline."""
+
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+
+class LegacyEvent(LegacyBaseModel):
+    type: EventType
+    agent: AgentRole | HumanRole
+    data: dict[str, Any] = Field(default_factory=dict)
+    seq: int | None = None
+    mono_ns: int | None = None
+
+
+class LegacyMessage(LegacyBaseModel):
+    source: AgentRole | HumanRole
+    target: AgentRole
+    content: str
+    priority: Priority = Priority.NORMAL
+
+
+class LegacyMessageSentData(LegacyBaseModel):
+    action: Literal["sent"] = "sent"
+    to: str
+    content: str
+    priority: str
+
+
+class LegacyMessageReceivedData(LegacyBaseModel):
+    action: Literal["received"] = "received"
+    from_: str
+    content: str
+    priority: str
+
+
+def _legacy_events(content: str) -> tuple[Any, Any]:
+    message = LegacyMessage(source=AgentRole.EM, target=AgentRole.DEV, content=content)
+    sent = LegacyEvent(
+        type=EventType.TEXT_MESSAGE_CONTENT,
+        agent=message.source,
+        data=LegacyMessageSentData(
+            to=message.target.value, content=message.content, priority=message.priority.value
+        ).model_dump(),
+    )
+    received = LegacyEvent(
+        type=EventType.TEXT_MESSAGE_CONTENT,
+        agent=message.target,
+        data=LegacyMessageReceivedData(
+            from_=message.source.value, content=message.content, priority=message.priority.value
+        ).model_dump(),
+    )
+    return sent, received
+
+
+def _current_events(content: str) -> tuple[Any, Any]:
+    message = Message(source=AgentRole.EM, target=AgentRole.DEV, content=content)
+    sent = Event(
+        type=EventType.TEXT_MESSAGE_CONTENT,
+        agent=message.source,
+        data=MessageSentData(to=message.target.value, content=message.content, priority=message.priority.value),
+    )
+    received = Event(
+        type=EventType.TEXT_MESSAGE_CONTENT,
+        agent=message.target,
+        data=MessageReceivedData(
+            from_=message.source.value, content=message.content, priority=message.priority.value, message_id=message.id
+        ),
+    )
+    return sent, received
+
+
+async def _run(build, messages: int) -> dict[str, float]:
+    stream = EventStream()
+    received = 0
+
+    async def consume() -> None:
+        nonlocal received
+        async for _ in stream:
+            received += 1
+
+    consumer = asyncio.create_task(consume())
+
+    started = time.perf_counter()
+    for i in range(messages):
+        for event in build(f"message {i}"):
+            await stream.emit(event)
+    stream.close()
+    await consumer
+    elapsed = time.perf_counter() - started
+
+    return {
+        "events_per_sec": received / elapsed,
+        "us_per_message": 1e6 * elapsed / messages,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{args.messages} routed messages, 2 events each\n")
+    print(f"{'variant':<10} {'events/s':>12} {'us/message':>12}")
+
+    for name, build in (("legacy", _legacy_events), ("current", _current_events)):
+        r = asyncio.run(_run(build, args.messages))
+        print(f"{name:<10} {r['events_per_sec']:>12,.0f} {r['us_per_message']:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
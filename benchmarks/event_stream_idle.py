@@ -0,0 +1,112 @@
+"""Idle wakeup and shutdown latency benchmark for EventStream consumers.
+
+Compares the previous 100 ms polling iterator with the current event-driven
+one. Each consumer sits idle on an empty stream; we count event loop
+iterations and CPU time over the idle window, then measure how long each
+consumer takes to exit after close().
+
+Usage:
+    python benchmarks/event_stream_idle.py --consumers 500 --seconds 2
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.models import Event
+
+
+class PollingEventStream:
+    """The pre-change EventStream iterator, kept here as the baseline."""
+
+    def __init__(self):
+        self._queue: asyncio.Queue[Event] = asyncio.Queue()
+        self._closed: bool = False
+
+    async def emit(self, event: Event) -> None:
+        if not self._closed:
+            await self._queue.put(event)
+
+    async def __aiter__(self) -> AsyncIterator[Event]:
+        while True:
+            try:
+                event = await asyncio.wait_for(self._queue.get(), timeout=0.1)
+                yield event
+
+            except asyncio.TimeoutError:
+                if self._closed and self._queue.empty():
+                    break
+                continue
+
+    def close(self) -> None:
+        self._closed = True
+
+
+def _count_loop_iterations(loop: asyncio.AbstractEventLoop) -> list[int]:
+    """Wrap the loop's internal _run_once to count iterations."""
+
+    counter = [0]
+    original = loop._run_once  # type: ignore[attr-defined]
+
+    def run_once() -> None:
+        counter[0] += 1
+        original()
+
+    loop._run_once = run_once  # type: ignore[attr-defined]
+    return counter
+
+
+async def _run(stream_cls: type, consumers: int, seconds: float) -> dict[str, float]:
+    loop = asyncio.get_running_loop()
+    streams = [stream_cls() for _ in range(consumers)]
+    exit_times: list[float] = []
+
+    async def consume(stream) -> None:
+        async for _ in stream:
+            pass
+        exit_times.append(time.perf_counter())
+
+    tasks = [asyncio.create_task(consume(s)) for s in streams]
+    await asyncio.sleep(0.2)  # let consumers settle
+
+    counter = _count_loop_iterations(loop)
+    cpu_start = time.process_time()
+    await asyncio.sleep(seconds)
+    cpu_used = time.process_time() - cpu_start
+    iterations = counter[0]
+
+    close_start = time.perf_counter()
+    for s in streams:
+        s.close()
+    await asyncio.gather(*tasks)
+    latencies = sorted(t - close_start for t in exit_times)
+
+    return {
+        "wakeups_per_sec": iterations / seconds,
+        "cpu_percent": 100.0 * cpu_used / seconds,
+        "close_p50_ms": 1000.0 * latencies[len(latencies) // 2],
+        "close_max_ms": 1000.0 * latencies[-1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--consumers", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{args.consumers} idle consumers, {args.seconds:.1f}s idle window\n")
+    print(f"{'variant':<10} {'wakeups/s':>12} {'cpu %':>8} {'close p50 ms':>14} {'close max ms':>14}")
+
+    for name, cls in (("polling", PollingEventStream), ("event", EventStream)):
+        r = asyncio.run(_run(cls, args.consumers, args.seconds))
+        print(
+            f"{name:<10} {r['wakeups_per_sec']:>12.1f} {r['cpu_percent']:>8.2f} "
+            f"{r['close_p50_ms']:>14.2f} {r['close_max_ms']:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Interrupt-to-handling latency benchmark.
+
+An agent works on a batch that runs a shell command for --work seconds,
+standing in for a long LLM call or run_bash. Midway through, an interrupt is
+routed to it and we time how long it takes until the agent starts handling
+the interrupt. Without preemption (the previous behaviour) the interrupt
+waits for the batch to finish; with it the batch and its command are
+cancelled.
+
+Usage:
+    python benchmarks/interrupt_latency.py --trials 5 --work 2.0
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+
+from agile_ai_sdk.agents.base import BaseAgent
+from agile_ai_sdk.core.config import AgentConfig
+from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.core.router import MessageRouter
+from agile_ai_sdk.models import AgentRole, Message, Priority
+from agile_ai_sdk.utils.shell import run_shell
+
+
+class WorkingAgent(BaseAgent):
+    """Runs a long command for normal messages and records when interrupts are handled."""
+
+    def __init__(self, router: MessageRouter, event_stream: EventStream, config: AgentConfig, work: float):
+        super().__init__(AgentRole.DEV, router, event_stream, config)
+        self.work = work
+        self.started = asyncio.Event()
+        self.handled = asyncio.Event()
+        self.handled_at: float = 0.0
+
+    async def process_messages(self, messages: list[Message]) -> None:
+        if any(msg.priority == Priority.INTERRUPT for msg in messages):
+            self.handled_at = time.perf_counter()
+            self.handled.set()
+            return
+
+        self.started.set()
+        await run_shell(f"sleep {self.work}", cwd=tempfile.gettempdir(), timeout=self.work + 5)
+
+
+async def _trial(preempt: bool, work: float) -> float:
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = WorkingAgent(router, stream, AgentConfig(preempt_on_interrupt=preempt), work)
+    router.register_agent(AgentRole.DEV, agent)
+    task = agent.spawn()
+
+    await router.send(AgentRole.EM, AgentRole.DEV, "long task")
+    await agent.started.wait()
+    await asyncio.sleep(work / 4)
+
+    sent = time.perf_counter()
+    await router.send(AgentRole.EM, AgentRole.DEV, "stop", priority=Priority.INTERRUPT)
+    await agent.handled.wait()
+
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+    return agent.handled_at - sent
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trials", type=int, default=5)
+    parser.add_argument("--work", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{args.trials} trials, {args.work:.1f}s of work per batch, interrupt at {args.work / 4:.2f}s\n")
+    print(f"{'variant':<12} {'p50 ms':>10} {'max ms':>10}")
+
+    for name, preempt in (("wait", False), ("preempt", True)):
+        latencies = sorted(asyncio.run(_trial(preempt, args.work)) for _ in range(args.trials))
+        print(f"{name:<12} {1000 * statistics.median(latencies):>10.2f} {1000 * latencies[-1]:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Per-command latency benchmark for run_bash's shell.
+
+Compares spawning a new shell for every command with run_shell(), the
+previous behaviour, against running each command in a long-lived
+ShellSession. Both run the same short commands, the kind agents issue most
+(ls, cat, git status), so process startup dominates the spawned variant.
+The session pays its startup once, before the timed commands.
+
+Usage:
+    python benchmarks/shell_session.py --commands 200 --command "git --version"
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+
+from agile_ai_sdk.utils.shell import ShellSession, run_shell
+
+
+async def _spawned(command: str, commands: int, cwd: str) -> list[float]:
+    latencies = []
+    for _ in range(commands):
+        start = time.perf_counter()
+        await run_shell(command, cwd=cwd, timeout=30.0)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def _session(command: str, commands: int, cwd: str) -> list[float]:
+    session = ShellSession(cwd)
+    await session.run("true", timeout=30.0)  # start the shell
+
+    latencies = []
+    for _ in range(commands):
+        start = time.perf_counter()
+        await session.run(command, timeout=30.0)
+        latencies.append(time.perf_counter() - start)
+
+    await session.close()
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commands", type=int, default=200)
+    parser.add_argument("--command", default="echo hi")
+    args = parser.parse_args()
+
+    cwd = tempfile.gettempdir()
+    print(f"{args.commands} x {args.command!r}\n")
+    print(f"{'variant':<10} {'p50 ms':>10} {'p99 ms':>10} {'total s':>10}")
+
+    for name, run in (("spawn", _spawned), ("session", _session)):
+        latencies = sorted(asyncio.run(run(args.command, args.commands, cwd)))
+        p99 = latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))]
+        print(f"{name:<10} {1000 * statistics.median(latencies):>10.2f} {1000 * p99:>10.2f} {sum(latencies):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
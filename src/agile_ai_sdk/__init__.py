@@ -1,7 +1,22 @@
-from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.core.config import AgentConfig, ContextPolicy, SupervisorPolicy, ToolOutputPolicy
+from agile_ai_sdk.core.dispatcher import EventDispatcher
+from agile_ai_sdk.core.events import EventStream, Subscription
 from agile_ai_sdk.executor import TaskExecutor
 from agile_ai_sdk.logging import EventLogger
-from agile_ai_sdk.models import AgentRole, Event, EventType, HumanRole, Message, Priority, RunStatus
+from agile_ai_sdk.models import (
+    AgentRole,
+    DispatchMode,
+    Event,
+    EventType,
+    HumanRole,
+    Message,
+    OverflowPolicy,
+    PoolPolicy,
+    Priority,
+    RoutingEventMode,
+    RunStatus,
+    Verbosity,
+)
 from agile_ai_sdk.models.enums.swarm_type import AgentSwarmType
 from agile_ai_sdk.solo_agent_harness import SoloAgentHarness
 from agile_ai_sdk.team import AgentTeam
@@ -13,15 +28,26 @@ __all__ = [
     "AgentTeam",
     "SoloAgentHarness",
     "TaskExecutor",
+    "AgentConfig",
+    "ContextPolicy",
     "AgentRole",
     "AgentSwarmType",
+    "DispatchMode",
     "Event",
+    "EventDispatcher",
     "EventLogger",
     "EventType",
     "HumanRole",
     "Message",
+    "OverflowPolicy",
+    "PoolPolicy",
     "Priority",
+    "RoutingEventMode",
     "RunStatus",
+    "Verbosity",
     "EventStream",
+    "Subscription",
+    "SupervisorPolicy",
+    "ToolOutputPolicy",
     "print_event",
 ]
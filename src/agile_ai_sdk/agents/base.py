@@ -1,12 +1,36 @@
 import asyncio
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from pydantic_ai.messages import ModelMessage
+from pydantic_ai.usage import RunUsage
 
+from agile_ai_sdk.core.config import AgentConfig
+from agile_ai_sdk.core.context import ContextWindowManager, ConversationSummary
 from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.core.queues import BoundedQueue
 from agile_ai_sdk.core.router import MessageRouter
-from agile_ai_sdk.models import AgentRole, AgentStatusData, ErrorData, Event, EventType, HumanRole, Message
+from agile_ai_sdk.core.tool_output import ToolOutputStore
+from agile_ai_sdk.models import (
+    AgentRole,
+    AgentStatusData,
+    ErrorData,
+    Event,
+    EventType,
+    HumanRole,
+    Message,
+    OverflowPolicy,
+    RoutingEventMode,
+    SupervisorData,
+    TextMessageData,
+    UsageData,
+)
+from agile_ai_sdk.utils.shell import ShellSession, run_shell
+
+if TYPE_CHECKING:
+    from agile_ai_sdk.core.pool import AgentPool
 
 
 class BaseAgent(ABC):
@@ -21,10 +45,10 @@ class BaseAgent(ABC):
         ...     async def process_messages(self, messages: list[Message]) -> None:
         ...         # Process batch of messages
         ...         for message in messages:
-        ...             await self.event_stream.emit(Event(
+        ...             await self.emit(Event(
         ...                 type=EventType.STEP_STARTED,
         ...                 agent=self.role,
-        ...                 data={"status": f"Processing {len(messages)} messages"}
+        ...                 data=AgentStatusData(status=f"Processing {len(messages)} messages")
         ...             ))
 
         Starting an agent:
@@ -38,20 +62,75 @@ class BaseAgent(ABC):
         >>> await self.talk_to(AgentRole.EM, "Task completed")
     """
 
-    def __init__(self, role: AgentRole, router: MessageRouter, event_stream: EventStream):
+    def __init__(
+        self,
+        role: AgentRole,
+        router: MessageRouter,
+        event_stream: EventStream,
+        config: AgentConfig | None = None,
+    ):
         self.role = role
         self.router = router
         self.event_stream = event_stream
-
-        # Communication channels
-        self.inbox: asyncio.Queue[Message] = asyncio.Queue()
-        self.interrupt_queue: asyncio.Queue[Message] = asyncio.Queue()
+        self.config = config or AgentConfig()
+
+        # Communication channels, both waking the run loop when a message lands
+        self._wakeup = asyncio.Event()
+        self.inbox: BoundedQueue[Message] = BoundedQueue(
+            maxsize=self.config.inbox_maxsize,
+            overflow=self.config.inbox_overflow,
+            block_timeout=self.config.inbox_block_timeout,
+            wakeup=self._wakeup,
+        )
+        self.interrupt_queue: BoundedQueue[Message] = BoundedQueue(
+            maxsize=self.config.interrupt_maxsize,
+            overflow=OverflowPolicy.BLOCK,
+            wakeup=self._wakeup,
+        )
 
         # State
         self.conversation_history: list[ModelMessage] = []
+        self.context = ContextWindowManager(self.config.context)
+        # Background summary of the leading messages in _summarized, if one is being written
+        self._summary: asyncio.Task[ConversationSummary] | None = None
+        self._summarized: list[ModelMessage] = []
+        # Full output of tool calls too long to return to the model whole
+        self.tool_outputs = ToolOutputStore(self.config.tool_output)
+        # Tokens used by the agent's LLM calls, including prompt cache hits and writes
+        self.usage = RunUsage()
+        # Messages merged into an earlier batch by the coalescing window,
+        # i.e. LLM calls that did not have to be made
+        self.llm_calls_saved: int = 0
+        # Ids of messages in the batch being processed that are fully handled,
+        # so a retry doesn't repeat them (see mark_finished)
+        self._finished: set[str] = set()
+        # The batch being processed, empty while idle
+        self._batch: list[Message] = []
+        # Requests in the batch being processed that have not been answered
+        self._open_requests: list[Message] = []
+        # A batch cancelled by an interrupt, handled again along with it
+        self._preempted: list[Message] = []
+        # Seconds from each interrupt being routed to its handling starting
+        self.interrupt_latencies: list[float] = []
+        # Batches set aside by the supervisor after failing every attempt
+        self.quarantine: list[list[Message]] = []
         self._running: bool = False
+        self._processing: bool = False
         self._task: asyncio.Task | None = None
         self.workspace_dir: Path | None = None
+        # Started on the first command (see AgentConfig.persistent_shell)
+        self.shell: ShellSession | None = None
+        # Set when the agent is a member of an AgentPool, along with its id
+        # there, which tells its events apart from other members'
+        self.pool: AgentPool | None = None
+        self.agent_id: str | None = None
+
+    async def emit(self, event: Event) -> None:
+        """Emit an event to the stream, tagged with agent_id if this agent is a pool member."""
+
+        if self.agent_id is not None and event.agent == self.role:
+            event.agent_id = self.agent_id
+        await self.event_stream.emit(event)
 
     def spawn(self) -> asyncio.Task:
         """Spawns the agent and starts the agent's processing loop as a background task."""
@@ -64,18 +143,26 @@ class BaseAgent(ABC):
 
         self._running = True
 
-        await self.event_stream.emit(
+        await self.emit(
             Event(
                 type=EventType.STEP_STARTED,
                 agent=self.role,
-                data=AgentStatusData(status="Agent started").model_dump(),
+                data=AgentStatusData(status="Agent started"),
             )
         )
 
         await self.run_loop()
 
     async def run_loop(self) -> None:
-        """Main agent processing loop."""
+        """Main agent processing loop.
+
+        Sleeps until a message lands in either queue, then drains the
+        interrupt queue before the inbox. With AgentConfig.preempt_on_interrupt,
+        an interrupt arriving while a batch is processed cancels that batch.
+        A batch that fails is retried or quarantined (see SupervisorPolicy).
+        Conversation history is compacted before each batch once it outgrows
+        the context window (see ContextPolicy).
+        """
 
         try:
             while self._running:
@@ -84,63 +171,406 @@ class BaseAgent(ABC):
 
                     # Prioritize interrupts
                     if not self.interrupt_queue.empty():
-                        messages = await self._flush_queue(self.interrupt_queue)
+                        interrupts = await self._flush_queue(self.interrupt_queue)
+                        messages, self._preempted = self._preempted + interrupts, []
+                        await self._record_interrupt_latency(interrupts)
 
                     elif not self.inbox.empty():
-                        messages = await self._flush_queue(self.inbox)
+                        queued = self.inbox.qsize()
+                        await self._await_coalescing_window()
+
+                        # An interrupt that arrived meanwhile goes first
+                        if not self.interrupt_queue.empty():
+                            continue
+
+                        messages = await self._flush_queue(self.inbox, limit=self.config.coalesce_max_batch)
+                        self.llm_calls_saved += max(0, len(messages) - queued)
 
                     else:
-                        await asyncio.sleep(0.1)
+                        # An idle pool member takes queued work from a busy one
+                        if self.pool is not None and await self.pool.steal(self):
+                            continue
+
+                        # Both queues are empty and nothing can enqueue before
+                        # we await, so clearing here cannot lose a wakeup
+                        self._wakeup.clear()
+                        await self._wakeup.wait()
                         continue
 
                     if messages:
-                        # Log received messages
-                        await self.event_stream.emit(
-                            Event(
-                                type=EventType.TEXT_MESSAGE_CONTENT,
-                                agent=self.role,
-                                data={"message": f"📨 Received {len(messages)} message(s)"},
-                            )
-                        )
-
-                        for i, msg in enumerate(messages, 1):
-                            await self.event_stream.emit(
-                                Event(
-                                    type=EventType.TEXT_MESSAGE_CONTENT,
-                                    agent=self.role,
-                                    data={
-                                        "message": f"  Message {i}: from={msg.source.value}, content='{msg.content}', priority={msg.priority.value}"
-                                    },
-                                )
-                            )
-
-                        await self.process_messages(messages)
+                        self._open_requests = [msg for msg in messages if msg.is_request]
+                        self._finished = set()
+                        self._batch = messages
+                        self._processing = True
+                        try:
+                            preempted = await self._process_supervised(messages)
+                        finally:
+                            self._processing = False
+                            self._batch = []
+
+                        if preempted:
+                            # Messages finished before the interrupt are not handled again
+                            self._preempted = self._unfinished(messages)
+                            continue
+
+                        await self._close_open_requests()
 
                 except Exception as e:
-                    await self.event_stream.emit(
+                    await self.emit(
                         Event(
                             type=EventType.RUN_ERROR,
                             agent=self.role,
-                            data=ErrorData(error=str(e)).model_dump(),
+                            data=ErrorData(error=str(e)),
                         )
                     )
-                    # TODO: Send error notification to EM for coordinated error handling
-                    # instead of just breaking. EM should decide whether to retry,
-                    # escalate, or terminate the session.
+                    # Handling a batch is supervised; anything else means the
+                    # loop itself is broken
                     break
 
         except asyncio.CancelledError:
-            await self.event_stream.emit(
+            await self.emit(
                 Event(
                     type=EventType.STEP_FINISHED,
                     agent=self.role,
-                    data={"status": "Agent cancelled"},
+                    data=AgentStatusData(status="Agent cancelled"),
                 )
             )
             raise
 
         finally:
             self._running = False
+            # stop() only kills the shell; reap it and close its pipes
+            if self.shell is not None:
+                await self.shell.close()
+
+    async def _emit_received(self, messages: list[Message]) -> None:
+        """Log a received batch, and each message unless routing already recorded it."""
+
+        await self.emit(
+            Event(
+                type=EventType.TEXT_MESSAGE_CONTENT,
+                agent=self.role,
+                data=TextMessageData(
+                    message=f"📨 Received {len(messages)} message(s)",
+                    message_ids=[msg.id for msg in messages],
+                ),
+            )
+        )
+
+        # Compact routing already recorded each message; don't repeat the content
+        if self.router.routing_events == RoutingEventMode.COMPACT:
+            return
+
+        for i, msg in enumerate(messages, 1):
+            await self.emit(
+                Event(
+                    type=EventType.TEXT_MESSAGE_CONTENT,
+                    agent=self.role,
+                    data=TextMessageData(
+                        message=f"  Message {i}: from={msg.source.value}, content='{msg.content}', priority={msg.priority.value}"
+                    ),
+                )
+            )
+
+    async def _compact_history(self) -> None:
+        """Keep conversation history within the context window before the next LLM call.
+
+        Swaps in a finished background summary, truncates if the history is
+        still over budget, and starts a new summary once one is due (see
+        ContextPolicy.summarize). Nothing here waits on the summarizer.
+        """
+
+        await self._apply_summary()
+
+        self.conversation_history, stats = self.context.compact(self.conversation_history)
+        if stats is not None:
+            await self.emit(Event(type=EventType.CUSTOM, agent=self.role, data=stats))
+
+        if self._summary is None and (count := self.context.summary_split(self.conversation_history)):
+            self._summarized = self.conversation_history[:count]
+            self._summary = asyncio.create_task(self.context.summarizer.summarize(self._summarized))
+
+    async def _apply_summary(self) -> None:
+        """Replace the summarized messages with their summary, if it is ready."""
+
+        task = self._summary
+        if task is None or not task.done():
+            return
+
+        summarized, self._summary, self._summarized = self._summarized, None, []
+        if task.cancelled():
+            return
+
+        error = task.exception()
+        if error is not None:
+            # Truncation still keeps the history in bounds
+            await self.emit(
+                Event(
+                    type=EventType.RUN_ERROR,
+                    agent=self.role,
+                    data=ErrorData(error=f"Summarizing history failed: {error}", error_type=type(error).__name__),
+                )
+            )
+            return
+
+        # Truncation rewrote the history meanwhile, so the summary no longer lines up
+        current = self.conversation_history[: len(summarized)]
+        if len(current) < len(summarized) or any(a is not b for a, b in zip(current, summarized, strict=True)):
+            return
+
+        self.conversation_history, stats = self.context.apply_summary(
+            self.conversation_history, len(summarized), task.result()
+        )
+        await self.emit(Event(type=EventType.CUSTOM, agent=self.role, data=stats))
+
+    async def _record_usage(self, usage: RunUsage) -> None:
+        """Add an LLM call's usage to the agent's total and report it.
+
+        Call after each ai_agent.run() with result.usage().
+        """
+
+        self.usage += usage
+
+        if self.event_stream.wants(EventType.CUSTOM, self.role):
+            await self.emit(
+                Event(
+                    type=EventType.CUSTOM,
+                    agent=self.role,
+                    data=UsageData(
+                        requests=usage.requests,
+                        input_tokens=usage.input_tokens,
+                        cache_read_tokens=usage.cache_read_tokens,
+                        cache_write_tokens=usage.cache_write_tokens,
+                        output_tokens=usage.output_tokens,
+                    ),
+                )
+            )
+
+    async def _process_supervised(self, messages: list[Message]) -> bool:
+        """Process a batch, retrying with backoff and quarantining it if it keeps failing.
+
+        Everything the agent does for the batch is covered, including logging
+        it and compacting the history first. A retry only covers the messages
+        process_messages() has not marked finished, so work that completed
+        before the failure isn't repeated.
+
+        Returns:
+            True if the batch was cancelled by an interrupt, during processing
+            or while waiting to retry
+        """
+
+        policy = self.config.supervisor
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                # Debug chatter is skipped before any event or string is built
+                if attempt == 1 and self.event_stream.wants(EventType.TEXT_MESSAGE_CONTENT, self.role, debug=True):
+                    await self._emit_received(messages)
+
+                await self._compact_history()
+                return await self._process_preemptibly(messages)
+            except Exception as e:
+                error = e
+
+            messages = self._unfinished(messages)
+            if not messages:
+                return False
+
+            if attempt >= policy.max_attempts:
+                await self._quarantine(messages, error, attempt)
+                return False
+
+            delay = policy.backoff(attempt)
+            await self._emit_supervisor_event("restart", messages, error, attempt, delay=delay)
+            if await self._sleep_unless_interrupted(delay):
+                return True
+
+    def mark_finished(self, message: Message) -> None:
+        """Record that message is fully handled.
+
+        Agents that work through a batch one message at a time call this
+        after each one, so a retry or preemption of the batch only repeats
+        the messages that are left.
+        """
+
+        self._finished.add(message.id)
+
+    def _unfinished(self, messages: list[Message]) -> list[Message]:
+        return [msg for msg in messages if msg.id not in self._finished]
+
+    async def _sleep_unless_interrupted(self, delay: float) -> bool:
+        """Sleep for delay seconds, returning True early if an interrupt arrives."""
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + delay
+
+        while True:
+            self._wakeup.clear()
+            if not self.interrupt_queue.empty():
+                return True
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return False
+
+    async def _quarantine(self, messages: list[Message], error: Exception, attempts: int) -> None:
+        """Set a batch aside after its last failed attempt and tell whoever is waiting."""
+
+        self.quarantine.append(messages)
+        await self._emit_supervisor_event("quarantine", messages, error, attempts)
+        await self.emit(
+            Event(
+                type=EventType.RUN_ERROR,
+                agent=self.role,
+                data=ErrorData(error=str(error), error_type=type(error).__name__),
+            )
+        )
+
+        failure = f"{self.role.value} failed after {attempts} attempt(s): {type(error).__name__}: {error}"
+
+        # Requesters get the failure as their reply
+        requests, self._open_requests = self._open_requests, []
+        for request in requests:
+            await self.router.reply(request, self.role, failure)
+
+        # Anyone else relies on the EM to decide whether to retry, reassign or give up
+        answered_em = any(request.source == AgentRole.EM for request in requests)
+        if (
+            self.config.supervisor.escalate
+            and self.role != AgentRole.EM
+            and not answered_em
+            and self.router.has_agent(AgentRole.EM)
+        ):
+            contents = "\n".join(f"- [{msg.source.value}]: {msg.content}" for msg in messages)
+            await self.router.send(self.role, AgentRole.EM, f"{failure}\nUnprocessed messages:\n{contents}")
+            await self._emit_supervisor_event("escalate", messages, error, attempts)
+
+    async def _emit_supervisor_event(
+        self,
+        action: str,
+        messages: list[Message],
+        error: Exception,
+        attempt: int,
+        delay: float | None = None,
+    ) -> None:
+        await self.emit(
+            Event(
+                type=EventType.CUSTOM,
+                agent=self.role,
+                data=SupervisorData(
+                    action=action,
+                    attempt=attempt,
+                    error=str(error),
+                    error_type=type(error).__name__,
+                    message_ids=[msg.id for msg in messages],
+                    delay=delay,
+                ),
+            )
+        )
+
+    async def _process_preemptibly(self, messages: list[Message]) -> bool:
+        """Run process_messages(), cancelling it if an interrupt arrives first.
+
+        Cancellation reaches whatever the batch is awaiting: the LLM call, a
+        delegated request or a shell command, which is killed. Conversation
+        history is only extended by a completed run, and messages whose run
+        completed are marked finished (see mark_finished), so only the rest
+        of the batch is handled again.
+
+        Returns:
+            True if the batch was cancelled by an interrupt
+        """
+
+        if not self.config.preempt_on_interrupt:
+            await self.process_messages(messages)
+            return False
+
+        work = asyncio.create_task(self.process_messages(messages))
+        try:
+            while True:
+                # Clear before checking so an interrupt landing after the check still wakes us
+                self._wakeup.clear()
+                if not self.interrupt_queue.empty():
+                    break
+
+                waiter = asyncio.create_task(self._wakeup.wait())
+                try:
+                    await asyncio.wait({work, waiter}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    waiter.cancel()
+
+                if work.done():
+                    work.result()  # Re-raise what process_messages raised
+                    return False
+
+        finally:
+            if not work.done():
+                work.cancel()
+                await asyncio.gather(work, return_exceptions=True)
+
+        await self.emit(
+            Event(
+                type=EventType.STEP_FINISHED,
+                agent=self.role,
+                data=AgentStatusData(status="Interrupted", message_count=len(messages)),
+            )
+        )
+        return True
+
+    async def _record_interrupt_latency(self, interrupts: list[Message]) -> None:
+        """Record and report how long the oldest interrupt waited to be handled.
+
+        Measured on the monotonic clock, from routing (Message.routed_ns) to
+        now; interrupts put on the queue without routing are not measured.
+        """
+
+        handled_ns = time.monotonic_ns()
+        routed = [msg.routed_ns for msg in interrupts if msg.routed_ns is not None]
+        latency = (handled_ns - min(routed)) / 1e9 if routed else None
+        if latency is not None:
+            self.interrupt_latencies.append(latency)
+
+        await self.emit(
+            Event(
+                type=EventType.STEP_STARTED,
+                agent=self.role,
+                data=AgentStatusData(
+                    status="Handling interrupt",
+                    message_count=len(interrupts),
+                    latency_ms=1000.0 * latency if latency is not None else None,
+                ),
+            )
+        )
+
+    @property
+    def busy(self) -> bool:
+        """Whether process_messages() is running."""
+
+        return self._processing
+
+    @property
+    def batch(self) -> list[Message]:
+        """The messages being processed, empty while idle."""
+
+        return self._batch
+
+    @property
+    def load(self) -> int:
+        """Queued messages plus the batch in progress, if any."""
+
+        return self.inbox.qsize() + self.interrupt_queue.qsize() + self._processing
+
+    def wake(self) -> None:
+        """Wake the run loop to re-check for work, e.g. to steal from its pool."""
+
+        self._wakeup.set()
 
     @abstractmethod
     async def process_messages(self, messages: list[Message]) -> None:
@@ -156,6 +586,31 @@ class BaseAgent(ABC):
 
         await self.router.send(self.role, target, content)
 
+    async def respond(self, target: AgentRole, content: str) -> None:
+        """Answer target's open request if there is one, else send a plain message.
+
+        Use this rather than talk_to for results, so an agent waiting on
+        MessageRouter.request() gets them as its reply.
+        """
+
+        for request in self._open_requests:
+            if request.source == target:
+                self._open_requests.remove(request)
+                await self.router.reply(request, self.role, content)
+                return
+
+        await self.router.send(self.role, target, content)
+
+    async def _close_open_requests(self) -> None:
+        """Reply to requests process_messages() left unanswered.
+
+        The requester would otherwise wait out its full timeout.
+        """
+
+        requests, self._open_requests = self._open_requests, []
+        for request in requests:
+            await self.router.reply(request, self.role, f"{self.role.value} finished without sending a reply")
+
     async def drop_in_inbox(
         self,
         source: AgentRole | HumanRole,
@@ -169,6 +624,31 @@ class BaseAgent(ABC):
             content=content,
         )
 
+    async def run_command(self, command: str, timeout: float) -> tuple[bytes, bytes, int | None]:
+        """Run a shell command in the workspace.
+
+        Each command gets a fresh shell unless AgentConfig.persistent_shell is
+        on, in which case the agent's shell session is reused and a cd or
+        export in one command still applies in the next.
+
+        Returns:
+            (stdout, stderr, exit code)
+
+        Raises:
+            asyncio.TimeoutError: If the command did not finish within timeout
+        """
+
+        workspace_dir = self._ensure_workspace()
+        if not self.config.persistent_shell:
+            return await run_shell(command, cwd=workspace_dir, timeout=timeout)
+
+        if self.shell is None or self.shell.cwd != workspace_dir:
+            if self.shell is not None:
+                await self.shell.close()
+            self.shell = ShellSession(workspace_dir)
+
+        return await self.shell.run(command, timeout=timeout)
+
     def _ensure_workspace(self) -> Path:
         """Ensure workspace_dir is set."""
 
@@ -176,11 +656,38 @@ class BaseAgent(ABC):
             raise RuntimeError(f"workspace_dir not set on {self.role.value} agent")
         return self.workspace_dir
 
-    async def _flush_queue(self, queue: asyncio.Queue[Message]) -> list[Message]:
-        """Flush all messages from a queue."""
+    async def _await_coalescing_window(self) -> None:
+        """Wait for more inbox messages while a burst is still arriving.
+
+        Returns after coalesce_min_wait passes without a new message, after
+        coalesce_max_wait in total, once coalesce_max_batch messages are
+        queued, or as soon as an interrupt arrives.
+        """
+
+        min_wait = self.config.coalesce_min_wait
+        max_batch = self.config.coalesce_max_batch
+        if min_wait <= 0:
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.coalesce_max_wait
+
+        while self.interrupt_queue.empty() and not (max_batch and self.inbox.qsize() >= max_batch):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=min(min_wait, remaining))
+            except asyncio.TimeoutError:
+                return  # Quiet for min_wait, the burst is over
+
+    async def _flush_queue(self, queue: asyncio.Queue[Message], limit: int = 0) -> list[Message]:
+        """Flush messages from a queue, at most limit of them if limit is set."""
 
         messages = []
-        while not queue.empty():
+        while not queue.empty() and not (limit and len(messages) >= limit):
             messages.append(await queue.get())
 
         return messages
@@ -192,3 +699,11 @@ class BaseAgent(ABC):
 
         if self._task is not None and not self._task.done():
             self._task.cancel()
+
+        if self._summary is not None:
+            self._summary.cancel()
+
+        if self.shell is not None:
+            self.shell.kill()
+
+        self.tool_outputs.close()
@@ -3,11 +3,20 @@ import asyncio
 from pydantic_ai import Agent, RunContext
 
 from agile_ai_sdk.agents.base import BaseAgent
+from agile_ai_sdk.core.config import AgentConfig
 from agile_ai_sdk.core.deps import AgentDeps
 from agile_ai_sdk.core.events import EventStream
 from agile_ai_sdk.core.router import MessageRouter
 from agile_ai_sdk.llm import default
-from agile_ai_sdk.models import AgentRole, Event, EventType, Message
+from agile_ai_sdk.models import (
+    AgentRole,
+    AgentStatusData,
+    Event,
+    EventType,
+    Message,
+    RunFinishedData,
+    TextMessageData,
+)
 
 
 class CodeActAgent(BaseAgent):
@@ -18,11 +27,12 @@ class CodeActAgent(BaseAgent):
     to accomplish goals but doesn't communicate with other agents.
     """
 
-    def __init__(self, router: MessageRouter, event_stream: EventStream):
-        super().__init__(AgentRole.CODE_ACT, router, event_stream)
+    def __init__(self, router: MessageRouter, event_stream: EventStream, config: AgentConfig | None = None):
+        super().__init__(AgentRole.CODE_ACT, router, event_stream, config)
 
         self.ai_agent = Agent(
             default.get_model(),
+            model_settings=default.get_model_settings(prompt_cache=self.config.prompt_cache),
             deps_type=AgentDeps,
             system_prompt=(
                 "You are an AI coding assistant that can execute bash commands.\n\n"
@@ -34,7 +44,8 @@ class CodeActAgent(BaseAgent):
                 "IMPORTANT: After completing the task, you MUST provide a final "
                 "text output summarizing your work. Be concise but thorough.\n\n"
                 "Available tools:\n"
-                "- run_bash: Execute shell commands (ls, cat, git, pytest, etc.)\n\n"
+                "- run_bash: Execute shell commands (ls, cat, git, pytest, etc.)\n"
+                "- read_output: Page through command output that run_bash cut short\n\n"
                 "Example workflow:\n"
                 "Task: 'List files and create a README'\n"
                 "1. run_bash('ls -la') to see current files\n"
@@ -61,88 +72,101 @@ class CodeActAgent(BaseAgent):
                 >>> run_bash("cat main.py")
                 >>> run_bash("pytest -v")
             """
-            await ctx.deps.event_stream.emit(
-                Event(
-                    type=EventType.STEP_STARTED,
-                    agent=AgentRole.CODE_ACT,
-                    data={"status": f"Executing: {command}"},
+            if ctx.deps.event_stream.wants(EventType.STEP_STARTED, AgentRole.CODE_ACT, debug=True):
+                await self.emit(
+                    Event(
+                        type=EventType.STEP_STARTED,
+                        agent=AgentRole.CODE_ACT,
+                        data=AgentStatusData(status=f"Executing: {command}"),
+                    )
                 )
-            )
 
             try:
-                process = await asyncio.create_subprocess_shell(
-                    command,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    cwd=str(ctx.deps.workspace_dir),
-                )
-
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=30.0,
-                )
+                stdout, stderr, exit_code = await self.run_command(command, timeout=30.0)
 
                 output = []
+                # Long output is cut to its head and tail, the rest readable with read_output
                 if stdout:
-                    decoded_stdout = stdout.decode()
+                    decoded_stdout = self.tool_outputs.cap(stdout.decode(errors="replace"))
                     output.append(f"STDOUT:\n{decoded_stdout}")
                 if stderr:
-                    decoded_stderr = stderr.decode()
+                    decoded_stderr = self.tool_outputs.cap(stderr.decode(errors="replace"))
                     output.append(f"STDERR:\n{decoded_stderr}")
 
-                exit_code = process.returncode
                 output.append(f"Exit code: {exit_code}")
 
                 result = "\n".join(output)
 
                 # Emit command result
-                await ctx.deps.event_stream.emit(
-                    Event(
-                        type=EventType.TEXT_MESSAGE_CONTENT,
-                        agent=AgentRole.CODE_ACT,
-                        data={"message": f"Command completed: {command[:50]}..."},
+                if ctx.deps.event_stream.wants(EventType.TEXT_MESSAGE_CONTENT, AgentRole.CODE_ACT, debug=True):
+                    await self.emit(
+                        Event(
+                            type=EventType.TEXT_MESSAGE_CONTENT,
+                            agent=AgentRole.CODE_ACT,
+                            data=TextMessageData(message=f"Command completed: {command[:50]}..."),
+                        )
                     )
-                )
 
                 return result
 
             except asyncio.TimeoutError:
                 error_msg = "Error: Command timed out after 30 seconds"
-                await ctx.deps.event_stream.emit(
+                await self.emit(
                     Event(
                         type=EventType.TEXT_MESSAGE_CONTENT,
                         agent=AgentRole.CODE_ACT,
-                        data={"message": error_msg},
+                        data=TextMessageData(message=error_msg),
                     )
                 )
                 return error_msg
 
             except Exception as e:
                 error_msg = f"Error executing command: {str(e)}"
-                await ctx.deps.event_stream.emit(
+                await self.emit(
                     Event(
                         type=EventType.TEXT_MESSAGE_CONTENT,
                         agent=AgentRole.CODE_ACT,
-                        data={"message": error_msg},
+                        data=TextMessageData(message=error_msg),
                     )
                 )
                 return error_msg
 
+        # Register read_output tool
+        @self.ai_agent.tool
+        async def read_output(
+            ctx: RunContext[AgentDeps], output_id: str, start_line: int = 1, num_lines: int | None = None
+        ) -> str:
+            """Read part of a command output that run_bash cut short.
+
+            Args:
+                output_id: The id run_bash gave for the full output
+                start_line: First line to read (1-based)
+                num_lines: How many lines to read (defaults to a page)
+
+            Example:
+                >>> read_output("1f3a9c2e", start_line=101)
+            """
+            try:
+                return self.tool_outputs.read(output_id, start_line, num_lines)
+            except (ValueError, OSError) as e:
+                return f"Error reading output: {str(e)}"
+
     async def process_messages(self, messages: list[Message]) -> None:
         """Process received messages by running AI agent.
 
         Unlike multi-agent roles that delegate work, CodeActAgent processes
-        the entire task itself. After processing, it stops automatically.
+        the entire task itself.
         """
 
         for message in messages:
-            await self.event_stream.emit(
-                Event(
-                    type=EventType.STEP_STARTED,
-                    agent=self.role,
-                    data={"status": "Processing task"},
+            if self.event_stream.wants(EventType.STEP_STARTED, self.role):
+                await self.emit(
+                    Event(
+                        type=EventType.STEP_STARTED,
+                        agent=self.role,
+                        data=AgentStatusData(status="Processing task"),
+                    )
                 )
-            )
 
             deps = AgentDeps(
                 workspace_dir=self._ensure_workspace(),
@@ -150,51 +174,41 @@ class CodeActAgent(BaseAgent):
                 event_stream=self.event_stream,
             )
 
-            try:
-                # TODO: we should call `step` instead to get each event on each step
-                result = await self.ai_agent.run(
-                    message.content,
-                    deps=deps,
-                    message_history=self.conversation_history,
-                )
+            # Failures propagate to the run loop, whose supervisor retries the
+            # messages not yet marked finished
+            # TODO: we should call `step` instead to get each event on each step
+            result = await self.ai_agent.run(
+                message.content,
+                deps=deps,
+                message_history=self.conversation_history,
+            )
 
-                self.conversation_history = result.all_messages()
+            self.conversation_history.extend(result.new_messages())
+            # The run's result is in the history; don't run this message again
+            self.mark_finished(message)
+            await self._record_usage(result.usage())
 
-                if result.output:
-                    await self.event_stream.emit(
-                        Event(
-                            type=EventType.TEXT_MESSAGE_CONTENT,
-                            agent=self.role,
-                            data={"message": result.output},
-                        )
-                    )
-
-                await self.event_stream.emit(
+            if result.output:
+                await self.emit(
                     Event(
-                        type=EventType.STEP_FINISHED,
+                        type=EventType.TEXT_MESSAGE_CONTENT,
                         agent=self.role,
-                        data={"status": "Task completed"},
+                        data=TextMessageData(message=result.output),
                     )
                 )
 
-                await self.event_stream.emit(
-                    Event(
-                        type=EventType.RUN_FINISHED,
-                        agent=self.role,
-                        data={"status": "completed", "output": result.output},
-                    )
+            await self.emit(
+                Event(
+                    type=EventType.STEP_FINISHED,
+                    agent=self.role,
+                    data=AgentStatusData(status="Task completed"),
                 )
+            )
 
-            except Exception as e:
-                await self.event_stream.emit(
-                    Event(
-                        type=EventType.RUN_ERROR,
-                        agent=self.role,
-                        data={"error": str(e), "error_type": type(e).__name__},
-                    )
+            await self.emit(
+                Event(
+                    type=EventType.RUN_FINISHED,
+                    agent=self.role,
+                    data=RunFinishedData(status="completed", output=result.output),
                 )
-                # TODO: Send error notification to EM for coordinated error handling
-                # instead of just stopping. EM should decide whether to retry,
-                # reassign the task, or terminate the session.
-                # For now, stop on error - errors are fatal for the session
-                self.stop()
+            )
@@ -3,11 +3,12 @@ import asyncio
 from pydantic_ai import Agent, RunContext
 
 from agile_ai_sdk.agents.base import BaseAgent
+from agile_ai_sdk.core.config import AgentConfig
 from agile_ai_sdk.core.deps import AgentDeps
 from agile_ai_sdk.core.events import EventStream
 from agile_ai_sdk.core.router import MessageRouter
 from agile_ai_sdk.llm import default
-from agile_ai_sdk.models import AgentRole, Event, EventType, Message
+from agile_ai_sdk.models import AgentRole, AgentStatusData, Event, EventType, Message, TextMessageData
 
 
 class Developer(BaseAgent):
@@ -18,11 +19,12 @@ class Developer(BaseAgent):
         >>> await dev.start()
     """
 
-    def __init__(self, router: MessageRouter, event_stream: EventStream):
-        super().__init__(AgentRole.DEV, router, event_stream)
+    def __init__(self, router: MessageRouter, event_stream: EventStream, config: AgentConfig | None = None):
+        super().__init__(AgentRole.DEV, router, event_stream, config)
 
         self.ai_agent = Agent(
             default.get_model(),
+            model_settings=default.get_model_settings(prompt_cache=self.config.prompt_cache),
             deps_type=AgentDeps,
             system_prompt=(
                 "You are a Senior Software Developer implementing code changes.\n\n"
@@ -40,6 +42,7 @@ class Developer(BaseAgent):
                 "→ You respond: 'Done.'\n\n"
                 "Available tools:\n"
                 "- run_bash: Execute shell commands (ls, cat, git, etc.)\n"
+                "- read_output: Page through command output that run_bash cut short\n"
                 "- respond_back: Send results back to the EM"
             ),
         )
@@ -56,34 +59,25 @@ class Developer(BaseAgent):
                 >>> run_bash("git status")
                 >>> run_bash("cat src/main.py")
             """
-            await ctx.deps.event_stream.emit(
-                Event(
-                    type=EventType.STEP_STARTED,
-                    agent=self.role,
-                    data={"status": f"Executing: {command}"},
+            if ctx.deps.event_stream.wants(EventType.STEP_STARTED, self.role, debug=True):
+                await self.emit(
+                    Event(
+                        type=EventType.STEP_STARTED,
+                        agent=self.role,
+                        data=AgentStatusData(status=f"Executing: {command}"),
+                    )
                 )
-            )
 
             try:
-                process = await asyncio.create_subprocess_shell(
-                    command,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    cwd=str(self._ensure_workspace()),
-                )
-
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=30.0,
-                )
+                stdout, stderr, exit_code = await self.run_command(command, timeout=30.0)
 
                 output = []
+                # Long output is cut to its head and tail, the rest readable with read_output
                 if stdout:
-                    output.append(f"STDOUT:\n{stdout.decode()}")
+                    output.append(f"STDOUT:\n{self.tool_outputs.cap(stdout.decode(errors='replace'))}")
                 if stderr:
-                    output.append(f"STDERR:\n{stderr.decode()}")
+                    output.append(f"STDERR:\n{self.tool_outputs.cap(stderr.decode(errors='replace'))}")
 
-                exit_code = process.returncode
                 output.append(f"Exit code: {exit_code}")
 
                 return "\n".join(output)
@@ -93,6 +87,25 @@ class Developer(BaseAgent):
             except Exception as e:
                 return f"Error executing command: {str(e)}"
 
+        @self.ai_agent.tool
+        async def read_output(
+            ctx: RunContext[AgentDeps], output_id: str, start_line: int = 1, num_lines: int | None = None
+        ) -> str:
+            """Read part of a command output that run_bash cut short.
+
+            Args:
+                output_id: The id run_bash gave for the full output
+                start_line: First line to read (1-based)
+                num_lines: How many lines to read (defaults to a page)
+
+            Example:
+                >>> read_output("1f3a9c2e", start_line=101)
+            """
+            try:
+                return self.tool_outputs.read(output_id, start_line, num_lines)
+            except (ValueError, OSError) as e:
+                return f"Error reading output: {str(e)}"
+
         @self.ai_agent.tool
         async def respond_back(ctx: RunContext[AgentDeps], message: str) -> str:
             """Send a response back to the Engineering Manager.
@@ -100,7 +113,7 @@ class Developer(BaseAgent):
             Args:
                 message: The response message describing what was done
             """
-            await ctx.deps.router.send(self.role, AgentRole.EM, message)
+            await self.respond(AgentRole.EM, message)
             return "Response sent to EM."
 
     async def process_messages(self, messages: list[Message]) -> None:
@@ -110,25 +123,27 @@ class Developer(BaseAgent):
             >>> messages = [Message(source=AgentRole.EM, target=AgentRole.DEV, content="Implement /health")]
             >>> await dev.process_messages(messages)
         """
-        await self.event_stream.emit(
-            Event(
-                type=EventType.STEP_STARTED,
-                agent=self.role,
-                data={"status": "Processing messages", "message_count": len(messages)},
+        if self.event_stream.wants(EventType.STEP_STARTED, self.role):
+            await self.emit(
+                Event(
+                    type=EventType.STEP_STARTED,
+                    agent=self.role,
+                    data=AgentStatusData(status="Processing messages", message_count=len(messages)),
+                )
             )
-        )
 
         task = "\n".join([f"[{msg.source.value}]: {msg.content}" for msg in messages])
 
         deps = AgentDeps(router=self.router, event_stream=self.event_stream, workspace_dir=self._ensure_workspace())
         result = await self.ai_agent.run(task, message_history=self.conversation_history, deps=deps)
         self.conversation_history.extend(result.new_messages())
+        await self._record_usage(result.usage())
 
         if result.output:
-            await self.event_stream.emit(
+            await self.emit(
                 Event(
                     type=EventType.TEXT_MESSAGE_CONTENT,
                     agent=self.role,
-                    data={"message": result.output},
+                    data=TextMessageData(message=result.output),
                 )
             )
@@ -1,11 +1,28 @@
+import asyncio
+
 from pydantic_ai import Agent, RunContext
 
 from agile_ai_sdk.agents.base import BaseAgent
+from agile_ai_sdk.core.config import AgentConfig
 from agile_ai_sdk.core.deps import AgentDeps
 from agile_ai_sdk.core.events import EventStream
 from agile_ai_sdk.core.router import MessageRouter
 from agile_ai_sdk.llm import default
-from agile_ai_sdk.models import AgentRole, Event, EventType, Message
+from agile_ai_sdk.models import (
+    AgentRole,
+    AgentStatusData,
+    Event,
+    EventType,
+    Message,
+    RunFinishedData,
+    TextMessageData,
+)
+
+AGENT_ROLES = {
+    "planner": AgentRole.PLANNER,
+    "developer": AgentRole.DEV,
+    "senior_reviewer": AgentRole.SENIOR_REVIEWER,
+}
 
 
 class EngineeringManager(BaseAgent):
@@ -16,11 +33,12 @@ class EngineeringManager(BaseAgent):
         >>> await em.start(initial_message="Add /health endpoint")
     """
 
-    def __init__(self, router: MessageRouter, event_stream: EventStream):
-        super().__init__(AgentRole.EM, router, event_stream)
+    def __init__(self, router: MessageRouter, event_stream: EventStream, config: AgentConfig | None = None):
+        super().__init__(AgentRole.EM, router, event_stream, config)
 
         self.ai_agent = Agent(
             default.get_model(),
+            model_settings=default.get_model_settings(prompt_cache=self.config.prompt_cache),
             deps_type=AgentDeps,
             system_prompt=(
                 "You are an Engineering Manager coordinating a software development team.\n\n"
@@ -30,11 +48,16 @@ class EngineeringManager(BaseAgent):
                 "- After calling complete_task, respond with a brief confirmation (1-3 words)\n"
                 "- For simple greetings or questions, respond directly using respond_to_user\n\n"
                 "Workflow for tasks:\n"
-                "1. For coding tasks: delegate to 'developer' using talk_to\n"
-                "2. After delegation, respond with 'Delegated.'\n"
-                "3. When developer responds: use respond_to_user with summary\n"
-                "4. IMMEDIATELY call complete_task\n"
-                "5. Respond with brief confirmation\n\n"
+                "1. For coding tasks: delegate to 'developer' using ask, which returns their reply\n"
+                "2. Use respond_to_user with a summary of the reply\n"
+                "3. IMMEDIATELY call complete_task\n"
+                "4. Respond with brief confirmation\n"
+                "If ask reports no reply in time, respond with 'Delegated.' and finish the\n"
+                "task when the reply arrives as a new message.\n"
+                "When several agents can work independently (e.g. planner drafts a plan while\n"
+                "developer inspects the code), use ask_all to delegate to them in parallel. It takes\n"
+                "(agent, task) pairs, so one agent can get several tasks, and returns the replies\n"
+                "numbered in the same order.\n\n"
                 "Workflow for greetings/simple messages:\n"
                 "1. Use respond_to_user to greet or answer\n"
                 "2. IMMEDIATELY call complete_task\n"
@@ -46,14 +69,15 @@ class EngineeringManager(BaseAgent):
                 "→ You respond: 'Done.'\n\n"
                 "Example - task:\n"
                 "User asks: 'List files in src/'\n"
-                "→ You call: talk_to('developer', 'List files in src/')\n"
-                "→ You respond: 'Delegated.'\n"
-                "→ [Later] Developer responds with file listing\n"
+                "→ You call: ask('developer', 'List files in src/')\n"
+                "→ ask returns the developer's file listing\n"
                 "→ You call: respond_to_user('Here are the files: ...')\n"
                 "→ You call: complete_task('Listed files successfully')\n"
                 "→ You respond: 'Complete.'\n\n"
                 "Available tools:\n"
-                "- talk_to: Delegate to another agent (developer, planner, senior_reviewer)\n"
+                "- ask: Delegate to another agent (developer, planner, senior_reviewer) and wait for the reply\n"
+                "- ask_all: Delegate several (agent, task) pairs at once and wait for all replies\n"
+                "- talk_to: Send a message to another agent without waiting for a reply\n"
                 "- respond_to_user: Send a message to the user (USE THIS FOR ALL USER COMMUNICATION)\n"
                 "- complete_task: Mark task complete (REQUIRED after every respond_to_user)"
             ),
@@ -67,20 +91,64 @@ class EngineeringManager(BaseAgent):
                 agent: Agent role (planner, developer, senior_reviewer)
                 message: The message/task to send
             """
-            agent_role_map = {
-                "planner": AgentRole.PLANNER,
-                "developer": AgentRole.DEV,
-                "senior_reviewer": AgentRole.SENIOR_REVIEWER,
-            }
-
-            if agent not in agent_role_map:
+            if agent not in AGENT_ROLES:
                 return f"Error: Unknown agent '{agent}'. Available: planner, developer, senior_reviewer"
 
-            target_role = agent_role_map[agent]
+            target_role = AGENT_ROLES[agent]
             await ctx.deps.router.send(self.role, target_role, message)
 
             return f"Message sent to {agent}. They will respond when ready."
 
+        @self.ai_agent.tool
+        async def ask(ctx: RunContext[AgentDeps], agent: str, message: str) -> str:
+            """Delegate a task to another agent and wait for their reply.
+
+            Args:
+                agent: Agent role (planner, developer, senior_reviewer)
+                message: The message/task to send
+            """
+            if agent not in AGENT_ROLES:
+                return f"Error: Unknown agent '{agent}'. Available: planner, developer, senior_reviewer"
+
+            timeout = self.config.request_timeout
+            try:
+                reply = await ctx.deps.router.request(self.role, AGENT_ROLES[agent], message, timeout=timeout)
+            except asyncio.TimeoutError:
+                return f"No reply from {agent} after {timeout:.0f}s. Their reply will arrive as a new message."
+            except RuntimeError as e:
+                return f"Error: {e}"
+
+            return f"Reply from {agent}:\n{reply.content}"
+
+        @self.ai_agent.tool
+        async def ask_all(ctx: RunContext[AgentDeps], tasks: list[tuple[str, str]]) -> str:
+            """Delegate tasks in parallel and wait for all replies.
+
+            Args:
+                tasks: (agent, message/task) pairs, agent being planner, developer or
+                    senior_reviewer. An agent may get several tasks.
+            """
+            unknown = [agent for agent, _ in tasks if agent not in AGENT_ROLES]
+            if unknown:
+                return f"Error: Unknown agent(s) {unknown}. Available: planner, developer, senior_reviewer"
+
+            timeout = self.config.request_timeout
+            replies = await ctx.deps.router.request_all(
+                self.role,
+                [(AGENT_ROLES[agent], message) for agent, message in tasks],
+                timeout=timeout,
+            )
+
+            # One section per task, in the order given
+            sections = []
+            for i, ((agent, _), reply) in enumerate(zip(tasks, replies, strict=True), 1):
+                if reply is None:
+                    sections.append(f"[{i}] No reply from {agent}. Their reply will arrive as a new message.")
+                else:
+                    sections.append(f"[{i}] Reply from {agent}:\n{reply.content}")
+
+            return "\n\n".join(sections)
+
         @self.ai_agent.tool
         async def respond_to_user(ctx: RunContext[AgentDeps], message: str) -> str:
             """Send a response back to the user.
@@ -88,11 +156,11 @@ class EngineeringManager(BaseAgent):
             Args:
                 message: The response to send to the user
             """
-            await ctx.deps.event_stream.emit(
+            await self.emit(
                 Event(
                     type=EventType.TEXT_MESSAGE_CONTENT,
                     agent=self.role,
-                    data={"message": message},
+                    data=TextMessageData(message=message),
                 )
             )
 
@@ -111,11 +179,11 @@ class EngineeringManager(BaseAgent):
             Args:
                 summary: Brief summary of what was accomplished
             """
-            await ctx.deps.event_stream.emit(
+            await self.emit(
                 Event(
                     type=EventType.RUN_FINISHED,
                     agent=self.role,
-                    data={"status": summary},
+                    data=RunFinishedData(status=summary),
                 )
             )
 
@@ -128,30 +196,20 @@ class EngineeringManager(BaseAgent):
             >>> messages = [Message(source=HumanRole.USER, target=AgentRole.EM, content="Add /health")]
             >>> await em.process_messages(messages)
         """
-        await self.event_stream.emit(
-            Event(
-                type=EventType.STEP_STARTED,
-                agent=self.role,
-                data={"status": "Processing messages", "message_count": len(messages)},
+        if self.event_stream.wants(EventType.STEP_STARTED, self.role):
+            await self.emit(
+                Event(
+                    type=EventType.STEP_STARTED,
+                    agent=self.role,
+                    data=AgentStatusData(status="Processing messages", message_count=len(messages)),
+                )
             )
-        )
 
         user_prompt = "\n".join([f"[{msg.source.value}]: {msg.content}" for msg in messages])
 
         deps = AgentDeps(router=self.router, event_stream=self.event_stream, workspace_dir=self._ensure_workspace())
 
-        try:
-            result = await self.ai_agent.run(user_prompt, message_history=self.conversation_history, deps=deps)
-            self.conversation_history.extend(result.new_messages())
-        except Exception as e:
-            await self.event_stream.emit(
-                Event(
-                    type=EventType.RUN_ERROR,
-                    agent=self.role,
-                    data={"error": str(e)},
-                )
-            )
-            # TODO: Implement error recovery logic here
-            # Options: retry task, reassign to different agent, request human help
-            # For now, stop on error - errors are fatal for the session
-            self.stop()
+        # Failures propagate to the run loop, whose supervisor retries or escalates
+        result = await self.ai_agent.run(user_prompt, message_history=self.conversation_history, deps=deps)
+        self.conversation_history.extend(result.new_messages())
+        await self._record_usage(result.usage())
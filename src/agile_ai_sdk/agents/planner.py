@@ -3,11 +3,12 @@ from pathlib import Path
 from pydantic_ai import Agent, RunContext
 
 from agile_ai_sdk.agents.base import BaseAgent
+from agile_ai_sdk.core.config import AgentConfig
 from agile_ai_sdk.core.deps import AgentDeps
 from agile_ai_sdk.core.events import EventStream
 from agile_ai_sdk.core.router import MessageRouter
 from agile_ai_sdk.llm import default
-from agile_ai_sdk.models import AgentRole, Event, EventType, Message
+from agile_ai_sdk.models import AgentRole, AgentStatusData, Event, EventType, Message, TextMessageData
 
 
 class Planner(BaseAgent):
@@ -18,11 +19,12 @@ class Planner(BaseAgent):
         >>> await planner.start()
     """
 
-    def __init__(self, router: MessageRouter, event_stream: EventStream):
-        super().__init__(AgentRole.PLANNER, router, event_stream)
+    def __init__(self, router: MessageRouter, event_stream: EventStream, config: AgentConfig | None = None):
+        super().__init__(AgentRole.PLANNER, router, event_stream, config)
 
         self.ai_agent = Agent(
             default.get_model(),
+            model_settings=default.get_model_settings(prompt_cache=self.config.prompt_cache),
             deps_type=AgentDeps,
             system_prompt=(
                 "You are a Technical Planner who creates detailed implementation plans.\n\n"
@@ -54,31 +56,33 @@ class Planner(BaseAgent):
             Args:
                 plan: The detailed implementation plan
             """
-            await ctx.deps.router.send(self.role, AgentRole.EM, plan)
+            await self.respond(AgentRole.EM, plan)
 
             return "Plan sent to Engineering Manager."
 
     async def process_messages(self, messages: list[Message]) -> None:
         """Process incoming messages using Pydantic AI agent."""
 
-        await self.event_stream.emit(
-            Event(
-                type=EventType.STEP_STARTED,
-                agent=self.role,
-                data={"status": "Creating implementation plan", "message_count": len(messages)},
+        if self.event_stream.wants(EventType.STEP_STARTED, self.role):
+            await self.emit(
+                Event(
+                    type=EventType.STEP_STARTED,
+                    agent=self.role,
+                    data=AgentStatusData(status="Creating implementation plan", message_count=len(messages)),
+                )
             )
-        )
 
         user_prompt = "\n".join([f"[{msg.source.value}]: {msg.content}" for msg in messages])
 
         deps = AgentDeps(router=self.router, event_stream=self.event_stream, workspace_dir=self._ensure_workspace())
         result = await self.ai_agent.run(user_prompt, message_history=self.conversation_history, deps=deps)
         self.conversation_history.extend(result.new_messages())
+        await self._record_usage(result.usage())
 
-        await self.event_stream.emit(
+        await self.emit(
             Event(
                 type=EventType.TEXT_MESSAGE_CONTENT,
                 agent=self.role,
-                data={"message": result.output},
+                data=TextMessageData(message=result.output),
             )
         )
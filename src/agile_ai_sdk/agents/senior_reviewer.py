@@ -1,7 +1,8 @@
 from agile_ai_sdk.agents.base import BaseAgent
+from agile_ai_sdk.core.config import AgentConfig
 from agile_ai_sdk.core.events import EventStream
 from agile_ai_sdk.core.router import MessageRouter
-from agile_ai_sdk.models import AgentRole, Event, EventType, Message
+from agile_ai_sdk.models import AgentRole, AgentStatusData, Event, EventType, Message, TextMessageData
 
 
 class SeniorReviewer(BaseAgent):
@@ -12,8 +13,8 @@ class SeniorReviewer(BaseAgent):
         >>> await reviewer.start()
     """
 
-    def __init__(self, router: MessageRouter, event_stream: EventStream):
-        super().__init__(AgentRole.SENIOR_REVIEWER, router, event_stream)
+    def __init__(self, router: MessageRouter, event_stream: EventStream, config: AgentConfig | None = None):
+        super().__init__(AgentRole.SENIOR_REVIEWER, router, event_stream, config)
 
     async def process_messages(self, messages: list[Message]) -> None:
         """Process incoming messages.
@@ -21,11 +22,11 @@ class SeniorReviewer(BaseAgent):
         Phase 1: Stub implementation.
         """
         # Greeting
-        await self.event_stream.emit(
+        await self.emit(
             Event(
                 type=EventType.TEXT_MESSAGE_CONTENT,
                 agent=self.role,
-                data={"message": "👋 Hi, I'm the Senior Reviewer! I'll ensure quality and security."},
+                data=TextMessageData(message="👋 Hi, I'm the Senior Reviewer! I'll ensure quality and security."),
             )
         )
 
@@ -34,10 +35,11 @@ class SeniorReviewer(BaseAgent):
         # - Security analysis
         # - Quality assessment
 
-        await self.event_stream.emit(
-            Event(
-                type=EventType.STEP_STARTED,
-                agent=self.role,
-                data={"status": "Reviewing code (stubbed)", "message_count": len(messages)},
+        if self.event_stream.wants(EventType.STEP_STARTED, self.role):
+            await self.emit(
+                Event(
+                    type=EventType.STEP_STARTED,
+                    agent=self.role,
+                    data=AgentStatusData(status="Reviewing code (stubbed)", message_count=len(messages)),
+                )
             )
-        )
@@ -1,9 +1,29 @@
+from agile_ai_sdk.core.config import AgentConfig, ContextPolicy, SupervisorPolicy, ToolOutputPolicy
+from agile_ai_sdk.core.context import ContextSummarizer, ContextWindowManager, ConversationSummary
 from agile_ai_sdk.core.deps import AgentDeps
-from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.core.dispatcher import EventDispatcher, HandlerRegistration
+from agile_ai_sdk.core.events import EventStream, Subscription
+from agile_ai_sdk.core.pool import AgentPool
+from agile_ai_sdk.core.queues import BoundedQueue, QueueStats
 from agile_ai_sdk.core.router import MessageRouter
+from agile_ai_sdk.core.tool_output import ToolOutputStore
 
 __all__ = [
+    "AgentConfig",
     "AgentDeps",
+    "AgentPool",
+    "BoundedQueue",
+    "ContextPolicy",
+    "ContextSummarizer",
+    "ContextWindowManager",
+    "ConversationSummary",
+    "EventDispatcher",
     "EventStream",
+    "HandlerRegistration",
     "MessageRouter",
+    "QueueStats",
+    "Subscription",
+    "SupervisorPolicy",
+    "ToolOutputPolicy",
+    "ToolOutputStore",
 ]
@@ -0,0 +1,192 @@
+from dataclasses import dataclass, field
+
+from pydantic_ai.models import Model
+
+from agile_ai_sdk.models import OverflowPolicy
+
+
+@dataclass
+class SupervisorPolicy:
+    """What an agent does when process_messages() raises.
+
+    The failed batch is retried after an exponential backoff. Once it has
+    failed max_attempts times it is quarantined, requests in it are answered
+    with the error, and the EM is told so it can decide what to do next.
+    Each of these decisions is emitted as a CUSTOM event (SupervisorData).
+
+    Attributes:
+        max_attempts: Attempts per batch, including the first (1 = no retries)
+        backoff_base: Delay before the first retry in seconds, doubled for each
+            further retry
+        backoff_max: Upper bound on the delay between retries
+        escalate: Send the EM a message about each quarantined batch
+
+    Example:
+        >>> AgentConfig(supervisor=SupervisorPolicy(max_attempts=5, backoff_base=2.0))
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    escalate: bool = True
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retrying after the given failed attempt (1-based)."""
+
+        return min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+
+
+@dataclass
+class ContextPolicy:
+    """How an agent keeps its conversation history within the model's context window.
+
+    Compaction is off unless max_tokens is set. Token counts are estimated
+    from the text in the history at chars_per_token. Once the estimate
+    exceeds max_tokens, the history is compacted down to compact_to of it: tool outputs from earlier turns are
+    cut to tool_output_max_tokens first, then whole turns are dropped oldest
+    first. Compacting well below the limit means the history is not
+    rewritten on every call. Each compaction is emitted as a CUSTOM event
+    (ContextCompactedData).
+
+    With summarize, older turns are instead collapsed into a summary by a
+    cheaper model once the history passes summarize_at of max_tokens. The
+    summary is produced in the background while the agent keeps working and
+    swapped in before its next batch, so no LLM call waits on it. The
+    truncating compaction above still applies if the history reaches
+    max_tokens first.
+
+    Attributes:
+        max_tokens: Estimated history size that triggers compaction (None = never compact)
+        compact_to: Fraction of max_tokens to compact down to
+        pin_first_task: Keep the first request, which holds the task the agent
+            was started with, when dropping turns. The system prompt is always kept.
+        tool_output_max_tokens: Size tool outputs from earlier turns are cut
+            to when compacting (None = leave them whole)
+        chars_per_token: Characters per token used for the estimate
+        summarize: Summarize older turns in the background instead of waiting
+            to truncate them
+        summarize_at: Fraction of max_tokens at which summarizing starts
+        keep_recent_turns: Latest turns left out of the summary, verbatim
+        summary_model: Model that writes the summary (None = llm.default.get_cheap_model())
+
+    Example:
+        >>> AgentConfig(context=ContextPolicy(max_tokens=50_000, tool_output_max_tokens=500))
+
+        Summarizing with a specific model:
+        >>> AgentConfig(context=ContextPolicy(max_tokens=100_000, summarize=True, summary_model="anthropic:claude-haiku-4-5"))
+    """
+
+    max_tokens: int | None = None
+    compact_to: float = 0.75
+    pin_first_task: bool = True
+    tool_output_max_tokens: int | None = 2_000
+    chars_per_token: float = 4.0
+    summarize: bool = False
+    summarize_at: float = 0.5
+    keep_recent_turns: int = 2
+    summary_model: Model | str | None = None
+
+    def __post_init__(self) -> None:
+        if not 0 < self.compact_to <= 1:
+            raise ValueError("compact_to must be in (0, 1]")
+
+        if not 0 < self.summarize_at <= 1:
+            raise ValueError("summarize_at must be in (0, 1]")
+
+
+@dataclass
+class ToolOutputPolicy:
+    """How much of a tool's output goes back to the model.
+
+    Output longer than head_lines + tail_lines lines, or than max_chars,
+    is cut to its first head_lines and last tail_lines lines (and at most
+    max_chars). The full output is written to a spill file, and the model
+    is told how to page through it with the read_output tool.
+
+    Attributes:
+        head_lines: Lines kept from the start of the output
+        tail_lines: Lines kept from the end, where errors and summaries tend to be
+        max_chars: Upper bound on the characters returned, for output with long lines
+        page_lines: Lines read_output returns per call by default
+
+    Example:
+        >>> AgentConfig(tool_output=ToolOutputPolicy(head_lines=20, tail_lines=80))
+    """
+
+    head_lines: int = 100
+    tail_lines: int = 100
+    max_chars: int = 20_000
+    page_lines: int = 200
+
+
+@dataclass
+class AgentConfig:
+    """Per-agent runtime configuration.
+
+    Attributes:
+        inbox_maxsize: Capacity of the agent's inbox (0 = unbounded)
+        inbox_overflow: What route_message does when the inbox is full. BLOCK
+            makes the sender wait, DROP_OLDEST evicts the oldest queued message,
+            DROP_NEWEST rejects the new one.
+        inbox_block_timeout: With BLOCK, drop the message after the sender has
+            waited this many seconds (None waits indefinitely)
+        interrupt_maxsize: Capacity of the interrupt queue (0 = unbounded).
+            Interrupts always use BLOCK so they are never silently dropped.
+        coalesce_min_wait: Once a message arrives, keep waiting while more
+            keep arriving less than this many seconds apart, so a burst is
+            handled in one batch and one LLM call (0 = process immediately)
+        coalesce_max_wait: Upper bound on that wait, measured from the start
+            of the window
+        coalesce_max_batch: Stop waiting and process once this many messages
+            are queued; also caps the batch size (0 = no limit)
+        preempt_on_interrupt: Cancel the batch being processed, including its
+            LLM call and any running command, as soon as an interrupt arrives.
+            The cancelled batch is handled again together with the interrupt.
+        request_timeout: Seconds the agent waits for a reply when it delegates
+            with MessageRouter.request() (None waits indefinitely)
+        supervisor: Retry, quarantine and escalation when processing a batch fails
+        context: Compaction of conversation history before it outgrows the context window
+        persistent_shell: Run the agent's shell commands in one long-lived
+            shell session, so cwd and environment carry over between them,
+            instead of a new shell per command
+        tool_output: Head/tail window for tool output, the rest spilled to a file
+        prompt_cache: Place provider prompt cache breakpoints on the system
+            prompt and the history, so each LLM call reads the prefix it
+            shares with the previous call from the cache
+
+    Example:
+        >>> team = AgentTeam(agent_configs={
+        ...     AgentRole.DEV: AgentConfig(inbox_maxsize=50, inbox_block_timeout=5.0),
+        ... })
+
+        Letting the EM wait for replies that land close together:
+        >>> team = AgentTeam(agent_configs={
+        ...     AgentRole.EM: AgentConfig(coalesce_min_wait=0.5, coalesce_max_wait=2.0, coalesce_max_batch=10),
+        ... })
+    """
+
+    inbox_maxsize: int = 0
+    inbox_overflow: OverflowPolicy = OverflowPolicy.BLOCK
+    inbox_block_timeout: float | None = None
+    interrupt_maxsize: int = 0
+    coalesce_min_wait: float = 0.0
+    coalesce_max_wait: float = 2.0
+    coalesce_max_batch: int = 0
+    preempt_on_interrupt: bool = False
+    request_timeout: float | None = 300.0
+    supervisor: SupervisorPolicy = field(default_factory=SupervisorPolicy)
+    context: ContextPolicy = field(default_factory=ContextPolicy)
+    persistent_shell: bool = False
+    tool_output: ToolOutputPolicy = field(default_factory=ToolOutputPolicy)
+    prompt_cache: bool = True
+
+    def __post_init__(self) -> None:
+        if self.inbox_overflow == OverflowPolicy.DISCONNECT:
+            raise ValueError("Agent inboxes do not support DISCONNECT")
+
+        if self.coalesce_max_wait < self.coalesce_min_wait:
+            raise ValueError("coalesce_max_wait must be at least coalesce_min_wait")
@@ -0,0 +1,306 @@
+from dataclasses import replace
+
+from pydantic import BaseModel, Field
+from pydantic_ai import Agent
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelRequestPart,
+    RetryPromptPart,
+    SystemPromptPart,
+    TextPart,
+    ThinkingPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+from pydantic_ai.models import Model
+
+from agile_ai_sdk.core.config import ContextPolicy
+from agile_ai_sdk.llm import default
+from agile_ai_sdk.models import ContextCompactedData
+
+# Tells the model why the conversation skips from the first task to later turns
+DROPPED_TURNS_NOTE = "[Earlier turns of this conversation were removed to fit the context window]"
+TRUNCATION_MARKER = "\n[... "
+
+
+class ConversationSummary(BaseModel):
+    """What an agent needs to remember from turns replaced by a summary."""
+
+    task: str = Field(description="The overall task the agent is working on")
+    progress: str = Field(description="What has been done so far and where the work stands")
+    facts: list[str] = Field(
+        default_factory=list,
+        description="Concrete findings to keep, e.g. file contents, command output, versions, errors",
+    )
+    files: list[str] = Field(default_factory=list, description="Paths read, created or changed")
+    open_items: list[str] = Field(default_factory=list, description="Unanswered questions and remaining steps")
+
+    def render(self) -> str:
+        """The summary as text for the conversation history."""
+
+        sections = [f"Task: {self.task}", f"Progress: {self.progress}"]
+        for title, items in (("Facts", self.facts), ("Files", self.files), ("Open items", self.open_items)):
+            if items:
+                sections.append(f"{title}:\n" + "\n".join(f"- {item}" for item in items))
+
+        return "[Summary of earlier turns of this conversation]\n" + "\n\n".join(sections)
+
+
+class ContextSummarizer:
+    """Summarizes a stretch of conversation history with a cheaper model.
+
+    Example:
+        >>> summarizer = ContextSummarizer(llm.default.get_cheap_model())
+        >>> summary = await summarizer.summarize(agent.conversation_history[:20])
+        >>> print(summary.render())
+    """
+
+    def __init__(self, model: Model | str):
+        self.ai_agent = Agent(
+            model,
+            output_type=ConversationSummary,
+            system_prompt=(
+                "You compact an AI agent's conversation history. You are given a transcript of its "
+                "earlier turns, including tool calls and their output, which will be replaced by your "
+                "summary. Keep every fact the agent would otherwise have to rediscover, such as file "
+                "paths, command output, errors and decisions, and leave out chatter."
+            ),
+        )
+
+    async def summarize(self, messages: list[ModelMessage]) -> ConversationSummary:
+        result = await self.ai_agent.run(self.transcript(messages))
+        return result.output
+
+    @staticmethod
+    def transcript(messages: list[ModelMessage]) -> str:
+        """messages as plain text, leaving out the system prompt."""
+
+        lines: list[str] = []
+        for message in messages:
+            for part in message.parts:
+                if isinstance(part, UserPromptPart):
+                    content = part.content if isinstance(part.content, str) else " ".join(map(str, part.content))
+                    lines.append(f"[user]: {content}")
+                elif isinstance(part, TextPart):
+                    lines.append(f"[agent]: {part.content}")
+                elif isinstance(part, ToolCallPart):
+                    lines.append(f"[tool call] {part.tool_name}({part.args_as_json_str()})")
+                elif isinstance(part, ToolReturnPart):
+                    lines.append(f"[tool result] {part.tool_name}: {part.model_response_str()}")
+                elif isinstance(part, RetryPromptPart):
+                    lines.append(f"[tool error]: {part.model_response()}")
+
+        return "\n".join(lines)
+
+
+class ContextWindowManager:
+    """Keeps an agent's conversation history within a token budget.
+
+    The history is split into turns, each starting at a request carrying a
+    user prompt and running through the tool calls and responses that
+    followed it. Only whole turns are dropped, so a tool call is never
+    separated from its result. The system prompt, which pydantic-ai only
+    puts in the first request, is always kept.
+
+    With ContextPolicy.summarize, summary_split() says which turns to hand
+    to the summarizer and apply_summary() swaps its summary in for them.
+
+    Example:
+        >>> manager = ContextWindowManager(ContextPolicy(max_tokens=50_000))
+        >>> history, stats = manager.compact(agent.conversation_history)
+        >>> if stats:
+        ...     print(f"{stats.tokens_before} -> {stats.tokens_after} tokens")
+    """
+
+    def __init__(self, policy: ContextPolicy):
+        self.policy = policy
+        self._summarizer: ContextSummarizer | None = None
+
+    @property
+    def summarizer(self) -> ContextSummarizer:
+        """The summarizer for the policy's summary_model, created on first use."""
+
+        if self._summarizer is None:
+            self._summarizer = ContextSummarizer(self.policy.summary_model or default.get_cheap_model())
+        return self._summarizer
+
+    def count_tokens(self, messages: list[ModelMessage]) -> int:
+        """Estimated tokens in messages."""
+
+        chars = sum(self._part_chars(part) for message in messages for part in message.parts)
+        return int(chars / self.policy.chars_per_token)
+
+    def compact(self, messages: list[ModelMessage]) -> tuple[list[ModelMessage], ContextCompactedData | None]:
+        """Compact messages if they exceed the policy's max_tokens.
+
+        The latest turn is kept whole even if it alone is over budget.
+
+        Returns:
+            (history to use from now on, stats or None if nothing was compacted)
+        """
+
+        max_tokens = self.policy.max_tokens
+        tokens_before = self.count_tokens(messages)
+        if max_tokens is None or tokens_before <= max_tokens:
+            return messages, None
+
+        target = int(max_tokens * self.policy.compact_to)
+        turns = self._split_turns(messages)
+        *earlier, latest = turns
+
+        truncated = 0
+        if self.policy.tool_output_max_tokens is not None:
+            for i, turn in enumerate(earlier):
+                earlier[i], count = self._truncate_tool_outputs(turn)
+                truncated += count
+
+        dropped = 0
+        compacted = self._join(earlier, latest, dropped)
+        tokens = self.count_tokens(compacted)
+        while tokens > target and dropped < len(earlier):
+            dropped += 1
+            compacted = self._join(earlier, latest, dropped)
+            tokens = self.count_tokens(compacted)
+
+        return compacted, ContextCompactedData(
+            tokens_before=tokens_before,
+            tokens_after=tokens,
+            messages_before=len(messages),
+            messages_after=len(compacted),
+            tool_outputs_truncated=truncated,
+            turns_dropped=dropped,
+        )
+
+    def summary_split(self, messages: list[ModelMessage]) -> int:
+        """How many leading messages to summarize now, 0 if it is not time to.
+
+        Covers every turn but the latest keep_recent_turns, once the history
+        passes summarize_at of max_tokens.
+        """
+
+        max_tokens = self.policy.max_tokens
+        if not self.policy.summarize or max_tokens is None:
+            return 0
+        if self.count_tokens(messages) < max_tokens * self.policy.summarize_at:
+            return 0
+
+        turns = self._split_turns(messages)
+        older = turns[: len(turns) - max(1, self.policy.keep_recent_turns)]
+        return sum(len(turn) for turn in older)
+
+    def apply_summary(
+        self, messages: list[ModelMessage], count: int, summary: ConversationSummary
+    ) -> tuple[list[ModelMessage], ContextCompactedData]:
+        """Replace the first count messages, as given to summary_split(), with summary.
+
+        The system prompt and pinned task are kept ahead of the summary.
+        """
+
+        pinned = self._pinned_parts(messages[0], summary.render())
+        compacted = self._merge_into(pinned, messages[count:])
+
+        return compacted, ContextCompactedData(
+            tokens_before=self.count_tokens(messages),
+            tokens_after=self.count_tokens(compacted),
+            messages_before=len(messages),
+            messages_after=len(compacted),
+            turns_summarized=len(self._split_turns(messages[:count])),
+        )
+
+    def _join(self, earlier: list[list[ModelMessage]], latest: list[ModelMessage], dropped: int) -> list[ModelMessage]:
+        """Rebuild the history with the oldest dropped turns removed."""
+
+        if dropped == 0:
+            return [message for turn in earlier for message in turn] + latest
+
+        pinned = self._pinned_parts(earlier[0][0], DROPPED_TURNS_NOTE)
+        kept = [message for turn in earlier[dropped:] for message in turn] + latest
+        return self._merge_into(pinned, kept)
+
+    @staticmethod
+    def _merge_into(pinned: list[ModelRequestPart], kept: list[ModelMessage]) -> list[ModelMessage]:
+        """Prepend pinned parts to the first kept request, so requests and responses still alternate."""
+
+        head = kept[0]
+        assert isinstance(head, ModelRequest)  # Every turn starts with a request
+        return [replace(head, parts=pinned + list(head.parts)), *kept[1:]]
+
+    def _pinned_parts(self, first_request: ModelMessage, note: str) -> list[ModelRequestPart]:
+        """The system prompt and, if pinned, the first task, followed by note.
+
+        Only the first user prompt is the task; a compacted history has
+        already merged a later turn's prompt into the first request.
+        """
+
+        pinned: list[ModelRequestPart] = []
+        task_pinned = not self.policy.pin_first_task
+        for part in first_request.parts:
+            if isinstance(part, SystemPromptPart):
+                pinned.append(part)
+            elif isinstance(part, UserPromptPart) and not task_pinned:
+                pinned.append(part)
+                task_pinned = True
+
+        pinned.append(UserPromptPart(note))
+        return pinned
+
+    def _truncate_tool_outputs(self, turn: list[ModelMessage]) -> tuple[list[ModelMessage], int]:
+        """Cut tool outputs in turn to tool_output_max_tokens."""
+
+        assert self.policy.tool_output_max_tokens is not None
+        max_chars = int(self.policy.tool_output_max_tokens * self.policy.chars_per_token)
+        truncated = 0
+        result: list[ModelMessage] = []
+
+        for message in turn:
+            if isinstance(message, ModelRequest):
+                parts: list[ModelRequestPart] = []
+                for part in message.parts:
+                    if isinstance(part, ToolReturnPart):
+                        output = part.model_response_str()
+                        # Outputs cut by an earlier compaction end in the marker
+                        if len(output) > max_chars and not output[max_chars:].startswith(TRUNCATION_MARKER):
+                            cut = len(output) - max_chars
+                            part = replace(
+                                part, content=f"{output[:max_chars]}{TRUNCATION_MARKER}{cut} characters truncated]"
+                            )
+                            truncated += 1
+                    parts.append(part)
+                message = replace(message, parts=parts)
+            result.append(message)
+
+        return result, truncated
+
+    @staticmethod
+    def _split_turns(messages: list[ModelMessage]) -> list[list[ModelMessage]]:
+        """Group messages into turns, each starting at a request with a user prompt."""
+
+        turns: list[list[ModelMessage]] = []
+        for message in messages:
+            starts_turn = isinstance(message, ModelRequest) and any(
+                isinstance(part, UserPromptPart) for part in message.parts
+            )
+            if starts_turn or not turns:
+                turns.append([message])
+            else:
+                turns[-1].append(message)
+
+        return turns
+
+    @staticmethod
+    def _part_chars(part: object) -> int:
+        if isinstance(part, SystemPromptPart | TextPart | ThinkingPart):
+            return len(part.content)
+        if isinstance(part, UserPromptPart):
+            if isinstance(part.content, str):
+                return len(part.content)
+            return sum(len(item) for item in part.content if isinstance(item, str))
+        if isinstance(part, ToolReturnPart):
+            return len(part.model_response_str())
+        if isinstance(part, RetryPromptPart):
+            return len(part.model_response())
+        if isinstance(part, ToolCallPart):
+            return len(part.tool_name) + len(part.args_as_json_str())
+        return len(str(part))
@@ -0,0 +1,402 @@
+import asyncio
+import inspect
+import itertools
+import logging
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from agile_ai_sdk.core.queues import BoundedQueue
+from agile_ai_sdk.models import AgentRole, DispatchMode, Event, EventHandler, EventType, HumanRole, OverflowPolicy
+
+logger = logging.getLogger(__name__)
+
+EventPredicate = Callable[[Event], bool]
+
+_ALL_AGENTS: tuple[AgentRole | HumanRole, ...] = (*AgentRole, *HumanRole)
+
+# Marker that tells a handler worker to exit
+_STOP = object()
+
+
+@dataclass(frozen=True, eq=False)
+class HandlerRegistration:
+    """A handler plus the filters that decide which events it receives.
+
+    Attributes:
+        handler: Sync or async callable taking an Event
+        event_types: Event types to receive, or None for all
+        agents: Agents whose events to receive, or None for all
+        predicate: Extra per-event check, evaluated only after the type and
+            agent filters match
+        timeout: Overrides the dispatcher's handler_timeout for this handler
+        max_failures: Overrides the dispatcher's max_failures for this handler
+        is_async: Whether the handler returns an awaitable, decided once at
+            registration
+    """
+
+    handler: EventHandler
+    event_types: frozenset[EventType] | None = None
+    agents: frozenset[AgentRole | HumanRole] | None = None
+    predicate: EventPredicate | None = None
+    timeout: float | None = None
+    max_failures: int | None = None
+    is_async: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Also covers instances whose __call__ is async
+        is_async = inspect.iscoroutinefunction(self.handler) or inspect.iscoroutinefunction(type(self.handler).__call__)
+        object.__setattr__(self, "is_async", is_async)
+
+    def matches(self, event_type: EventType, agent: AgentRole | HumanRole) -> bool:
+        """Whether the static type and agent filters accept this combination."""
+
+        return (self.event_types is None or event_type in self.event_types) and (
+            self.agents is None or agent in self.agents
+        )
+
+    @property
+    def name(self) -> str:
+        return getattr(self.handler, "__name__", repr(self.handler))
+
+
+class _HandlerWorker:
+    """Background task that feeds one handler from its own queue, in order."""
+
+    def __init__(self, dispatcher: "EventDispatcher", registration: HandlerRegistration):
+        self.registration = registration
+        self.queue: BoundedQueue[Event | object] = BoundedQueue(
+            maxsize=dispatcher.handler_queue_maxsize,
+            overflow=dispatcher.handler_queue_overflow,
+        )
+        self.task = asyncio.create_task(self._run(dispatcher))
+
+    async def _run(self, dispatcher: "EventDispatcher") -> None:
+        while True:
+            event = await self.queue.get()
+            if event is _STOP:
+                break
+            await dispatcher._execute_handler(self.registration, event)  # type: ignore[arg-type]
+
+    def stop(self, discard_pending: bool = False) -> None:
+        """Ask the worker to exit, after draining its queue unless discarding."""
+
+        if discard_pending:
+            self.queue.release()
+        self.queue.force_put(_STOP)
+
+
+class EventDispatcher:
+    """Routes events to the handlers registered for them.
+
+    Filters are compiled into a dispatch table keyed by (event type, agent)
+    whenever a handler is added or removed, so dispatching an event costs one
+    dict lookup plus one call per interested handler. Handlers filtered by
+    event type run before unfiltered ones, each group in registration order.
+
+    In SEQUENTIAL mode handlers run one after another inside dispatch(). In
+    CONCURRENT mode each handler gets its own worker task and queue:
+    dispatch() only enqueues, every handler still sees events in emission
+    order, and a slow handler delays nobody but itself.
+
+    Handlers that raise or exceed handler_timeout count as failures. After
+    max_failures consecutive failures the circuit breaker trips and the
+    handler is detached. Both can be set per handler in add_handler().
+
+    Sync handlers run inline on the event loop by default. With
+    sync_handlers_in_thread they run in a bounded thread pool instead, so
+    blocking work like EventLogger's file writes never stalls agents. A
+    handler never runs twice at once: while a timed-out call is still busy
+    in its thread, further events for that handler are skipped and counted
+    as failures.
+
+    Example:
+        >>> dispatcher = EventDispatcher()
+        >>> dispatcher.add_handler(export_metrics, event_types={EventType.RUN_FINISHED, EventType.TOOL_CALL_END})
+        >>> dispatcher.add_handler(log_dev, agents={AgentRole.DEV})
+        >>> dispatcher.add_handler(log_errors, predicate=lambda e: "error" in e.data)
+        >>> dispatcher.add_handler(post_webhook, timeout=10.0, max_failures=3)
+        >>> await dispatcher.dispatch(event)
+
+        Isolating a slow websocket handler:
+        >>> dispatcher = EventDispatcher(mode=DispatchMode.CONCURRENT, handler_timeout=2.0, max_failures=5)
+        >>> team = AgentTeam(dispatcher=dispatcher)
+
+        Keeping blocking sync handlers off the event loop:
+        >>> team = AgentTeam(dispatcher=EventDispatcher(sync_handlers_in_thread=True, max_sync_workers=2))
+    """
+
+    def __init__(
+        self,
+        mode: DispatchMode = DispatchMode.SEQUENTIAL,
+        handler_timeout: float | None = None,
+        max_failures: int | None = None,
+        handler_queue_maxsize: int = 0,
+        handler_queue_overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        sync_handlers_in_thread: bool = False,
+        max_sync_workers: int = 4,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            mode: SEQUENTIAL or CONCURRENT handler execution
+            handler_timeout: Seconds an async or threaded sync handler may take
+                per event before it is abandoned and counted as a failure
+                (None = no limit)
+            max_failures: Consecutive failures or timeouts before a handler is
+                detached (None = never detach)
+            handler_queue_maxsize: CONCURRENT only, per-handler queue capacity (0 = unbounded)
+            handler_queue_overflow: CONCURRENT only, what a full handler queue
+                does. BLOCK would let one slow handler stall dispatch again.
+            sync_handlers_in_thread: Run sync handlers in a thread pool instead
+                of inline on the event loop
+            max_sync_workers: Size of that thread pool
+        """
+
+        self.mode = mode
+        self.handler_timeout = handler_timeout
+        self.max_failures = max_failures
+        self.handler_queue_maxsize = handler_queue_maxsize
+        self.handler_queue_overflow = handler_queue_overflow
+        self.sync_handlers_in_thread = sync_handlers_in_thread
+        self.max_sync_workers = max_sync_workers
+
+        self._registrations: list[HandlerRegistration] = []
+        self._table: dict[tuple[EventType, AgentRole | HumanRole], tuple[HandlerRegistration, ...]] = {}
+        self._failures: dict[HandlerRegistration, int] = {}
+        self._workers: dict[HandlerRegistration, _HandlerWorker] = {}
+        self.detached: list[HandlerRegistration] = []
+        self._sync_executor: ThreadPoolExecutor | None = None
+        # Latest threaded call per sync handler, kept until the thread is done
+        self._in_flight: dict[HandlerRegistration, Future[None]] = {}
+
+    @property
+    def has_handlers(self) -> bool:
+        """Whether any handler is registered."""
+
+        return bool(self._registrations)
+
+    def add_handler(
+        self,
+        handler: EventHandler,
+        event_types: Iterable[EventType] | None = None,
+        agents: Iterable[AgentRole | HumanRole] | None = None,
+        predicate: EventPredicate | None = None,
+        timeout: float | None = None,
+        max_failures: int | None = None,
+    ) -> HandlerRegistration:
+        """Register a handler, optionally filtered by event type, agent or predicate.
+
+        timeout and max_failures default to the dispatcher's handler_timeout
+        and max_failures.
+        """
+
+        registration = HandlerRegistration(
+            handler=handler,
+            event_types=frozenset(event_types) if event_types is not None else None,
+            agents=frozenset(agents) if agents is not None else None,
+            predicate=predicate,
+            timeout=timeout,
+            max_failures=max_failures,
+        )
+        self._registrations.append(registration)
+        self._compile()
+
+        return registration
+
+    def remove_handler(self, registration: HandlerRegistration) -> None:
+        """Unregister a handler previously returned by add_handler()."""
+
+        if registration in self._registrations:
+            self._registrations.remove(registration)
+            self._failures.pop(registration, None)
+            self._in_flight.pop(registration, None)
+            self._compile()
+
+        worker = self._workers.pop(registration, None)
+        if worker is not None:
+            worker.stop(discard_pending=True)
+
+    def wants(self, event_type: EventType, agent: AgentRole | HumanRole) -> bool:
+        """Whether any handler's type and agent filters accept this combination.
+
+        A single dict lookup, cheap enough to check before building an event.
+        Handlers with a predicate count as interested, since the predicate
+        needs the event itself.
+        """
+
+        return (event_type, agent) in self._table
+
+    def handlers_for(self, event_type: EventType, agent: AgentRole | HumanRole) -> tuple[HandlerRegistration, ...]:
+        """Registrations whose type and agent filters accept this combination."""
+
+        return self._table.get((event_type, agent), ())
+
+    def _compile(self) -> None:
+        """Rebuild the (event type, agent) -> handlers table."""
+
+        typed = [r for r in self._registrations if r.event_types is not None]
+        untyped = [r for r in self._registrations if r.event_types is None]
+        ordered = typed + untyped
+
+        table: dict[tuple[EventType, AgentRole | HumanRole], tuple[HandlerRegistration, ...]] = {}
+        for event_type, agent in itertools.product(EventType, _ALL_AGENTS):
+            matching = tuple(r for r in ordered if r.matches(event_type, agent))
+            if matching:
+                table[(event_type, agent)] = matching
+
+        self._table = table
+
+    async def dispatch(self, event: Event) -> None:
+        """Dispatch an event to every interested handler.
+
+        In SEQUENTIAL mode handlers are executed one after another. In
+        CONCURRENT mode the event is queued for each handler's worker and this
+        returns immediately. Either way a failing handler is logged and never
+        affects the others.
+        """
+
+        registrations = self._table.get((event.type, event.agent), ())
+
+        if self.mode == DispatchMode.CONCURRENT:
+            for registration in registrations:
+                await self._worker_for(registration).queue.offer(event)
+            return
+
+        for registration in registrations:
+            await self._execute_handler(registration, event)
+
+    def _worker_for(self, registration: HandlerRegistration) -> _HandlerWorker:
+        """Get the worker for a handler, starting one on first use."""
+
+        worker = self._workers.get(registration)
+        if worker is None or worker.task.done():
+            worker = _HandlerWorker(self, registration)
+            self._workers[registration] = worker
+
+        return worker
+
+    async def close(self, timeout: float = 2.0) -> None:
+        """Stop handler workers, letting them drain queued events for up to timeout seconds."""
+
+        workers = list(self._workers.values())
+        self._workers.clear()
+
+        # A handler may be the one calling close() (e.g. stop() on RUN_FINISHED)
+        current = asyncio.current_task()
+        tasks = [w.task for w in workers if w.task is not current]
+
+        for worker in workers:
+            worker.stop()
+
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+
+        # Calls already running in a thread finish in the background
+        if self._sync_executor is not None:
+            self._sync_executor.shutdown(wait=False, cancel_futures=True)
+            self._sync_executor = None
+        self._in_flight.clear()
+
+    async def _run_sync_in_thread(self, registration: HandlerRegistration, event: Event, timeout: float | None) -> bool:
+        """Run a sync handler in the thread pool, creating the pool on first use.
+
+        A previous call to the same handler that timed out may still be
+        running in its thread. It gets up to timeout seconds to finish before
+        this call starts, so a handler never sees two events at once.
+
+        Returns:
+            False if the previous call was still running and the event was skipped
+
+        Raises:
+            asyncio.TimeoutError: If this call exceeds timeout
+        """
+
+        previous = self._in_flight.get(registration)
+        if previous is not None and not previous.done():
+            await asyncio.wait({asyncio.wrap_future(previous)}, timeout=timeout)
+            if not previous.done():
+                return False
+
+        if self._sync_executor is None:
+            self._sync_executor = ThreadPoolExecutor(
+                max_workers=self.max_sync_workers,
+                thread_name_prefix="agile-event-handler",
+            )
+
+        future = self._sync_executor.submit(registration.handler, event)
+        self._in_flight[registration] = future
+        # A timeout cancels a call still queued for a thread; one already
+        # running stays in _in_flight until its thread returns
+        await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        return True
+
+    async def _execute_handler(self, registration: HandlerRegistration, event: Event) -> None:
+        """Execute a single handler with error handling.
+
+        Supports both sync and async handlers. Errors and timeouts are logged
+        but don't propagate to prevent one handler from breaking others.
+        handler_timeout applies to async handlers and to sync handlers run in
+        the thread pool; a timed-out thread call is abandoned, not interrupted,
+        and events arriving while it still runs are skipped as failures.
+        """
+
+        handler = registration.handler
+        timeout = registration.timeout if registration.timeout is not None else self.handler_timeout
+
+        try:
+            if registration.predicate is not None and not registration.predicate(event):
+                return
+
+            if registration.is_async:
+                await asyncio.wait_for(handler(event), timeout=timeout)
+            elif self.sync_handlers_in_thread:
+                if not await self._run_sync_in_thread(registration, event, timeout):
+                    logger.error(
+                        f"Handler {registration.name} skipped event {event.type}: previous call still running",
+                        extra={"event_type": event.type, "handler": registration.name},
+                    )
+                    self._record_failure(registration)
+                    return
+            else:
+                handler(event)
+
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Handler {registration.name} timed out after {timeout}s for event {event.type}",
+                extra={"event_type": event.type, "handler": registration.name},
+            )
+            self._record_failure(registration)
+
+        except Exception as e:
+            logger.error(
+                f"Handler {registration.name} failed for event {event.type}: {e}",
+                exc_info=True,
+                extra={"event_type": event.type, "handler": registration.name},
+            )
+            self._record_failure(registration)
+
+        else:
+            self._failures.pop(registration, None)
+
+    def _record_failure(self, registration: HandlerRegistration) -> None:
+        """Count a failure and trip the circuit breaker if the limit is reached."""
+
+        failures = self._failures.get(registration, 0) + 1
+        self._failures[registration] = failures
+
+        max_failures = registration.max_failures if registration.max_failures is not None else self.max_failures
+        if max_failures is None or failures < max_failures:
+            return
+
+        if registration not in self._registrations:
+            return  # Already detached
+
+        logger.error(
+            f"Detaching handler {registration.name} after {failures} consecutive failures",
+            extra={"handler": registration.name},
+        )
+        self.detached.append(registration)
+        self.remove_handler(registration)
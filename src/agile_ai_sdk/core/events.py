@@ -1,7 +1,129 @@
-import asyncio
-from collections.abc import AsyncIterator
+import itertools
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
 
-from agile_ai_sdk.models import Event, EventType
+from agile_ai_sdk.core.queues import BoundedQueue, QueueStats
+from agile_ai_sdk.models import AgentRole, Event, EventType, HumanRole, OverflowPolicy, Verbosity
+
+# Decides whether a consumer wants events of a type from an agent
+InterestFilter = Callable[[EventType, AgentRole | HumanRole], bool]
+
+# Marker enqueued on close so a blocked consumer wakes up without polling
+_CLOSED = object()
+
+
+class Subscription:
+    """A single consumer's view of an EventStream, with its own bounded queue.
+
+    Created via EventStream.subscribe(). Each subscription buffers up to
+    maxsize events and applies its overflow policy when the consumer falls
+    behind, so a slow subscriber never affects other subscribers.
+
+    Example:
+        >>> async with stream.subscribe(maxsize=100) as subscription:
+        ...     async for event in subscription:
+        ...         await websocket.send_json(event.model_dump(mode="json"))
+    """
+
+    def __init__(
+        self,
+        stream: "EventStream",
+        maxsize: int = 0,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        block_timeout: float | None = None,
+        event_types: Iterable[EventType] | None = None,
+    ):
+        self._stream = stream
+        self.event_types = frozenset(event_types) if event_types is not None else None
+        self._queue: BoundedQueue[Event | object] = BoundedQueue(
+            maxsize=maxsize, overflow=overflow, block_timeout=block_timeout
+        )
+        self._closed: bool = False
+        self.disconnected: bool = False
+
+        # Replayed history, yielded before anything in the live queue
+        self._backlog: deque[Event] = deque()
+        self.missed: int = 0
+
+    @property
+    def closed(self) -> bool:
+        """Whether this subscription has stopped accepting events."""
+
+        return self._closed
+
+    @property
+    def stats(self) -> QueueStats:
+        """Delivery counters: enqueued, dropped and time emit() spent blocked."""
+
+        return self._queue.stats
+
+    def wants(self, event_type: EventType) -> bool:
+        """Whether this subscription receives events of this type."""
+
+        return self.event_types is None or event_type in self.event_types
+
+    def qsize(self) -> int:
+        """Number of events buffered for this subscriber, including replayed ones."""
+
+        return len(self._backlog) + self._queue.qsize()
+
+    async def _deliver(self, event: Event) -> None:
+        """Enqueue an event, disconnecting if the overflow policy says so."""
+
+        if self._closed:
+            return
+
+        delivered = await self._queue.offer(event)
+        if not delivered and self._queue.overflow == OverflowPolicy.DISCONNECT:
+            self.disconnected = True
+            self._stream._detach(self)
+            self.close()
+
+    async def __aiter__(self) -> AsyncIterator[Event]:
+        """Iterate over events until the subscription or its stream closes.
+
+        Replayed events come first, then events buffered before close are
+        drained.
+        """
+
+        while self._backlog:
+            yield self._backlog.popleft()
+
+        while True:
+            event = await self._queue.get()
+            if event is _CLOSED:
+                break
+            yield event  # type: ignore[misc]
+
+    def close(self) -> None:
+        """Stop accepting events and end iteration once the buffer drains."""
+
+        if self._closed:
+            return
+
+        self._closed = True
+        self._queue.force_put(_CLOSED)
+
+    def unsubscribe(self) -> None:
+        """Detach from the stream and discard anything still buffered.
+
+        Also releases any emit() blocked on this subscriber.
+        """
+
+        self._stream._detach(self)
+        self._queue.release()
+        self._backlog.clear()
+
+        # release() also discards a close marker, so always re-add one
+        self._closed = True
+        self._queue.force_put(_CLOSED)
+
+    async def __aenter__(self) -> "Subscription":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.unsubscribe()
 
 
 class EventStream:
@@ -27,7 +149,7 @@ class EventStream:
         ...     await stream.emit(Event(
         ...         type=EventType.STEP_STARTED,
         ...         agent=AgentRole.EM,
-        ...         data={"agent": agent_id}
+        ...         data=AgentStatusData(status=f"{agent_id} working")
         ...     ))
         >>>
         >>> # Multiple agents emit to same stream
@@ -41,6 +163,28 @@ class EventStream:
         >>> async for event in stream:
         ...     process(event)
 
+        Multiple consumers, each with a bounded buffer:
+        >>> sse_client = stream.subscribe(maxsize=100, overflow=OverflowPolicy.DROP_OLDEST)
+        >>> metrics = stream.subscribe(maxsize=1000, overflow=OverflowPolicy.DISCONNECT)
+        >>> async for event in sse_client:
+        ...     yield b"data: " + event.to_json_bytes() + b"\n\n"
+
+        Resuming a reconnecting client from the replay buffer:
+        >>> stream = EventStream(replay_size=1000)
+        >>> async with stream.subscribe(after_seq=last_event_id) as sse_client:
+        ...     async for event in sse_client:
+        ...         yield b"id: %d\ndata: %s\n\n" % (event.seq, event.to_json_bytes())
+
+        Skipping debug chatter at the source:
+        >>> stream = EventStream(verbosity=Verbosity.NORMAL)
+        >>> if stream.debug:
+        ...     await stream.emit(Event(..., data=TextMessageData(message=f"Dumping {state}")))
+
+        Skipping events nobody consumes:
+        >>> stream = EventStream(primary_interest=dispatcher.wants)
+        >>> if stream.wants(EventType.STEP_STARTED, AgentRole.DEV):
+        ...     await stream.emit(Event(type=EventType.STEP_STARTED, agent=AgentRole.DEV, data=...))
+
         Manual close:
         >>> stream = EventStream()
         >>> await stream.emit(Event(...))
@@ -50,29 +194,219 @@ class EventStream:
         ...     print(event)
     """
 
-    def __init__(self):
-        self._queue: asyncio.Queue[Event] = asyncio.Queue()
+    def __init__(
+        self,
+        maxsize: int = 0,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        block_timeout: float | None = None,
+        replay_size: int = 0,
+        start_seq: int = 0,
+        verbosity: Verbosity = Verbosity.DEBUG,
+        primary_interest: InterestFilter | None = None,
+    ):
+        """Initialize the event stream.
+
+        Args:
+            maxsize: Capacity of the built-in iterator's queue (0 = unbounded)
+            overflow: Backpressure when that queue is full. BLOCK makes emit()
+                wait for the consumer, DROP_OLDEST and DROP_NEWEST discard an
+                event and count it in stats.dropped.
+            block_timeout: With BLOCK, drop the event after waiting this long
+            replay_size: Most recent events kept in memory for subscribers
+                resuming via subscribe(after_seq=...) (0 = no replay)
+            start_seq: Sequence number to continue from, so a stream that
+                replaces a closed one keeps numbering unique within a run
+            verbosity: Which events producers should emit. emit() does not
+                filter; producers check debug before building a debug event.
+            primary_interest: Which events the built-in iterator receives, e.g.
+                EventDispatcher.wants for a stream feeding a dispatcher
+                (None = all events)
+        """
+
+        if overflow == OverflowPolicy.DISCONNECT:
+            raise ValueError("EventStream does not support DISCONNECT; use it with subscribe() instead")
+
+        # Feeds `async for event in stream`
+        self._primary = Subscription(self, maxsize=maxsize, overflow=overflow, block_timeout=block_timeout)
+        self._subscribers: list[Subscription] = []
         self._closed: bool = False
 
+        self._last_seq: int = start_seq
+        self._replay: deque[Event] = deque(maxlen=replay_size)
+        self.verbosity = verbosity
+        self.primary_interest = primary_interest
+
+    @property
+    def stats(self) -> QueueStats:
+        """Counters for the built-in iterator's queue.
+
+        Example:
+            >>> stream.stats.dropped, stream.stats.blocked_seconds
+            (0, 0.0)
+        """
+
+        return self._primary.stats
+
+    @property
+    def debug(self) -> bool:
+        """Whether debug events should be emitted.
+
+        Check this before constructing the event, so with NORMAL verbosity
+        neither the Event nor its message string is built.
+        """
+
+        return self.verbosity == Verbosity.DEBUG
+
+    def wants(self, event_type: EventType, agent: AgentRole | HumanRole, debug: bool = False) -> bool:
+        """Whether an event of this type from this agent would reach anyone.
+
+        True if the built-in iterator's primary_interest accepts it, a
+        subscriber's event_types include it, or the replay buffer is enabled,
+        since a resuming client may want any event. Producers check this
+        before building an event, so unwanted events cost no construction.
+
+        Args:
+            debug: The event is debug chatter, wanted only at DEBUG verbosity
+        """
+
+        if self._closed or (debug and not self.debug):
+            return False
+
+        if self._replay.maxlen or self._primary_wants(event_type, agent):
+            return True
+
+        return any(subscription.wants(event_type) for subscription in self._subscribers)
+
+    def _primary_wants(self, event_type: EventType, agent: AgentRole | HumanRole) -> bool:
+        return self.primary_interest is None or self.primary_interest(event_type, agent)
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recent event, 0 before the first emit."""
+
+        return self._last_seq
+
     async def emit(self, event: Event) -> None:
-        """Emit an event to the stream."""
+        """Emit an event to the stream and every subscriber.
+
+        Stamps the event with its seq and monotonic emission time, then records
+        it in the replay buffer. Subscribers with a non-blocking overflow
+        policy never make emit() wait. An event nobody wants (see wants()) is
+        dropped without a seq, so it never piles up in a queue.
+        """
+
+        if self._closed:
+            return
+
+        primary = self._primary_wants(event.type, event.agent)
+        subscribers = [s for s in self._subscribers if s.wants(event.type)]
+        if not (primary or subscribers or self._replay.maxlen):
+            return
 
-        if not self._closed:
-            await self._queue.put(event)
+        self._last_seq += 1
+        event.seq = self._last_seq
+        event.mono_ns = time.monotonic_ns()
+        event._json = None  # Any encoding made before emit() lacks seq
+        if self._replay.maxlen:
+            self._replay.append(event)
+
+        if primary:
+            await self._primary._deliver(event)
+
+        for subscription in subscribers:
+            await subscription._deliver(event)
+
+    def subscribe(
+        self,
+        maxsize: int = 100,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        block_timeout: float | None = None,
+        after_seq: int | None = None,
+        event_types: Iterable[EventType] | None = None,
+    ) -> Subscription:
+        """Register an additional consumer with its own bounded queue.
+
+        By default the subscription only sees events emitted after this call.
+        With after_seq it first receives the buffered events that followed
+        that sequence number, like an SSE client resuming from Last-Event-ID.
+        If some of those events already left the replay buffer, the number
+        lost is recorded in subscription.missed.
+
+        Args:
+            maxsize: Events buffered before the overflow policy applies (0 = unbounded)
+            overflow: What to do when this subscriber falls behind. BLOCK makes
+                emit() wait for the subscriber, so reserve it for consumers that
+                must not miss events.
+            block_timeout: With BLOCK, drop the event after waiting this long
+            after_seq: Last sequence number the consumer has already seen
+            event_types: Only receive events of these types (None = all).
+                Producers skip building events no consumer wants.
+        """
+
+        subscription = Subscription(
+            self, maxsize=maxsize, overflow=overflow, block_timeout=block_timeout, event_types=event_types
+        )
+
+        if after_seq is not None:
+            replayed = self.replay(after_seq)
+            first_seq = replayed[0].seq if replayed else self._last_seq + 1
+            subscription._backlog.extend(event for event in replayed if subscription.wants(event.type))
+            subscription.missed = max(0, first_seq - after_seq - 1)  # type: ignore[operator]
+
+        if self._closed:
+            subscription.close()
+        else:
+            self._subscribers.append(subscription)
+
+        return subscription
+
+    def replay(self, after_seq: int = 0) -> list[Event]:
+        """Buffered events with a sequence number greater than after_seq, oldest first."""
+
+        if not self._replay or after_seq >= self._last_seq:
+            return []
+
+        # Sequence numbers are contiguous, so the start offset can be computed
+        oldest = self._replay[0].seq or 0
+        start = max(0, after_seq - oldest + 1)
+        return list(itertools.islice(self._replay, start, None))
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of active subscribers, excluding the built-in iterator."""
+
+        return len(self._subscribers)
+
+    def _detach(self, subscription: Subscription) -> None:
+        """Remove a subscription so it no longer receives events."""
+
+        if subscription in self._subscribers:
+            self._subscribers.remove(subscription)
 
     async def __aiter__(self) -> AsyncIterator[Event]:
-        """Iterate over events as they arrive."""
+        """Iterate over events as they arrive.
 
-        while True:
-            try:
-                event = await asyncio.wait_for(self._queue.get(), timeout=0.1)
-                yield event
+        The consumer only wakes when an event is emitted or the stream is
+        closed. Events emitted before close() are drained first. Only one
+        consumer should iterate the stream directly; use subscribe() for more.
+        """
 
-            except asyncio.TimeoutError:
-                if self._closed and self._queue.empty():
-                    break
-                continue
+        async for event in self._primary:
+            yield event
 
     def close(self) -> None:
-        """Close the event stream."""
+        """Close the event stream and all of its subscriptions.
+
+        Idempotent. Consumers drain events that were already emitted and
+        then stop.
+        """
+
+        if self._closed:
+            return
+
         self._closed = True
+        self._primary.close()
+
+        for subscription in self._subscribers:
+            subscription.close()
+        self._subscribers.clear()
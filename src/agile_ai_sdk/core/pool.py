@@ -0,0 +1,133 @@
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from agile_ai_sdk.models import AgentRole, Message, PoolPolicy, Priority
+
+if TYPE_CHECKING:
+    from agile_ai_sdk.agents.base import BaseAgent
+
+
+class AgentPool:
+    """Several agents serving one role, with messages spread across them.
+
+    Each member is a separate agent instance with its own queues and
+    conversation history, so the pool runs that many LLM sessions at once.
+    An interrupt goes to one member, the one whose work it most likely
+    concerns (see interrupt_target). Members are numbered from 1, and their
+    events carry that id as agent_id, e.g. "developer#2".
+
+    Example:
+        >>> developers = [Developer(router, event_stream) for _ in range(3)]
+        >>> pool = router.register_pool(AgentRole.DEV, developers, policy=PoolPolicy.WORK_STEALING)
+        >>> await router.send(AgentRole.EM, AgentRole.DEV, "Implement /health")  # one of the three gets it
+        >>> pool.stolen
+        Counter({('developer#1', 'developer#3'): 2})
+    """
+
+    def __init__(self, role: AgentRole, members: list["BaseAgent"], policy: PoolPolicy = PoolPolicy.LEAST_LOADED):
+        if not members:
+            raise ValueError(f"Pool for {role.value} needs at least one member")
+
+        self.role = role
+        self.members = members
+        self.policy = policy
+        self._next: int = 0
+        # Messages moved by steal(), by (victim, thief) member id
+        self.stolen: Counter[tuple[str, str]] = Counter()
+
+        for i, member in enumerate(members, 1):
+            member.pool = self
+            member.agent_id = f"{role.value}#{i}"
+
+    def select(self) -> "BaseAgent":
+        """Pick the member the next message goes to.
+
+        LEAST_LOADED takes the member with the lowest load, breaking ties
+        round-robin so idle members share the work. WORK_STEALING deals
+        round-robin and leaves balancing to steal().
+        """
+
+        count = len(self.members)
+        start = self._next
+        self._next = (start + 1) % count
+
+        if self.policy == PoolPolicy.WORK_STEALING:
+            return self.members[start]
+
+        return min((self.members[(start + i) % count] for i in range(count)), key=lambda member: member.load)
+
+    def interrupt_target(self, message: Message) -> "BaseAgent":
+        """Pick the member an interrupt goes to.
+
+        A member busy with a batch from the interrupt's sender comes first,
+        then any busy member, since an interrupt redirects work in progress.
+        With every member idle, the least loaded one gets it.
+        """
+
+        busy = [member for member in self.members if member.busy]
+        for member in busy:
+            if any(queued.source == message.source for queued in member.batch):
+                return member
+        if busy:
+            return busy[0]
+
+        return min(self.members, key=lambda member: member.load)
+
+    async def offer(self, message: Message) -> bool:
+        """Enqueue a message with a member chosen by the policy.
+
+        Interrupts go to a single member (see interrupt_target), so one
+        interrupt starts one LLM run and gets one reply.
+
+        Returns:
+            Whether the message was enqueued
+        """
+
+        if message.priority == Priority.INTERRUPT:
+            return await self.interrupt_target(message).interrupt_queue.offer(message)
+
+        member = self.select()
+        if not await member.inbox.offer(message):
+            return False
+
+        # Let idle members know there is work to take
+        if self.policy == PoolPolicy.WORK_STEALING and member.busy:
+            for other in self.members:
+                if other.load == 0:
+                    other.wake()
+
+        return True
+
+    async def steal(self, thief: "BaseAgent") -> bool:
+        """Move the oldest queued message of the most backed-up member to thief.
+
+        Only WORK_STEALING pools steal, and only into a thief with room in
+        its inbox. Called by an idle member before it goes to sleep.
+
+        Returns:
+            True if a message was moved
+        """
+
+        if self.policy != PoolPolicy.WORK_STEALING or thief.inbox.full():
+            return False
+
+        victim = max(self.members, key=lambda member: member.inbox.qsize())
+        # An idle member's single queued message is about to be picked up
+        if victim is thief or victim.inbox.qsize() <= (0 if victim.busy else 1):
+            return False
+
+        message = victim.inbox.get_nowait()
+        if not await thief.inbox.offer(message):
+            # e.g. the thief's inbox was released; the victim keeps its work
+            victim.inbox.put_back(message)
+            return False
+
+        victim.inbox.stats.stolen += 1
+        self.stolen[(victim.agent_id, thief.agent_id)] += 1  # type: ignore[index]
+        return True
+
+    @property
+    def load(self) -> int:
+        """Total queued and in-progress messages across members."""
+
+        return sum(member.load for member in self.members)
@@ -0,0 +1,192 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from agile_ai_sdk.models import OverflowPolicy
+
+T = TypeVar("T")
+
+
+@dataclass
+class QueueStats:
+    """Runtime counters for a BoundedQueue.
+
+    Attributes:
+        enqueued: Items accepted into the queue
+        dropped: Items lost to the overflow policy, a block timeout or release()
+        blocked: Offers that had to wait for space
+        blocked_seconds: Total time producers spent waiting for space
+        high_watermark: Largest queue size observed
+        stolen: Items taken over by another AgentPool member
+    """
+
+    enqueued: int = 0
+    dropped: int = 0
+    blocked: int = 0
+    blocked_seconds: float = 0.0
+    high_watermark: int = 0
+    stolen: int = 0
+
+
+class BoundedQueue(asyncio.Queue, Generic[T]):
+    """asyncio.Queue with an explicit policy for what happens when it is full.
+
+    Use offer() instead of put() so the overflow policy is applied and the
+    stats counters stay accurate. A maxsize of 0 means unbounded, in which
+    case offer() never blocks or drops.
+
+    Example:
+        >>> queue = BoundedQueue(maxsize=2, overflow=OverflowPolicy.DROP_OLDEST)
+        >>> await queue.offer("a")
+        True
+        >>> await queue.offer("b")
+        True
+        >>> await queue.offer("c")  # evicts "a"
+        True
+        >>> queue.get_nowait()
+        'b'
+        >>> queue.stats.dropped
+        1
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        block_timeout: float | None = None,
+        wakeup: asyncio.Event | None = None,
+    ):
+        """Initialize the queue.
+
+        Args:
+            maxsize: Capacity, 0 for unbounded
+            overflow: Policy applied by offer() when the queue is full
+            block_timeout: With BLOCK, give up and drop the item after waiting
+                this many seconds for space (None waits indefinitely)
+            wakeup: Event set whenever an item is enqueued, so one consumer
+                can wait on several queues at once
+        """
+
+        # Capacity is enforced here rather than by asyncio.Queue so control
+        # markers can always be enqueued and blocked producers can be released
+        super().__init__()
+        self.capacity = maxsize
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.stats = QueueStats()
+        self._space_available = asyncio.Event()
+        self._released: bool = False
+        self.wakeup = wakeup
+
+    @property
+    def maxsize(self) -> int:
+        return self.capacity
+
+    def full(self) -> bool:
+        return 0 < self.capacity <= self.qsize()
+
+    def put_nowait(self, item: T) -> None:
+        super().put_nowait(item)
+        if self.wakeup is not None:
+            self.wakeup.set()
+
+    def get_nowait(self) -> T:
+        item = super().get_nowait()
+        self._space_available.set()
+        return item
+
+    async def offer(self, item: T) -> bool:
+        """Enqueue an item according to the overflow policy.
+
+        Returns:
+            True if the item was enqueued. False if it was dropped because the
+            queue is full and the policy is DROP_NEWEST or DISCONNECT, a BLOCK
+            wait timed out, or the queue was released while waiting.
+        """
+
+        if self._released:
+            self.stats.dropped += 1
+            return False
+
+        if not self.full():
+            self._accept(item)
+            return True
+
+        if self.overflow == OverflowPolicy.BLOCK:
+            if await self._wait_for_space():
+                self._accept(item)
+                return True
+
+            self.stats.dropped += 1
+            return False
+
+        if self.overflow == OverflowPolicy.DROP_OLDEST:
+            self.get_nowait()
+            self.stats.dropped += 1
+            self._accept(item)
+            return True
+
+        self.stats.dropped += 1
+        return False
+
+    async def _wait_for_space(self) -> bool:
+        """Wait until the queue has room, recording how long it took."""
+
+        self.stats.blocked += 1
+        started = time.monotonic()
+        deadline = None if self.block_timeout is None else started + self.block_timeout
+
+        try:
+            while self.full():
+                self._space_available.clear()
+                timeout = None if deadline is None else deadline - time.monotonic()
+                await asyncio.wait_for(self._space_available.wait(), timeout=timeout)
+                if self._released:
+                    return False
+
+            return True
+
+        except asyncio.TimeoutError:
+            return False
+
+        finally:
+            self.stats.blocked_seconds += time.monotonic() - started
+
+    def _accept(self, item: T) -> None:
+        self.put_nowait(item)
+        self.stats.enqueued += 1
+        self.stats.high_watermark = max(self.stats.high_watermark, self.qsize())
+
+    def force_put(self, item: T) -> None:
+        """Enqueue regardless of capacity, for control markers like close sentinels."""
+
+        capacity, self.capacity = self.capacity, 0
+        try:
+            self.put_nowait(item)
+        finally:
+            self.capacity = capacity
+
+    def put_back(self, item: T) -> None:
+        """Return an item just taken with get_nowait() to the front of the queue."""
+
+        self.force_put(item)
+        self._queue.rotate(1)  # type: ignore[attr-defined]
+
+    def release(self) -> int:
+        """Discard all queued items and make pending and future offers fail.
+
+        Returns:
+            Number of items discarded
+        """
+
+        self._released = True
+        self._space_available.set()
+
+        discarded = 0
+        while not self.empty():
+            super().get_nowait()
+            discarded += 1
+
+        self.stats.dropped += discarded
+        return discarded
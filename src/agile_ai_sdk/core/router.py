@@ -1,6 +1,10 @@
+import asyncio
+import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.core.pool import AgentPool
 from agile_ai_sdk.models import (
     AgentRole,
     Event,
@@ -8,9 +12,13 @@ from agile_ai_sdk.models import (
     HumanRole,
     Message,
     MessageReceivedData,
+    MessageRoutedData,
     MessageSentData,
+    PoolPolicy,
     Priority,
+    RoutingEventMode,
 )
+from agile_ai_sdk.models.base import new_id
 
 if TYPE_CHECKING:
     from agile_ai_sdk.agents.base import BaseAgent
@@ -36,56 +44,204 @@ class MessageRouter:
         ...     target=AgentRole.DEV,
         ...     content="Implement the /health endpoint"
         ... )
+
+        Compact routing events, with the content in the "routed" event only:
+        >>> router = MessageRouter(event_stream, routing_events=RoutingEventMode.COMPACT)
+        >>> async for event in event_stream:
+        ...     if event.data.get("action") == "received":
+        ...         message = router.get_message(event.data["message_id"])
+
+        Delegating and waiting for the answer:
+        >>> reply = await router.request(AgentRole.EM, AgentRole.DEV, "List files in src/", timeout=300)
+        >>> # ...meanwhile, in the developer, for the request it received:
+        >>> await router.reply(request, AgentRole.DEV, "main.py, utils.py")
     """
 
-    def __init__(self, event_stream: EventStream):
+    def __init__(
+        self,
+        event_stream: EventStream,
+        routing_events: RoutingEventMode = RoutingEventMode.FULL,
+        message_store_size: int = 1000,
+    ):
+        """Initialize the router.
+
+        Args:
+            event_stream: Stream routing events are emitted to
+            routing_events: FULL emits a "sent" and a "received" event per
+                message, each with the content. COMPACT emits a "routed"
+                event with the content and a "received" event with only the
+                message id, and keeps recent messages in the router's
+                message store.
+            message_store_size: COMPACT only, number of most recent messages
+                kept for get_message()
+        """
+
         self._agents: dict[AgentRole, BaseAgent] = {}
+        self._pools: dict[AgentRole, AgentPool] = {}
         self._event_stream = event_stream
+        self.routing_events = routing_events
+        self.message_store_size = message_store_size
+        self._messages: OrderedDict[str, Message] = OrderedDict()
+        # Futures of requests awaiting a reply, by correlation id
+        self._pending: dict[str, asyncio.Future[Message]] = {}
 
     def register_agent(self, role: AgentRole, agent: "BaseAgent") -> None:
         """Register an agent with the router."""
 
         self._agents[role] = agent
+        self._pools.pop(role, None)
+
+    def register_pool(
+        self,
+        role: AgentRole,
+        agents: list["BaseAgent"],
+        policy: PoolPolicy = PoolPolicy.LEAST_LOADED,
+    ) -> AgentPool:
+        """Register several agents behind one role; see AgentPool."""
+
+        pool = AgentPool(role, agents, policy)
+        self._pools[role] = pool
+        self._agents.pop(role, None)
+        return pool
+
+    def has_agent(self, role: AgentRole) -> bool:
+        """Whether an agent or pool is registered for role."""
+
+        return role in self._agents or role in self._pools
 
-    async def route_message(self, message: Message) -> None:
+    def get_message(self, message_id: str) -> Message | None:
+        """Look up a recent message routed in COMPACT mode by id.
+
+        Only COMPACT mode stores messages: with FULL routing events this
+        always returns None, since both events already carry the content.
+        The store keeps the last message_store_size messages, so ids from
+        older "received" echoes return None as well. Consumers that must
+        keep every message should read the content from the "routed" event.
+        """
+
+        return self._messages.get(message_id)
+
+    async def route_message(self, message: Message) -> bool:
         """Route a message to the target agent's appropriate queue.
 
         Automatically emits events to the stream for observability.
+
+        Backpressure follows the target's AgentConfig: with BLOCK this waits
+        until the inbox has room (up to inbox_block_timeout), with DROP_OLDEST
+        the oldest queued message is evicted, and with DROP_NEWEST this message
+        is rejected. Interrupts always wait for room.
+
+        A reply to a pending request() resolves the requester's future
+        instead of going to its inbox; a late reply, after the request timed
+        out, is enqueued like any other message.
+
+        Returns:
+            True if the message was enqueued, False if it was dropped. Drops
+            are counted in the target queue's stats.
         """
 
-        if message.target not in self._agents:
+        if not self.has_agent(message.target):
             raise ValueError(f"Agent {message.target} not registered")
 
-        agent = self._agents[message.target]
+        message.routed_ns = time.monotonic_ns()
 
-        await self._event_stream.emit(
-            Event(
-                type=EventType.TEXT_MESSAGE_CONTENT,
-                agent=message.source,
-                data=MessageSentData(
-                    to=message.target.value,
-                    content=message.content,
-                    priority=message.priority.value,
-                ).model_dump(),
+        if self.routing_events == RoutingEventMode.COMPACT:
+            return await self._route_compact(message)
+
+        # Neither event is built when no consumer wants it
+        if self._event_stream.wants(EventType.TEXT_MESSAGE_CONTENT, message.source):
+            await self._event_stream.emit(
+                Event(
+                    type=EventType.TEXT_MESSAGE_CONTENT,
+                    agent=message.source,
+                    data=MessageSentData(
+                        to=message.target.value,
+                        content=message.content,
+                        priority=message.priority.value,
+                    ),
+                )
             )
-        )
 
-        if message.priority == Priority.INTERRUPT:
-            await agent.interrupt_queue.put(message)
-        else:
-            await agent.inbox.put(message)
-
-        await self._event_stream.emit(
-            Event(
-                type=EventType.TEXT_MESSAGE_CONTENT,
-                agent=message.target,
-                data=MessageReceivedData(
-                    from_=message.source.value,
-                    content=message.content,
-                    priority=message.priority.value,
-                ).model_dump(),
+        if not await self._deliver(message):
+            return False
+
+        if self._event_stream.wants(EventType.TEXT_MESSAGE_CONTENT, message.target):
+            await self._event_stream.emit(
+                Event(
+                    type=EventType.TEXT_MESSAGE_CONTENT,
+                    agent=message.target,
+                    data=MessageReceivedData(
+                        from_=message.source.value,
+                        content=message.content,
+                        priority=message.priority.value,
+                        message_id=message.id,
+                    ),
+                )
             )
-        )
+
+        return True
+
+    async def _route_compact(self, message: Message) -> bool:
+        """Enqueue a message, emitting its content once and a content-free received echo."""
+
+        sent = self._event_stream.wants(EventType.TEXT_MESSAGE_CONTENT, message.source)
+        received = self._event_stream.wants(EventType.TEXT_MESSAGE_CONTENT, message.target)
+
+        # Only stored when someone will see an event that refers to it
+        if sent or received:
+            self._messages[message.id] = message
+            if len(self._messages) > self.message_store_size:
+                self._messages.popitem(last=False)
+
+        if sent:
+            await self._event_stream.emit(
+                Event(
+                    type=EventType.TEXT_MESSAGE_CONTENT,
+                    agent=message.source,
+                    data=MessageRoutedData(
+                        message_id=message.id,
+                        from_=message.source.value,
+                        to=message.target.value,
+                        content=message.content,
+                        priority=message.priority.value,
+                    ),
+                )
+            )
+
+        if not await self._deliver(message):
+            return False
+
+        if received:
+            await self._event_stream.emit(
+                Event(
+                    type=EventType.TEXT_MESSAGE_CONTENT,
+                    agent=message.target,
+                    data=MessageReceivedData(
+                        from_=message.source.value,
+                        priority=message.priority.value,
+                        message_id=message.id,
+                    ),
+                )
+            )
+
+        return True
+
+    async def _deliver(self, message: Message) -> bool:
+        """Resolve the pending request this message answers, or enqueue it."""
+
+        if message.in_reply_to is not None and message.correlation_id is not None:
+            future = self._pending.pop(message.correlation_id, None)
+            if future is not None and not future.done():
+                future.set_result(message)
+                return True
+
+        pool = self._pools.get(message.target)
+        if pool is not None:
+            return await pool.offer(message)
+
+        agent = self._agents[message.target]
+        queue = agent.interrupt_queue if message.priority == Priority.INTERRUPT else agent.inbox
+        return await queue.offer(message)
 
     async def send(
         self,
@@ -93,14 +249,133 @@ class MessageRouter:
         target: AgentRole,
         content: str,
         priority: Priority = Priority.NORMAL,
-    ) -> None:
-        """Convenience method to create and route a message."""
+    ) -> bool:
+        """Convenience method to create and route a message.
+
+        Returns:
+            Whether the message was delivered (see route_message)
+        """
+
+        message = Message(
+            source=source,
+            target=target,
+            content=content,
+            priority=priority,
+        )
+
+        return await self.route_message(message)
+
+    async def request(
+        self,
+        source: AgentRole,
+        target: AgentRole,
+        content: str,
+        priority: Priority = Priority.NORMAL,
+        timeout: float | None = None,
+    ) -> Message:
+        """Send a message and wait for the target's reply.
+
+        The reply is handed straight to the caller rather than queued in its
+        inbox, so an agent can delegate and use the answer within the same
+        LLM run.
+
+        Args:
+            timeout: Seconds to wait for the reply (None waits indefinitely)
+
+        Returns:
+            The reply message
+
+        Raises:
+            asyncio.TimeoutError: If no reply arrives within timeout
+            RuntimeError: If the target's inbox dropped the request
+        """
 
+        correlation_id = new_id()
         message = Message(
             source=source,
             target=target,
             content=content,
             priority=priority,
+            correlation_id=correlation_id,
         )
 
-        await self.route_message(message)
+        future: asyncio.Future[Message] = asyncio.get_running_loop().create_future()
+        self._pending[correlation_id] = future
+
+        try:
+            if not await self.route_message(message):
+                raise RuntimeError(f"Request to {target.value} was dropped")
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self._pending.pop(correlation_id, None)
+
+    async def request_all(
+        self,
+        source: AgentRole,
+        requests: list[tuple[AgentRole, str]],
+        timeout: float | None = None,
+    ) -> list[Message | None]:
+        """Send several requests at once and wait for all of their replies.
+
+        The requests are routed concurrently, so independent work proceeds in
+        parallel. timeout bounds the whole barrier; requests still unanswered
+        when it expires are abandoned and their late replies are enqueued as
+        usual.
+
+        Args:
+            requests: (target, content) pairs
+            timeout: Seconds to wait for all replies (None waits indefinitely)
+
+        Returns:
+            The replies in the order of requests, None for each request that
+            timed out or was dropped
+
+        Example:
+            >>> plan, listing = await router.request_all(
+            ...     AgentRole.EM,
+            ...     [(AgentRole.PLANNER, "Plan the /health endpoint"), (AgentRole.DEV, "List files in src/")],
+            ...     timeout=300,
+            ... )
+        """
+
+        tasks = [asyncio.create_task(self.request(source, target, content)) for target, content in requests]
+        if not tasks:
+            return []
+
+        try:
+            await asyncio.wait(tasks, timeout=timeout)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return [None if task.cancelled() or task.exception() else task.result() for task in tasks]
+
+    async def reply(self, request: Message, source: AgentRole, content: str) -> bool:
+        """Answer a request, resolving the requester's pending request() call.
+
+        Raises:
+            ValueError: If the request came from a human rather than an agent
+
+        Returns:
+            Whether the reply was delivered (see route_message)
+        """
+
+        if not isinstance(request.source, AgentRole):
+            raise ValueError(f"Cannot reply to {request.source.value}, only to agents")
+
+        message = Message(
+            source=source,
+            target=request.source,
+            content=content,
+            correlation_id=request.correlation_id,
+            in_reply_to=request.id,
+        )
+
+        return await self.route_message(message)
+
+    @property
+    def pending_requests(self) -> int:
+        """Number of request() calls still waiting for a reply."""
+
+        return len(self._pending)
@@ -0,0 +1,119 @@
+import re
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+
+from agile_ai_sdk.core.config import ToolOutputPolicy
+
+_SPILL_ID = re.compile(r"^[0-9a-f]{8}$")
+
+
+class ToolOutputStore:
+    """Caps tool output to a head/tail window and keeps the full text on disk.
+
+    Spill files are named by a short id that is handed to the model in
+    place of the omitted lines, and read back a page at a time with read().
+
+    Example:
+        >>> store = ToolOutputStore(ToolOutputPolicy(head_lines=2, tail_lines=2), directory=Path("spill"))
+        >>> print(store.cap("\\n".join(f"line {i}" for i in range(1, 11))))
+        line 1
+        line 2
+        [... lines 3-8 of 10 omitted. Full output saved as 1f3a9c2e; call read_output("1f3a9c2e", start_line=3) to page through it]
+        line 9
+        line 10
+        >>> print(store.read("1f3a9c2e", start_line=3, num_lines=2))
+        >>> store.close()
+    """
+
+    def __init__(self, policy: ToolOutputPolicy, directory: Path | None = None):
+        self.policy = policy
+        self._directory = directory
+        # Created by the store, so removed by close()
+        self._temporary: Path | None = None
+
+    @property
+    def directory(self) -> Path:
+        """Where spill files go, a fresh temporary directory unless one was given."""
+
+        if self._directory is None:
+            self._directory = self._temporary = Path(tempfile.mkdtemp(prefix="agile-tool-output-"))
+        return self._directory
+
+    @directory.setter
+    def directory(self, directory: Path) -> None:
+        self._directory = directory
+
+    def cap(self, output: str) -> str:
+        """output as is if it fits the policy, else its head and tail around a pointer to the spill file."""
+
+        policy = self.policy
+        lines = output.splitlines(keepends=True)
+        if len(lines) <= policy.head_lines + policy.tail_lines and len(output) <= policy.max_chars:
+            return output
+
+        half = policy.max_chars // 2
+        head = "".join(lines[: policy.head_lines])[:half]
+        tail = "".join(lines[len(lines) - policy.tail_lines :])[-half:] if policy.tail_lines else ""
+        # A few long lines can be over max_chars without exceeding the line window
+        if len(head) + len(tail) >= len(output):
+            head, tail = output[:half], output[-half:]
+
+        # head and tail are a prefix and suffix of output; number the lines between them
+        head_end, tail_start = len(head), len(output) - len(tail)
+        first = output.count("\n", 0, head_end) + 1
+        last = output.count("\n", 0, tail_start) + (0 if output[tail_start - 1] == "\n" else 1)
+
+        spill_id = self._spill(output)
+        pointer = (
+            f"[... lines {first}-{last} of {len(lines)} omitted. Full output saved as {spill_id}; "
+            f'call read_output("{spill_id}", start_line={first}) to page through it]'
+        )
+        separator = "" if head.endswith("\n") else "\n"
+
+        return f"{head}{separator}{pointer}\n{tail}"
+
+    def read(self, spill_id: str, start_line: int = 1, num_lines: int | None = None) -> str:
+        """A page of a spilled output, starting at start_line (1-based).
+
+        The page is capped at the policy's max_chars.
+
+        Raises:
+            ValueError: If spill_id is malformed or start_line is out of range
+            FileNotFoundError: If there is no spilled output with that id
+        """
+
+        if not _SPILL_ID.match(spill_id):
+            raise ValueError(f"Invalid output id: {spill_id!r}")
+
+        lines = (self.directory / f"{spill_id}.txt").read_text().splitlines(keepends=True)
+        if not 1 <= start_line <= max(1, len(lines)):
+            raise ValueError(f"start_line must be between 1 and {len(lines)}")
+
+        end = min(len(lines), start_line - 1 + (num_lines or self.policy.page_lines))
+        page = "".join(lines[start_line - 1 : end])[: self.policy.max_chars]
+        more = f"; continue with start_line={end + 1}" if end < len(lines) else ""
+
+        return f"[{spill_id}: lines {start_line}-{end} of {len(lines)}{more}]\n{page}"
+
+    def close(self) -> None:
+        """Remove the temporary directory, if the store created one.
+
+        A directory that was given is left alone, e.g. the run's log
+        directory. Outputs spilled after this go to a new temporary directory.
+        """
+
+        if self._temporary is None:
+            return
+
+        shutil.rmtree(self._temporary, ignore_errors=True)
+        if self._directory == self._temporary:
+            self._directory = None
+        self._temporary = None
+
+    def _spill(self, output: str) -> str:
+        spill_id = uuid.uuid4().hex[:8]
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / f"{spill_id}.txt").write_text(output)
+        return spill_id
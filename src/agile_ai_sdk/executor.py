@@ -1,8 +1,9 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Protocol
 
-from agile_ai_sdk.models import EventHandler, EventType
+from agile_ai_sdk.core.dispatcher import EventPredicate
+from agile_ai_sdk.models import AgentRole, EventHandler, EventType, HumanRole
 
 
 class TaskExecutor(Protocol):
@@ -11,7 +12,7 @@ class TaskExecutor(Protocol):
     All executors must implement a message-based API with event handlers:
     - start(): Initialize agents and begin processing
     - drop_message(): Send messages to the system
-    - on(): Register handlers for specific event types
+    - on(): Register handlers filtered by event type, agent or predicate
     - on_any_event(): Register handlers for all events
     - stop(): Clean shutdown
 
@@ -39,13 +40,22 @@ class TaskExecutor(Protocol):
         """Send a message to the executor."""
         ...
 
-    def on(self, event_type: EventType) -> Callable[[EventHandler], EventHandler]:
-        """Decorator to register handler for specific event type.
+    def on(
+        self,
+        *event_types: EventType,
+        agents: Iterable[AgentRole | HumanRole] | None = None,
+        predicate: EventPredicate | None = None,
+    ) -> Callable[[EventHandler], EventHandler]:
+        """Decorator to register handler for specific event types.
 
         Example:
             >>> @executor.on(EventType.RUN_FINISHED)
             >>> async def on_complete(event):
             ...     print("Done!")
+            >>>
+            >>> @executor.on(EventType.TOOL_CALL_START, EventType.TOOL_CALL_END, agents={AgentRole.DEV})
+            >>> def count_tool_calls(event):
+            ...     metrics.increment(event.type)
         """
         ...
 
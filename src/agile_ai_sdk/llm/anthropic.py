@@ -1,6 +1,11 @@
 import os
+from typing import Literal
+
+from pydantic_ai.models.anthropic import AnthropicModelSettings
 
 MODEL_NAME = "anthropic:claude-sonnet-4-5"
+# Smaller, faster model for housekeeping such as summarizing conversation history
+CHEAP_MODEL_NAME = "anthropic:claude-haiku-4-5"
 
 
 def validate_api_key() -> None:
@@ -27,3 +32,42 @@ def get_model() -> str:
     """
     validate_api_key()
     return MODEL_NAME
+
+
+def get_cheap_model() -> str:
+    """Returns the cheaper Anthropic model name after validating API key.
+
+    Example:
+        >>> from agile_ai_sdk.llm import anthropic
+        >>> summarizer = Agent(anthropic.get_cheap_model())
+
+    Raises:
+        ValueError: If ANTHROPIC_API_KEY is not set
+    """
+    validate_api_key()
+    return CHEAP_MODEL_NAME
+
+
+def get_model_settings(prompt_cache: bool = True, cache_ttl: Literal["5m", "1h"] = "5m") -> AnthropicModelSettings:
+    """Returns settings that place prompt cache breakpoints.
+
+    Breakpoints go on the tool definitions, the system prompt and the last
+    message of every request. Each request's history is the previous one's
+    plus the new turn, so everything up to the previous breakpoint is read
+    from the cache and only the new turn is processed in full.
+
+    Example:
+        >>> agent = Agent(anthropic.get_model(), model_settings=anthropic.get_model_settings())
+
+    Args:
+        prompt_cache: Place cache breakpoints (False returns no settings)
+        cache_ttl: How long Anthropic keeps a cached prefix after its last use
+    """
+    if not prompt_cache:
+        return AnthropicModelSettings()
+
+    return AnthropicModelSettings(
+        anthropic_cache_tool_definitions=cache_ttl,
+        anthropic_cache_instructions=cache_ttl,
+        anthropic_cache_messages=cache_ttl,
+    )
@@ -1,3 +1,5 @@
+from pydantic_ai.settings import ModelSettings
+
 from agile_ai_sdk.llm import anthropic
 
 
@@ -14,3 +16,39 @@ def get_model() -> str:
         ValueError: If the default model's API key is not set
     """
     return anthropic.get_model()
+
+
+def get_cheap_model() -> str:
+    """Returns the default cheaper model, for work that doesn't need the main one.
+
+    Example:
+        >>> from agile_ai_sdk.llm import default
+        >>> summarizer = Agent(default.get_cheap_model())
+
+    Raises:
+        ValueError: If the default model's API key is not set
+    """
+    return anthropic.get_cheap_model()
+
+
+def get_model_settings(model: str | None = None, prompt_cache: bool = True) -> ModelSettings:
+    """Returns model settings for a model, chosen by its provider prefix.
+
+    Anthropic models get prompt cache breakpoints. Other providers, such as
+    OpenAI which caches long prefixes on its own, get no settings.
+
+    Example:
+        >>> agent = Agent(default.get_model(), model_settings=default.get_model_settings())
+        >>> agent = Agent(openai.get_model(), model_settings=default.get_model_settings(openai.get_model()))
+
+    Args:
+        model: Model name like "anthropic:claude-sonnet-4-5" (None = get_model())
+        prompt_cache: Place prompt cache breakpoints on the stable prefix of each request
+
+    Raises:
+        ValueError: If model is None and the default model's API key is not set
+    """
+    provider = (model or get_model()).split(":", 1)[0]
+    if provider == "anthropic":
+        return anthropic.get_model_settings(prompt_cache=prompt_cache)
+    return ModelSettings()
@@ -1,6 +1,8 @@
 import os
 
 MODEL_NAME = "openai:gpt-5.1"
+# Smaller, faster model for housekeeping such as summarizing conversation history
+CHEAP_MODEL_NAME = "openai:gpt-5-mini"
 
 
 def validate_api_key() -> None:
@@ -27,3 +29,17 @@ def get_model() -> str:
     """
     validate_api_key()
     return MODEL_NAME
+
+
+def get_cheap_model() -> str:
+    """Returns the cheaper OpenAI model name after validating API key.
+
+    Example:
+        >>> from agile_ai_sdk.llm import openai
+        >>> summarizer = Agent(openai.get_cheap_model())
+
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set
+    """
+    validate_api_key()
+    return CHEAP_MODEL_NAME
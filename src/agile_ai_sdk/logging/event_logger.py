@@ -73,6 +73,10 @@ class EventLogger:
     def log_event(self, event: Event) -> None:
         """Log an event to events.jsonl.
 
+        Each line carries the event's stream seq and monotonic_ns emission
+        stamp, so events can be ordered, deduplicated and timed without
+        parsing the wall-clock timestamp.
+
         Handler-compatible method that can be registered with:
         team.on_any_event(logger.log_event)
         """
@@ -90,6 +94,8 @@ class EventLogger:
         with open(self.events_file, "a") as f:
             event_data = {
                 "timestamp": timestamp_iso(),
+                "seq": event.seq,
+                "mono_ns": event.mono_ns,
                 "type": event.type.value,
                 "agent": event.agent.value,
                 "data": event.data,
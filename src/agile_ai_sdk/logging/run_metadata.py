@@ -1,5 +1,7 @@
 from typing import Any
 
+from pydantic_ai.usage import RunUsage
+
 from agile_ai_sdk.models import RunStatus
 from agile_ai_sdk.utils.time import timestamp_iso
 
@@ -26,6 +28,9 @@ class RunMetadata:
         self.duration_seconds: float | None = None
         self.status: RunStatus = RunStatus.RUNNING
         self.error: str | None = None
+        self.llm_calls_saved: int = 0
+        # Token usage across all agents; input_tokens includes cache reads and writes
+        self.usage = RunUsage()
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dictionary for JSON persistence."""
@@ -38,4 +43,10 @@ class RunMetadata:
             "duration_seconds": self.duration_seconds,
             "status": self.status.value,
             "error": self.error,
+            "llm_calls_saved": self.llm_calls_saved,
+            "llm_requests": self.usage.requests,
+            "input_tokens": self.usage.input_tokens,
+            "cache_read_tokens": self.usage.cache_read_tokens,
+            "cache_write_tokens": self.usage.cache_write_tokens,
+            "output_tokens": self.usage.output_tokens,
         }
@@ -1,11 +1,33 @@
 from agile_ai_sdk.models.base import BaseModel
-from agile_ai_sdk.models.enums import AgentRole, EventType, HumanRole, Priority, RunStatus
+from agile_ai_sdk.models.enums import (
+    AgentRole,
+    DispatchMode,
+    EventType,
+    HumanRole,
+    OverflowPolicy,
+    PoolPolicy,
+    Priority,
+    RoutingEventMode,
+    RunStatus,
+    Verbosity,
+)
 from agile_ai_sdk.models.event import Event
 from agile_ai_sdk.models.event_data import (
     AgentStatusData,
+    ContextCompactedData,
     ErrorData,
+    EventPayload,
     MessageReceivedData,
+    MessageRoutedData,
     MessageSentData,
+    RunFinishedData,
+    RunStartedData,
+    SupervisorData,
+    TextMessageData,
+    ToolCallArgsData,
+    ToolCallResultData,
+    ToolCallStartData,
+    UsageData,
 )
 from agile_ai_sdk.models.handler import EventHandler
 from agile_ai_sdk.models.message import Message
@@ -14,14 +36,30 @@ __all__ = [
     "AgentRole",
     "AgentStatusData",
     "BaseModel",
+    "ContextCompactedData",
+    "DispatchMode",
     "ErrorData",
     "Event",
     "EventHandler",
+    "EventPayload",
     "EventType",
     "HumanRole",
     "Message",
     "MessageReceivedData",
+    "MessageRoutedData",
     "MessageSentData",
+    "OverflowPolicy",
+    "PoolPolicy",
     "Priority",
+    "RoutingEventMode",
+    "RunFinishedData",
+    "RunStartedData",
     "RunStatus",
+    "SupervisorData",
+    "TextMessageData",
+    "ToolCallArgsData",
+    "ToolCallResultData",
+    "ToolCallStartData",
+    "UsageData",
+    "Verbosity",
 ]
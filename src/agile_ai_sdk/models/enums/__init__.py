@@ -1,13 +1,23 @@
 from agile_ai_sdk.models.enums.agent_role import AgentRole
+from agile_ai_sdk.models.enums.dispatch_mode import DispatchMode
 from agile_ai_sdk.models.enums.event_type import EventType
 from agile_ai_sdk.models.enums.human_role import HumanRole
+from agile_ai_sdk.models.enums.overflow_policy import OverflowPolicy
+from agile_ai_sdk.models.enums.pool_policy import PoolPolicy
 from agile_ai_sdk.models.enums.priority import Priority
+from agile_ai_sdk.models.enums.routing_event_mode import RoutingEventMode
 from agile_ai_sdk.models.enums.run_status import RunStatus
+from agile_ai_sdk.models.enums.verbosity import Verbosity
 
 __all__ = [
     "AgentRole",
+    "DispatchMode",
     "EventType",
     "HumanRole",
+    "OverflowPolicy",
+    "PoolPolicy",
     "Priority",
+    "RoutingEventMode",
     "RunStatus",
+    "Verbosity",
 ]
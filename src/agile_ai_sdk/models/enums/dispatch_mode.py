@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class DispatchMode(str, Enum):
+    """How an EventDispatcher runs handlers."""
+
+    SEQUENTIAL = "sequential"
+    CONCURRENT = "concurrent"
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class OverflowPolicy(str, Enum):
+    """What a bounded queue does when an item arrives and it is full."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    DISCONNECT = "disconnect"
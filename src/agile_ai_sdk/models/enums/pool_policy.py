@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class PoolPolicy(str, Enum):
+    """How an AgentPool spreads messages across its members."""
+
+    # Each message goes to the member with the fewest queued or in-progress messages
+    LEAST_LOADED = "least_loaded"
+
+    # Messages are dealt round-robin; idle members take queued work from busy ones
+    WORK_STEALING = "work_stealing"
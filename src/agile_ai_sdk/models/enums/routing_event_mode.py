@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class RoutingEventMode(str, Enum):
+    """Which events MessageRouter emits for a routed message."""
+
+    # A "sent" and a "received" event, each carrying the full content
+    FULL = "full"
+
+    # A "routed" event carrying the content once and a "received" event referring to it by message id
+    COMPACT = "compact"
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class Verbosity(str, Enum):
+    """Which events an executor's agents emit."""
+
+    # Run and step lifecycle, routed messages, agent output, tool calls and errors
+    NORMAL = "normal"
+
+    # Also progress chatter: received-batch summaries, each received message
+    # and per-command status lines
+    DEBUG = "debug"
@@ -1,15 +1,93 @@
 from typing import Any
 
-from pydantic import Field
+from pydantic import BaseModel as BasePydanticModel
+from pydantic import ModelWrapValidatorHandler, PrivateAttr, computed_field, model_validator
 
 from agile_ai_sdk.models.base import BaseModel
 from agile_ai_sdk.models.enums import AgentRole, EventType
 from agile_ai_sdk.models.enums.human_role import HumanRole
+from agile_ai_sdk.models.event_data import CUSTOM_PAYLOADS, PAYLOAD_ADAPTERS, EventPayload
 
 
 class Event(BaseModel):
-    """Event emitted during task execution."""
+    """Event emitted during task execution.
+
+    data may be given as a dict or as a typed payload model from event_data.
+    A payload model is kept as is and only dumped to a dict, without unset
+    optional fields, when data is first read or the event is serialized.
+    Treat events as immutable once emitted: data, the payload and the JSON
+    encoding are computed once and shared by every consumer.
+
+    Example:
+        >>> event = Event(type=EventType.RUN_STARTED, agent=AgentRole.EM, data=RunStartedData(task="Add /health"))
+        >>> event.payload.task
+        'Add /health'
+        >>> event.data
+        {'task': 'Add /health'}
+        >>> log_file.write(event.to_json_bytes() + b"\\n")
+    """
 
     type: EventType
     agent: AgentRole | HumanRole
-    data: dict[str, Any] = Field(default_factory=dict)
+    # Set for events emitted by an AgentPool member, e.g. "developer#2"
+    agent_id: str | None = None
+
+    # Assigned by EventStream.emit(): seq increases by one per event on that
+    # stream, mono_ns is time.monotonic_ns() at emission for interval math
+    seq: int | None = None
+    mono_ns: int | None = None
+
+    _data: dict[str, Any] | None = PrivateAttr(default=None)
+    _payload: EventPayload | None = PrivateAttr(default=None)
+    _json: bytes | None = PrivateAttr(default=None)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _keep_data(cls, value: Any, handler: ModelWrapValidatorHandler["Event"]) -> "Event":
+        data = None
+        if isinstance(value, dict) and "data" in value:
+            value = dict(value)
+            data = value.pop("data")
+
+        event = handler(value)
+        if isinstance(data, BasePydanticModel):
+            event._payload = data  # type: ignore[assignment]
+        elif data is not None:
+            event._data = dict(data)
+        return event
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def data(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = self._payload.model_dump(exclude_none=True) if self._payload is not None else {}
+        return self._data
+
+    @property
+    def payload(self) -> EventPayload | None:
+        """data as the payload model for this event type, validated once.
+
+        Returns None for event types without a payload model and for CUSTOM
+        events whose name has none.
+
+        Raises:
+            pydantic.ValidationError: If data does not match the payload model
+        """
+
+        if self._payload is None:
+            if self.type == EventType.CUSTOM:
+                model = CUSTOM_PAYLOADS.get(self.data.get("name"))  # type: ignore[arg-type]
+                self._payload = model.model_validate(self.data) if model else None  # type: ignore[assignment]
+            elif (adapter := PAYLOAD_ADAPTERS.get(self.type)) is not None:
+                self._payload = adapter.validate_python(self.data)
+        return self._payload
+
+    def to_json_bytes(self) -> bytes:
+        """The event encoded as JSON, computed on first use and cached.
+
+        Values in data that are not JSON-serializable are encoded with str().
+        """
+
+        if self._json is None:
+            self._json = self.__pydantic_serializer__.to_json(self, fallback=str)
+        return self._json
@@ -1,6 +1,12 @@
-from typing import Literal
+from typing import Annotated, Any, Literal
 
-from agile_ai_sdk.models.base import BaseModel
+from pydantic import BaseModel, Discriminator, Tag, TypeAdapter
+
+from agile_ai_sdk.models.enums import EventType
+
+# Payloads describe the shape of Event.data. They are plain pydantic models,
+# without the id and timestamps of agile_ai_sdk's BaseModel, since the Event
+# carrying them already has both.
 
 
 class MessageSentData(BaseModel):
@@ -13,21 +19,191 @@ class MessageSentData(BaseModel):
 
 
 class MessageReceivedData(BaseModel):
-    """Data payload when a message is received."""
+    """Data payload when a message is received.
+
+    In RoutingEventMode.COMPACT content is None; the "routed" event with the
+    same message_id carries it.
+    """
 
     action: Literal["received"] = "received"
     from_: str  # 'from' is a Python keyword
+    content: str | None = None
+    priority: str
+    message_id: str | None = None
+
+
+class MessageRoutedData(BaseModel):
+    """Data payload when a message is sent in RoutingEventMode.COMPACT.
+
+    The only event carrying the content; the "received" event that follows
+    once the message is delivered refers to it by message_id.
+    """
+
+    action: Literal["routed"] = "routed"
+    message_id: str
+    from_: str
+    to: str
     content: str
     priority: str
 
 
+class TextMessageData(BaseModel):
+    """Data payload for text an agent produces, e.g. an LLM response."""
+
+    message: str
+    message_ids: list[str] | None = None
+
+
 class AgentStatusData(BaseModel):
     """Data payload for agent status updates."""
 
     status: str
+    message_count: int | None = None
+    # Set when handling an interrupt: time from the interrupt being routed to handling starting
+    latency_ms: float | None = None
+
+
+class RunStartedData(BaseModel):
+    """Data payload when a run starts."""
+
+    task: str
+
+
+class RunFinishedData(BaseModel):
+    """Data payload when a run finishes."""
+
+    status: str
+    output: str | None = None
 
 
 class ErrorData(BaseModel):
     """Data payload for error events."""
 
     error: str
+    error_type: str | None = None
+
+
+class ToolCallStartData(BaseModel):
+    """Data payload when a tool call starts."""
+
+    tool: str
+    tool_id: str | None = None
+
+
+class ToolCallArgsData(BaseModel):
+    """Data payload carrying a tool call's arguments."""
+
+    tool_id: str | None = None
+    args: dict[str, Any] = {}
+
+
+class ToolCallResultData(BaseModel):
+    """Data payload carrying a tool call's result."""
+
+    tool_id: str | None = None
+    result: str = ""
+
+
+class SupervisorData(BaseModel):
+    """Data payload for a supervisor decision after an agent failed a batch.
+
+    restart: the batch is retried after delay seconds. quarantine: the batch
+    is set aside after attempt failures. escalate: the EM was told about it.
+    """
+
+    name: Literal["supervisor"] = "supervisor"
+    action: Literal["restart", "quarantine", "escalate"]
+    attempt: int
+    error: str
+    error_type: str
+    message_ids: list[str]
+    delay: float | None = None
+
+
+class ContextCompactedData(BaseModel):
+    """Data payload when an agent compacts its conversation history.
+
+    Older turns are either truncated and dropped, or replaced by a summary
+    (turns_summarized). Token counts are estimates (see
+    ContextPolicy.chars_per_token).
+    """
+
+    name: Literal["context"] = "context"
+    tokens_before: int
+    tokens_after: int
+    messages_before: int
+    messages_after: int
+    tool_outputs_truncated: int = 0
+    turns_dropped: int = 0
+    turns_summarized: int = 0
+
+
+class UsageData(BaseModel):
+    """Data payload with the token usage of an agent's LLM call.
+
+    input_tokens includes tokens read from and written to the prompt cache;
+    the rest were cache misses processed in full.
+    """
+
+    name: Literal["usage"] = "usage"
+    requests: int
+    input_tokens: int
+    cache_read_tokens: int
+    cache_write_tokens: int
+    output_tokens: int
+
+
+def _text_message_kind(data: Any) -> str:
+    action = data.get("action") if isinstance(data, dict) else getattr(data, "action", None)
+    return action if action in ("sent", "received", "routed") else "message"
+
+
+# TEXT_MESSAGE_CONTENT covers routed messages and agent output, told apart by "action"
+TextMessageContentData = Annotated[
+    Annotated[MessageSentData, Tag("sent")]
+    | Annotated[MessageReceivedData, Tag("received")]
+    | Annotated[MessageRoutedData, Tag("routed")]
+    | Annotated[TextMessageData, Tag("message")],
+    Discriminator(_text_message_kind),
+]
+
+# CUSTOM events are told apart by "name"; names not listed here are free-form
+CUSTOM_PAYLOADS: dict[str, type[BaseModel]] = {
+    "supervisor": SupervisorData,
+    "context": ContextCompactedData,
+    "usage": UsageData,
+}
+
+EventPayload = (
+    MessageSentData
+    | MessageReceivedData
+    | MessageRoutedData
+    | TextMessageData
+    | AgentStatusData
+    | RunStartedData
+    | RunFinishedData
+    | ErrorData
+    | ToolCallStartData
+    | ToolCallArgsData
+    | ToolCallResultData
+    | SupervisorData
+    | ContextCompactedData
+    | UsageData
+)
+
+# The event type is the discriminator for the payload union; CUSTOM goes by CUSTOM_PAYLOADS
+EVENT_PAYLOADS: dict[EventType, Any] = {
+    EventType.TEXT_MESSAGE_CONTENT: TextMessageContentData,
+    EventType.STEP_STARTED: AgentStatusData,
+    EventType.STEP_FINISHED: AgentStatusData,
+    EventType.RUN_STARTED: RunStartedData,
+    EventType.RUN_FINISHED: RunFinishedData,
+    EventType.RUN_ERROR: ErrorData,
+    EventType.TOOL_CALL_START: ToolCallStartData,
+    EventType.TOOL_CALL_ARGS: ToolCallArgsData,
+    EventType.TOOL_CALL_RESULT: ToolCallResultData,
+}
+
+PAYLOAD_ADAPTERS: dict[EventType, TypeAdapter[Any]] = {
+    event_type: TypeAdapter(payload) for event_type, payload in EVENT_PAYLOADS.items()
+}
@@ -3,9 +3,26 @@ from agile_ai_sdk.models.enums import AgentRole, HumanRole, Priority
 
 
 class Message(BaseModel):
-    """Message passed between agents or from humans."""
+    """Message passed between agents or from humans.
+
+    Requests made with MessageRouter.request() carry a correlation_id, and
+    the reply carries the same correlation_id plus the request's id in
+    in_reply_to.
+    """
 
     source: AgentRole | HumanRole
     target: AgentRole
     content: str
     priority: Priority = Priority.NORMAL
+    correlation_id: str | None = None
+    in_reply_to: str | None = None
+
+    # Assigned by MessageRouter.route_message(): time.monotonic_ns() when the
+    # message was routed, the clock of Event.mono_ns
+    routed_ns: int | None = None
+
+    @property
+    def is_request(self) -> bool:
+        """Whether the sender is waiting for a reply to this message."""
+
+        return self.correlation_id is not None and self.in_reply_to is None
@@ -2,16 +2,29 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
 from agile_ai_sdk.agents.code_act_agent import CodeActAgent
+from agile_ai_sdk.core.config import AgentConfig
+from agile_ai_sdk.core.dispatcher import EventDispatcher, EventPredicate
 from agile_ai_sdk.core.events import EventStream
 from agile_ai_sdk.core.router import MessageRouter
 from agile_ai_sdk.executor import TaskExecutor
 from agile_ai_sdk.logging import EventLogger
-from agile_ai_sdk.models import AgentRole, Event, EventHandler, EventType, HumanRole, RunStatus
+from agile_ai_sdk.models import (
+    AgentRole,
+    Event,
+    EventHandler,
+    EventType,
+    HumanRole,
+    OverflowPolicy,
+    RoutingEventMode,
+    RunStartedData,
+    RunStatus,
+    Verbosity,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,11 +55,44 @@ class SoloAgentHarness(TaskExecutor):
     def __init__(
         self,
         log_dir: str | Path | None = ".agile/runs",
+        agent_config: AgentConfig | None = None,
+        event_queue_maxsize: int = 0,
+        event_queue_overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        event_replay_size: int = 0,
+        routing_events: RoutingEventMode = RoutingEventMode.FULL,
+        verbosity: Verbosity = Verbosity.DEBUG,
+        dispatcher: EventDispatcher | None = None,
     ) -> None:
-        """Initialize the single-agent harness"""
+        """Initialize the single-agent harness
+
+        Args:
+            log_dir: Base directory for run logs, or None to disable logging
+            agent_config: AgentConfig for the CodeActAgent, e.g. inbox capacity limits
+            event_queue_maxsize: Capacity of the event queue feeding handlers (0 = unbounded)
+            event_queue_overflow: Backpressure on emit() when that queue is full
+            event_replay_size: Recent events kept for event_stream.subscribe(after_seq=...)
+                so reconnecting clients can catch up (0 = no replay)
+            routing_events: COMPACT puts each routed message's content in one
+                "routed" event rather than in both the "sent" and the
+                "received" event, and skips the per-message received dumps
+            verbosity: NORMAL skips debug chatter such as received-message dumps
+                and per-command status lines; those events are never constructed
+            dispatcher: Handler dispatcher, e.g. one in CONCURRENT mode with
+                timeouts (defaults to sequential dispatch)
+        """
+
+        self.agent_config = agent_config
+        self._event_queue_maxsize = event_queue_maxsize
+        self._event_queue_overflow = event_queue_overflow
+        self._event_replay_size = event_replay_size
+        self._routing_events = routing_events
+        self._verbosity = verbosity
 
-        self.event_stream = EventStream()
-        self.router = MessageRouter(self.event_stream)
+        # Handlers decide which events the stream delivers to the broadcaster
+        self._dispatcher = dispatcher or EventDispatcher()
+
+        self.event_stream = self._create_event_stream()
+        self.router = MessageRouter(self.event_stream, routing_events=self._routing_events)
         self.agent: CodeActAgent | None = None
 
         # State tracking for persistent sessions
@@ -55,8 +101,6 @@ class SoloAgentHarness(TaskExecutor):
         self._agent_tasks: list[asyncio.Task[Any]] = []
 
         # Handler registration system
-        self._event_handlers: dict[EventType, list[EventHandler]] = {}
-        self._on_any_handlers: list[EventHandler] = []
         self._broadcaster_task: asyncio.Task[Any] | None = None
 
         # Logging support
@@ -81,12 +125,16 @@ class SoloAgentHarness(TaskExecutor):
 
         # Recreate event stream if it was closed (after stop/restart)
         if self.event_stream._closed:
-            self.event_stream = EventStream()
-            self.router = MessageRouter(self.event_stream)
+            # Continue numbering so seq stays unique in this session's log
+            self.event_stream = self._create_event_stream(start_seq=self.event_stream.last_seq)
+            self.router = MessageRouter(self.event_stream, routing_events=self._routing_events)
 
         # Create CodeActAgent
-        self.agent = CodeActAgent(self.router, self.event_stream)
+        self.agent = CodeActAgent(self.router, self.event_stream, self.agent_config)
         self.agent.workspace_dir = workspace_dir
+        # Keep spilled tool output with the run's logs
+        if self._logger:
+            self.agent.tool_outputs.directory = self._logger.get_log_dir() / "tool_outputs"
 
         # Register agent with router (even though router won't be used for routing)
         self.router.register_agent(AgentRole.CODE_ACT, self.agent)
@@ -95,7 +143,7 @@ class SoloAgentHarness(TaskExecutor):
         self._agent_tasks = [self.agent.spawn()]
 
         # Spawn background broadcaster if handlers registered
-        if self._event_handlers or self._on_any_handlers:
+        if self._dispatcher.has_handlers:
             self._broadcaster_task = asyncio.create_task(self._broadcast_events())
 
         self._started = True
@@ -112,7 +160,7 @@ class SoloAgentHarness(TaskExecutor):
         # On first message, emit RUN_STARTED
         if not self._first_message_sent:
             await self.event_stream.emit(
-                Event(type=EventType.RUN_STARTED, agent=AgentRole.CODE_ACT, data={"task": content})
+                Event(type=EventType.RUN_STARTED, agent=AgentRole.CODE_ACT, data=RunStartedData(task=content))
             )
             self._first_message_sent = True
 
@@ -127,6 +175,9 @@ class SoloAgentHarness(TaskExecutor):
         # Finalize logger before teardown
         if self._logger:
             status = RunStatus.ERROR if self._had_error else RunStatus.COMPLETED
+            if self.agent is not None:
+                self._logger.metadata.llm_calls_saved = self.agent.llm_calls_saved
+                self._logger.metadata.usage = self.agent.usage
             self._logger.finalize(status=status)
 
         # Cancel broadcaster task if running
@@ -137,6 +188,9 @@ class SoloAgentHarness(TaskExecutor):
             except (asyncio.CancelledError, asyncio.TimeoutError):
                 pass  # Expected during shutdown
 
+        # Let concurrent handler workers drain what they already received
+        await self._dispatcher.close()
+
         await self._teardown(self._agent_tasks)
         self._started = False
         self._first_message_sent = False
@@ -144,11 +198,26 @@ class SoloAgentHarness(TaskExecutor):
         self._broadcaster_task = None
         self.agent = None
 
-    def on(self, event_type: EventType) -> Callable[[EventHandler], EventHandler]:
-        """Decorator to register handler for specific event type.
-
-        Handlers are called sequentially in registration order when events occur.
-        Both sync and async handlers are supported.
+    def on(
+        self,
+        *event_types: EventType,
+        agents: Iterable[AgentRole | HumanRole] | None = None,
+        predicate: EventPredicate | None = None,
+        timeout: float | None = None,
+        max_failures: int | None = None,
+    ) -> Callable[[EventHandler], EventHandler]:
+        """Decorator to register handler for specific event types.
+
+        The handler only receives events matching every filter given: one of
+        the event types (all types if none are given), one of the agents, and
+        the predicate. Filters are compiled into a dispatch table at
+        registration, so events nobody filtered for cost nothing per handler.
+
+        Handlers are called in registration order when events occur, either
+        sequentially or, with a CONCURRENT dispatcher, each on its own worker.
+        Both sync and async handlers are supported. timeout and max_failures
+        override the dispatcher's handler_timeout and max_failures for this
+        handler.
 
         Example:
             >>> harness = SoloAgentHarness()
@@ -159,12 +228,29 @@ class SoloAgentHarness(TaskExecutor):
             >>> @harness.on(EventType.TOOL_CALL_START)
             >>> def log_tool(event):
             ...     logger.info(f"Tool: {event.data['tool_name']}")
+            >>>
+            >>> @harness.on(EventType.RUN_STARTED, EventType.RUN_FINISHED, EventType.RUN_ERROR)
+            >>> def export_metrics(event):
+            ...     metrics.record(event)
+            >>>
+            >>> @harness.on(agents={AgentRole.CODE_ACT}, predicate=lambda e: "error" in e.data)
+            >>> def agent_errors(event):
+            ...     alert(event)
+            >>>
+            >>> @harness.on(EventType.RUN_FINISHED, timeout=10.0, max_failures=3)
+            >>> async def post_webhook(event):
+            ...     await client.post(url, json=event.data)
         """
 
         def decorator(handler: EventHandler) -> EventHandler:
-            if event_type not in self._event_handlers:
-                self._event_handlers[event_type] = []
-            self._event_handlers[event_type].append(handler)
+            self._dispatcher.add_handler(
+                handler,
+                event_types=event_types or None,
+                agents=agents,
+                predicate=predicate,
+                timeout=timeout,
+                max_failures=max_failures,
+            )
             return handler
 
         return decorator
@@ -186,7 +272,7 @@ class SoloAgentHarness(TaskExecutor):
             ...     logger.info(f"Event: {event.type}", extra=event.data)
         """
 
-        self._on_any_handlers.append(handler)
+        self._dispatcher.add_handler(handler)
         return handler
 
     async def _broadcast_events(self) -> None:
@@ -210,44 +296,32 @@ class SoloAgentHarness(TaskExecutor):
             logger.error(f"Broadcaster task failed: {e}", exc_info=True)
 
     async def _dispatch_to_handlers(self, event: Event) -> None:
-        """Dispatch event to all registered handlers.
+        """Dispatch event to the handlers interested in it.
 
-        Handlers are executed sequentially. If a handler raises an exception,
-        it's logged but other handlers still execute.
+        See EventDispatcher for sequential vs concurrent execution. If a
+        handler raises an exception, it's logged but other handlers still execute.
         """
 
         # Track errors for logger finalization
         if event.type == EventType.RUN_ERROR:
             self._had_error = True
 
-        # Dispatch to specific event type handlers
-        if event.type in self._event_handlers:
-            for handler in self._event_handlers[event.type]:
-                await self._execute_handler(handler, event)
-
-        # Dispatch to on_any_event handlers
-        for handler in self._on_any_handlers:
-            await self._execute_handler(handler, event)
+        await self._dispatcher.dispatch(event)
 
-    async def _execute_handler(self, handler: EventHandler, event: Event) -> None:
-        """Execute a single handler with error handling.
+    def _create_event_stream(self, start_seq: int = 0) -> EventStream:
+        """Create an event stream with the configured queue limits and replay buffer.
 
-        Supports both sync and async handlers. Errors are logged but don't
-        propagate to prevent one handler from breaking others.
+        Events no handler or subscriber wants are never built or queued.
         """
 
-        try:
-            if asyncio.iscoroutinefunction(handler):
-                await handler(event)
-            else:
-                handler(event)
-        except Exception as e:
-            handler_name = getattr(handler, "__name__", repr(handler))
-            logger.error(
-                f"Handler {handler_name} failed for event {event.type}: {e}",
-                exc_info=True,
-                extra={"event_type": event.type, "handler": handler_name},
-            )
+        return EventStream(
+            maxsize=self._event_queue_maxsize,
+            overflow=self._event_queue_overflow,
+            replay_size=self._event_replay_size,
+            start_seq=start_seq,
+            verbosity=self._verbosity,
+            primary_interest=self._dispatcher.wants,
+        )
 
     def get_log_dir(self) -> Path | None:
         """Get the log directory path for this agent's run."""
@@ -1,16 +1,32 @@
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
+from pydantic_ai.usage import RunUsage
+
 from agile_ai_sdk.agents import Developer, EngineeringManager, Planner, SeniorReviewer
 from agile_ai_sdk.agents.base import BaseAgent
+from agile_ai_sdk.core.config import AgentConfig
+from agile_ai_sdk.core.dispatcher import EventDispatcher, EventPredicate
 from agile_ai_sdk.core.events import EventStream
 from agile_ai_sdk.core.router import MessageRouter
 from agile_ai_sdk.executor import TaskExecutor
 from agile_ai_sdk.logging import EventLogger
-from agile_ai_sdk.models import AgentRole, Event, EventHandler, EventType, HumanRole, RunStatus
+from agile_ai_sdk.models import (
+    AgentRole,
+    Event,
+    EventHandler,
+    EventType,
+    HumanRole,
+    OverflowPolicy,
+    PoolPolicy,
+    RoutingEventMode,
+    RunStartedData,
+    RunStatus,
+    Verbosity,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,14 +69,60 @@ class AgentTeam(TaskExecutor):
         >>> team = AgentTeam(agents=[AgentRole.EM, AgentRole.DEV])
         >>> await team.start()
         >>> await team.drop_message("Quick fix")
+
+        Bounded queues for long-lived sessions:
+        >>> team = AgentTeam(
+        ...     event_queue_maxsize=10_000,
+        ...     event_queue_overflow=OverflowPolicy.DROP_OLDEST,
+        ...     agent_configs={AgentRole.DEV: AgentConfig(inbox_maxsize=50)},
+        ... )
+        >>> team.event_stream.stats.dropped
+        0
+
+        Production logging, without debug chatter:
+        >>> team = AgentTeam(verbosity=Verbosity.NORMAL)
+
+        Three developers sharing the coding work:
+        >>> team = AgentTeam(pool_sizes={AgentRole.DEV: 3}, pool_policy=PoolPolicy.WORK_STEALING)
+        >>> len(team.pool_members[AgentRole.DEV])
+        3
     """
 
     def __init__(
         self,
         agents: list[AgentRole] | None = None,
         log_dir: str | Path | None = ".agile/runs",
+        agent_configs: dict[AgentRole, AgentConfig] | None = None,
+        event_queue_maxsize: int = 0,
+        event_queue_overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        event_replay_size: int = 0,
+        routing_events: RoutingEventMode = RoutingEventMode.FULL,
+        verbosity: Verbosity = Verbosity.DEBUG,
+        pool_sizes: dict[AgentRole, int] | None = None,
+        pool_policy: PoolPolicy = PoolPolicy.LEAST_LOADED,
+        dispatcher: EventDispatcher | None = None,
     ):
-        """Initialize the agent team."""
+        """Initialize the agent team.
+
+        Args:
+            agents: Roles to run (defaults to EM, Planner, Developer, Senior Reviewer)
+            log_dir: Base directory for run logs, or None to disable logging
+            agent_configs: Per-role AgentConfig, e.g. inbox capacity limits
+            event_queue_maxsize: Capacity of the event queue feeding handlers (0 = unbounded)
+            event_queue_overflow: Backpressure on emit() when that queue is full
+            event_replay_size: Recent events kept for event_stream.subscribe(after_seq=...)
+                so reconnecting clients can catch up (0 = no replay)
+            routing_events: COMPACT puts each routed message's content in one
+                "routed" event rather than in both the "sent" and the
+                "received" event, and skips the per-message received dumps
+            verbosity: NORMAL skips debug chatter such as received-message dumps
+                and per-command status lines; those events are never constructed
+            pool_sizes: Number of instances to run for a role, e.g. {AgentRole.DEV: 3}.
+                Each keeps its own conversation history. Not supported for the EM.
+            pool_policy: How messages to a pooled role are spread across its members
+            dispatcher: Handler dispatcher, e.g. one in CONCURRENT mode with
+                timeouts (defaults to sequential dispatch)
+        """
 
         self.enabled_agents = agents or [
             AgentRole.EM,
@@ -68,13 +130,29 @@ class AgentTeam(TaskExecutor):
             AgentRole.DEV,
             AgentRole.SENIOR_REVIEWER,
         ]
-
-        # Initialize core components
-        self.event_stream = EventStream()
-        self.router = MessageRouter(self.event_stream)
-
-        # Initialize agents
+        self.agent_configs = agent_configs or {}
+        self._event_queue_maxsize = event_queue_maxsize
+        self._event_queue_overflow = event_queue_overflow
+        self._event_replay_size = event_replay_size
+        self._routing_events = routing_events
+        self._verbosity = verbosity
+        self.pool_sizes = pool_sizes or {}
+        self._pool_policy = pool_policy
+
+        if self.pool_sizes.get(AgentRole.EM, 1) != 1:
+            raise ValueError("The Engineering Manager cannot be pooled")
+        if any(size < 1 for size in self.pool_sizes.values()):
+            raise ValueError("Pool sizes must be at least 1")
+
+        # Initialize core components; handlers decide which events the
+        # stream delivers to the broadcaster
+        self._dispatcher = dispatcher or EventDispatcher()
+        self.event_stream = self._create_event_stream()
+        self.router = MessageRouter(self.event_stream, routing_events=self._routing_events)
+
+        # Initialize agents; agents holds the first member of each pool
         self.agents: dict[AgentRole, BaseAgent] = {}
+        self.pool_members: dict[AgentRole, list[BaseAgent]] = {}
         self._init_agents()
 
         # State tracking for persistent sessions
@@ -83,8 +161,6 @@ class AgentTeam(TaskExecutor):
         self._agent_tasks: list[asyncio.Task[Any]] = []
 
         # Handler registration system
-        self._event_handlers: dict[EventType, list[EventHandler]] = {}
-        self._on_any_handlers: list[EventHandler] = []
         self._broadcaster_task: asyncio.Task[Any] | None = None
 
         # Logging support
@@ -102,9 +178,24 @@ class AgentTeam(TaskExecutor):
         """Initialize enabled agents."""
 
         for role in self.enabled_agents:
-            agent = self._create_agent(role)
-            self.agents[role] = agent
-            self.router.register_agent(role, agent)
+            members = [self._create_agent(role) for _ in range(self.pool_sizes.get(role, 1))]
+            self.agents[role] = members[0]
+            self.pool_members[role] = members
+            self._register(role)
+
+    def _register(self, role: AgentRole) -> None:
+        """Register a role's agent, or its pool if it has several members, with the router."""
+
+        members = self.pool_members[role]
+        if len(members) > 1:
+            self.router.register_pool(role, members, self._pool_policy)
+        else:
+            self.router.register_agent(role, members[0])
+
+    def _all_agents(self) -> list[BaseAgent]:
+        """Every agent instance, including all pool members."""
+
+        return [agent for members in self.pool_members.values() for agent in members]
 
     def _create_agent(self, role: AgentRole) -> BaseAgent:
         """Factory method to create agents by role."""
@@ -120,7 +211,22 @@ class AgentTeam(TaskExecutor):
         if not agent_class:
             raise ValueError(f"Unknown agent role: {role}")
 
-        return agent_class(self.router, self.event_stream)
+        return agent_class(self.router, self.event_stream, self.agent_configs.get(role))
+
+    def _create_event_stream(self, start_seq: int = 0) -> EventStream:
+        """Create an event stream with the configured queue limits and replay buffer.
+
+        Events no handler or subscriber wants are never built or queued.
+        """
+
+        return EventStream(
+            maxsize=self._event_queue_maxsize,
+            overflow=self._event_queue_overflow,
+            replay_size=self._event_replay_size,
+            start_seq=start_seq,
+            verbosity=self._verbosity,
+            primary_interest=self._dispatcher.wants,
+        )
 
     async def start(self, workspace_dir: Path | None = None) -> None:
         """Start the agent team and begin processing loop.
@@ -141,23 +247,27 @@ class AgentTeam(TaskExecutor):
 
         # Recreate event stream if it was closed (after stop/restart)
         if self.event_stream._closed:
-            self.event_stream = EventStream()
-            self.router = MessageRouter(self.event_stream)
+            # Continue numbering so seq stays unique in this session's log
+            self.event_stream = self._create_event_stream(start_seq=self.event_stream.last_seq)
+            self.router = MessageRouter(self.event_stream, routing_events=self._routing_events)
             # Re-register agents with new router
-            for role, agent in self.agents.items():
+            for agent in self._all_agents():
                 agent.router = self.router
                 agent.event_stream = self.event_stream
-                self.router.register_agent(role, agent)
+            for role in self.pool_members:
+                self._register(role)
 
-        # Set workspace on all agents
-        for agent in self.agents.values():
+        # Set workspace on all agents, and keep spilled tool output with the run's logs
+        for agent in self._all_agents():
             agent.workspace_dir = workspace_dir
+            if self._logger:
+                agent.tool_outputs.directory = self._logger.get_log_dir() / "tool_outputs"
 
         # Spawn agent run loops
-        self._agent_tasks = [agent.spawn() for agent in self.agents.values()]
+        self._agent_tasks = [agent.spawn() for agent in self._all_agents()]
 
         # Spawn background broadcaster if handlers registered
-        if self._event_handlers or self._on_any_handlers:
+        if self._dispatcher.has_handlers:
             self._broadcaster_task = asyncio.create_task(self._broadcast_events())
 
         self._started = True
@@ -170,7 +280,9 @@ class AgentTeam(TaskExecutor):
 
         # On first message, emit RUN_STARTED
         if not self._first_message_sent:
-            await self.event_stream.emit(Event(type=EventType.RUN_STARTED, agent=AgentRole.EM, data={"task": content}))
+            await self.event_stream.emit(
+                Event(type=EventType.RUN_STARTED, agent=AgentRole.EM, data=RunStartedData(task=content))
+            )
             self._first_message_sent = True
 
         # Route all messages to EM
@@ -185,6 +297,8 @@ class AgentTeam(TaskExecutor):
         # Finalize logger before teardown
         if self._logger:
             status = RunStatus.ERROR if self._had_error else RunStatus.COMPLETED
+            self._logger.metadata.llm_calls_saved = self.llm_calls_saved
+            self._logger.metadata.usage = self.usage
             self._logger.finalize(status=status)
 
         # Cancel broadcaster task if running
@@ -195,17 +309,35 @@ class AgentTeam(TaskExecutor):
             except (asyncio.CancelledError, asyncio.TimeoutError):
                 pass  # Expected during shutdown
 
+        # Let concurrent handler workers drain what they already received
+        await self._dispatcher.close()
+
         await self._teardown(self._agent_tasks)
         self._started = False
         self._first_message_sent = False
         self._agent_tasks = []
         self._broadcaster_task = None
 
-    def on(self, event_type: EventType) -> Callable[[EventHandler], EventHandler]:
-        """Decorator to register handler for specific event type.
-
-        Handlers are called sequentially in registration order when events occur.
-        Both sync and async handlers are supported.
+    def on(
+        self,
+        *event_types: EventType,
+        agents: Iterable[AgentRole | HumanRole] | None = None,
+        predicate: EventPredicate | None = None,
+        timeout: float | None = None,
+        max_failures: int | None = None,
+    ) -> Callable[[EventHandler], EventHandler]:
+        """Decorator to register handler for specific event types.
+
+        The handler only receives events matching every filter given: one of
+        the event types (all types if none are given), one of the agents, and
+        the predicate. Filters are compiled into a dispatch table at
+        registration, so events nobody filtered for cost nothing per handler.
+
+        Handlers are called in registration order when events occur, either
+        sequentially or, with a CONCURRENT dispatcher, each on its own worker.
+        Both sync and async handlers are supported. timeout and max_failures
+        override the dispatcher's handler_timeout and max_failures for this
+        handler.
 
         Example:
             >>> team = AgentTeam()
@@ -216,12 +348,29 @@ class AgentTeam(TaskExecutor):
             >>> @team.on(EventType.TOOL_CALL_START)
             >>> def log_tool(event):
             ...     logger.info(f"Tool: {event.data['tool_name']}")
+            >>>
+            >>> @team.on(EventType.RUN_STARTED, EventType.RUN_FINISHED, EventType.RUN_ERROR)
+            >>> def export_metrics(event):
+            ...     metrics.record(event)
+            >>>
+            >>> @team.on(agents={AgentRole.DEV}, predicate=lambda e: "error" in e.data)
+            >>> def dev_errors(event):
+            ...     alert(event)
+            >>>
+            >>> @team.on(EventType.RUN_FINISHED, timeout=10.0, max_failures=3)
+            >>> async def post_webhook(event):
+            ...     await client.post(url, json=event.data)
         """
 
         def decorator(handler: EventHandler) -> EventHandler:
-            if event_type not in self._event_handlers:
-                self._event_handlers[event_type] = []
-            self._event_handlers[event_type].append(handler)
+            self._dispatcher.add_handler(
+                handler,
+                event_types=event_types or None,
+                agents=agents,
+                predicate=predicate,
+                timeout=timeout,
+                max_failures=max_failures,
+            )
             return handler
 
         return decorator
@@ -243,7 +392,7 @@ class AgentTeam(TaskExecutor):
             ...     logger.info(f"Event: {event.type}", extra=event.data)
         """
 
-        self._on_any_handlers.append(handler)
+        self._dispatcher.add_handler(handler)
         return handler
 
     async def _broadcast_events(self) -> None:
@@ -267,44 +416,35 @@ class AgentTeam(TaskExecutor):
             logger.error(f"Broadcaster task failed: {e}", exc_info=True)
 
     async def _dispatch_to_handlers(self, event: Event) -> None:
-        """Dispatch event to all registered handlers.
+        """Dispatch event to the handlers interested in it.
 
-        Handlers are executed sequentially. If a handler raises an exception,
-        it's logged but other handlers still execute.
+        See EventDispatcher for sequential vs concurrent execution. If a
+        handler raises an exception, it's logged but other handlers still execute.
         """
 
         # Track errors for logger finalization
         if event.type == EventType.RUN_ERROR:
             self._had_error = True
 
-        # Dispatch to specific event type handlers
-        if event.type in self._event_handlers:
-            for handler in self._event_handlers[event.type]:
-                await self._execute_handler(handler, event)
+        await self._dispatcher.dispatch(event)
 
-        # Dispatch to on_any_event handlers
-        for handler in self._on_any_handlers:
-            await self._execute_handler(handler, event)
+    @property
+    def llm_calls_saved(self) -> int:
+        """LLM calls avoided across all agents by coalescing message bursts.
 
-    async def _execute_handler(self, handler: EventHandler, event: Event) -> None:
-        """Execute a single handler with error handling.
-
-        Supports both sync and async handlers. Errors are logged but don't
-        propagate to prevent one handler from breaking others.
+        See AgentConfig.coalesce_min_wait.
         """
 
-        try:
-            if asyncio.iscoroutinefunction(handler):
-                await handler(event)
-            else:
-                handler(event)
-        except Exception as e:
-            handler_name = getattr(handler, "__name__", repr(handler))
-            logger.error(
-                f"Handler {handler_name} failed for event {event.type}: {e}",
-                exc_info=True,
-                extra={"event_type": event.type, "handler": handler_name},
-            )
+        return sum(agent.llm_calls_saved for agent in self._all_agents())
+
+    @property
+    def usage(self) -> RunUsage:
+        """Tokens used by LLM calls across all agents, including prompt cache reads and writes."""
+
+        total = RunUsage()
+        for agent in self._all_agents():
+            total += agent.usage
+        return total
 
     def get_log_dir(self) -> Path | None:
         """Get the log directory path for this team's run."""
@@ -316,7 +456,7 @@ class AgentTeam(TaskExecutor):
 
         self.event_stream.close()
 
-        for agent in self.agents.values():
+        for agent in self._all_agents():
             agent.stop()
 
         try:
@@ -1,10 +1,13 @@
 from agile_ai_sdk.lib.logger import logger
 from agile_ai_sdk.utils.printer import print_event
+from agile_ai_sdk.utils.shell import ShellSession, run_shell
 from agile_ai_sdk.utils.time import timestamp_compact, timestamp_iso, timestamp_readable, utcnow
 
 __all__ = [
     "logger",
     "print_event",
+    "run_shell",
+    "ShellSession",
     "utcnow",
     "timestamp_iso",
     "timestamp_compact",
@@ -50,6 +50,8 @@ def print_event(event: Event) -> None:
     """
     agent = event.agent.value if hasattr(event.agent, "value") else str(event.agent)
     agent_color = _get_agent_color(agent)
+    # Pool members share a role and its color, and are told apart by id
+    agent = event.agent_id or agent
 
     if event.type == EventType.RUN_STARTED:
         task = event.data.get("task", "")
@@ -72,7 +74,13 @@ def print_event(event: Event) -> None:
             print(f"{agent_color}{agent}{RESET} → {to_color}{to}{RESET}")
             print()
 
-        elif action == "received":
+        elif action == "routed":
+            to = event.data.get("to", "unknown")
+            content = event.data.get("content", "")
+            _print_box(f"{agent} → {to}\n\n{content}", _get_agent_color(to))
+
+        # A compact received echo has no content; the routed event showed it
+        elif action == "received" and event.data.get("content") is not None:
             from_ = event.data.get("from_", event.data.get("from", "unknown"))
             content = event.data.get("content", "")
             from_color = _get_agent_color(from_)
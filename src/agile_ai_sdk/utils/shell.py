@@ -0,0 +1,242 @@
+import asyncio
+import os
+import shlex
+import shutil
+import signal
+import uuid
+from pathlib import Path
+
+# Bytes read from the session's pipes at a time
+_CHUNK_SIZE = 65536
+
+
+async def run_shell(command: str, cwd: str | Path, timeout: float) -> tuple[bytes, bytes, int | None]:
+    """Run a shell command and collect its output.
+
+    The command runs in its own process group, which is killed if the
+    command times out or the calling task is cancelled, e.g. by an agent
+    interrupt. Killing only the shell would leave commands it forked
+    running and holding the output pipes open.
+
+    Returns:
+        (stdout, stderr, exit code)
+
+    Raises:
+        asyncio.TimeoutError: If the command did not finish within timeout
+
+    Example:
+        >>> stdout, stderr, code = await run_shell("echo hi", cwd=".", timeout=30.0)
+        >>> stdout, code
+        (b'hi\\n', 0)
+    """
+
+    process = await asyncio.create_subprocess_shell(
+        command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=str(cwd),
+        start_new_session=True,
+    )
+
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except BaseException:
+        _kill_process_group(process)
+        await process.wait()
+        raise
+
+    return stdout, stderr, process.returncode
+
+
+def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass  # Already exited
+
+
+class ShellSession:
+    """A long-lived shell that runs commands one after another.
+
+    cwd, environment variables and an activated virtualenv carry over from
+    one command to the next, and no process is started per command. Each
+    command runs through eval with stdin from /dev/null, followed by a
+    marker line with a random token on stdout and stderr that frames its
+    output and carries its exit code.
+
+    Output that arrives after a marker line, e.g. from a background job, is
+    kept and returned with the next command's output.
+
+    A command that times out or is cancelled kills the session's process
+    group, as with run_shell(), and the next command starts a new session
+    in the original cwd. So does a command that exits the shell, or one
+    whose marker line cannot be parsed.
+
+    Example:
+        >>> session = ShellSession(cwd=".")
+        >>> await session.run("cd src && export DEBUG=1", timeout=30.0)
+        (b'', b'', 0)
+        >>> stdout, stderr, code = await session.run("pwd; echo $DEBUG", timeout=30.0)
+        >>> stdout
+        b'/path/to/src\\n1\\n'
+        >>> await session.close()
+    """
+
+    def __init__(self, cwd: str | Path, shell: str | None = None):
+        self.cwd = Path(cwd)
+        self.shell = shell or shutil.which("bash") or "/bin/sh"
+        self._process: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+        # Bytes read past the last marker line on stdout and stderr
+        self._stdout_buffer = bytearray()
+        self._stderr_buffer = bytearray()
+        # Sessions started, i.e. 1 + restarts after timeouts and exits
+        self.starts: int = 0
+
+    @property
+    def alive(self) -> bool:
+        """Whether the shell process is running and has not been killed."""
+
+        process = self._process
+        if process is None or process.stdin is None:
+            return False
+        # kill() closes stdin, and the shell may not have been reaped yet
+        return process.returncode is None and not process.stdin.is_closing()
+
+    async def run(self, command: str, timeout: float) -> tuple[bytes, bytes, int | None]:
+        """Run a command in the session and collect its output.
+
+        Commands are run one at a time, in the order they were called.
+
+        Returns:
+            (stdout, stderr, exit code)
+
+        Raises:
+            asyncio.TimeoutError: If the command did not finish within timeout
+        """
+
+        async with self._lock:
+            if not self.alive:
+                await self.close()  # Clean up after a shell that exited
+                await self._start()
+            process = self._process
+            assert process is not None and process.stdin is not None
+
+            marker = f"__agile_{uuid.uuid4().hex}__".encode()
+            process.stdin.write(
+                b"eval " + shlex.quote(command).encode() + b" </dev/null\n"
+                b"printf '\\n%s %d\\n' " + marker + b" $?\n"
+                b"printf '\\n%s\\n' " + marker + b" >&2\n"
+            )
+
+            try:
+                await process.stdin.drain()
+                (stdout, trailer), (stderr, _) = await asyncio.wait_for(
+                    asyncio.gather(
+                        self._read_frame(process.stdout, self._stdout_buffer, marker),
+                        self._read_frame(process.stderr, self._stderr_buffer, marker),
+                    ),
+                    timeout=timeout,
+                )
+            except BaseException:
+                await self.close()
+                raise
+
+            if trailer is None:
+                # The command exited the shell before the marker was printed
+                code = await process.wait()
+                await self.close()
+                return stdout, stderr, code
+
+            try:
+                return stdout, stderr, int(trailer)
+            except ValueError:
+                # The session's output can no longer be framed reliably
+                await self.close()
+                return stdout, stderr, None
+
+    async def close(self) -> None:
+        """Kill the shell and anything it started, and wait for it to exit.
+
+        The next run() starts a new session.
+        """
+
+        process, self._process = self._process, None
+        self._stdout_buffer.clear()
+        self._stderr_buffer.clear()
+        if process is None:
+            return
+
+        if process.returncode is None:
+            _kill_process_group(process)
+        assert process.stdin is not None and process.stdout is not None and process.stderr is not None
+        process.stdin.close()
+        await process.wait()
+
+        # Read to EOF so the pipes are closed too; a process that left the group could hold them open
+        try:
+            await asyncio.wait_for(asyncio.gather(process.stdout.read(), process.stderr.read()), timeout=1.0)
+        except asyncio.TimeoutError:
+            pass
+
+    def kill(self) -> None:
+        """Kill the shell and anything it started without waiting, e.g. from synchronous code.
+
+        close() still has to be awaited to reap the shell and close its
+        pipes; the next run() does so too.
+        """
+
+        if self.alive:
+            assert self._process is not None and self._process.stdin is not None
+            _kill_process_group(self._process)
+            self._process.stdin.close()
+
+    async def _start(self) -> None:
+        self._process = await asyncio.create_subprocess_exec(
+            self.shell,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(self.cwd),
+            start_new_session=True,
+        )
+        self.starts += 1
+
+    @staticmethod
+    async def _read_frame(
+        stream: asyncio.StreamReader | None, buffer: bytearray, marker: bytes
+    ) -> tuple[bytes, bytes | None]:
+        """Read up to the end of the marker line.
+
+        buffer starts with what was read past the previous marker line, and
+        is left holding what follows this one.
+
+        Returns:
+            (output before the marker, text after the marker on its line, or
+            None if the stream ended first)
+        """
+
+        assert stream is not None
+        boundary = b"\n" + marker
+        start = 0
+
+        while True:
+            index = buffer.find(boundary, start)
+            if index == -1:
+                # Only new bytes, and a boundary straddling the previous chunk, need searching
+                start = max(0, len(buffer) - len(boundary))
+            else:
+                start = index
+                # The marker line ends with a newline, possibly in a later chunk
+                end = buffer.find(b"\n", index + len(boundary))
+                if end != -1:
+                    output, trailer = bytes(buffer[:index]), bytes(buffer[index + len(boundary) : end]).strip()
+                    del buffer[: end + 1]
+                    return output, trailer
+
+            chunk = await stream.read(_CHUNK_SIZE)
+            if not chunk:
+                output = bytes(buffer)
+                buffer.clear()
+                return output, None
+            buffer += chunk
@@ -48,6 +48,7 @@ class EventFormatter:
             EventType.TOOL_CALL_START: cls._format_tool_call_start,
             EventType.TOOL_CALL_ARGS: cls._format_tool_call_args,
             EventType.TOOL_CALL_RESULT: cls._format_tool_call_result,
+            EventType.CUSTOM: cls._format_custom,
         }
 
         handler = handlers.get(event.type)
@@ -125,10 +126,13 @@ class EventFormatter:
     def _format_text_message(cls, event: Event) -> FormattedMessage | None:
         action = event.data.get("action")
 
-        if action == "sent":
+        # Shown once: a compact received echo has no content, the routed event has it
+        if action == "sent" or (action == "received" and event.data.get("content") is None):
             return None
         elif action == "received":
             return cls._format_received_message(event)
+        elif action == "routed":
+            return cls._format_routed_message(event)
         else:
             return cls._format_agent_message(event)
 
@@ -146,6 +150,20 @@ class EventFormatter:
             agent_role=event.agent if isinstance(event.agent, AgentRole) else None,
         )
 
+    @classmethod
+    def _format_routed_message(cls, event: Event) -> FormattedMessage:
+        """Format a compact routing event, shown in place of the received message."""
+        to = event.data.get("to", "unknown")
+        content = event.data.get("content", "")
+        agent_name = cls._get_agent_name(event.agent)
+
+        return cls._create_message_with_preview(
+            content=f"[sent to {to}] {content}",
+            sender=agent_name,
+            message_type=MessageType.SYSTEM,
+            agent_role=event.agent if isinstance(event.agent, AgentRole) else None,
+        )
+
     @classmethod
     def _format_agent_message(cls, event: Event) -> FormattedMessage:
         """Format a regular agent message event."""
@@ -196,6 +214,43 @@ class EventFormatter:
             agent_role=event.agent if isinstance(event.agent, AgentRole) else None,
         )
 
+    @classmethod
+    def _format_custom(cls, event: Event) -> FormattedMessage | None:
+        name = event.data.get("name")
+        agent_name = cls._get_agent_name(event.agent)
+
+        if name == "context":
+            return FormattedMessage(
+                sender=agent_name,
+                content=(
+                    f"Compacted context from ~{event.data.get('tokens_before')} "
+                    f"to ~{event.data.get('tokens_after')} tokens"
+                ),
+                message_type=MessageType.SYSTEM,
+                agent_role=event.agent if isinstance(event.agent, AgentRole) else None,
+            )
+
+        if name != "supervisor":
+            return None
+
+        action = event.data.get("action")
+        attempt = event.data.get("attempt")
+        error = event.data.get("error_type", "error")
+
+        if action == "restart":
+            content = f"Attempt {attempt} failed ({error}), retrying in {event.data.get('delay', 0):.0f}s"
+        elif action == "quarantine":
+            content = f"Gave up after {attempt} attempts ({error})"
+        else:
+            content = "Escalated the failure to the EM"
+
+        return FormattedMessage(
+            sender=agent_name,
+            content=content,
+            message_type=MessageType.ERROR if action == "quarantine" else MessageType.SYSTEM,
+            agent_role=event.agent if isinstance(event.agent, AgentRole) else None,
+        )
+
     @classmethod
     def _format_tool_call_start(cls, event: Event) -> FormattedMessage:
         agent_name = cls._get_agent_name(event.agent)
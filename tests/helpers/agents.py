@@ -0,0 +1,36 @@
+import asyncio
+
+from agile_ai_sdk.agents.base import BaseAgent
+from agile_ai_sdk.core.config import AgentConfig
+from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.core.router import MessageRouter
+from agile_ai_sdk.models import AgentRole, Message
+
+
+class RecordingAgent(BaseAgent):
+    """Agent that records the batches it processes instead of calling an LLM.
+
+    Example:
+        >>> agent = RecordingAgent(router, stream)
+        >>> router.register_agent(AgentRole.DEV, agent)
+        >>> agent.spawn()
+        >>> await router.send(AgentRole.EM, AgentRole.DEV, "hello")
+        >>> await agent.processed.wait()
+        >>> agent.batches
+        [[Message(content="hello", ...)]]
+    """
+
+    def __init__(
+        self,
+        router: MessageRouter,
+        event_stream: EventStream,
+        config: AgentConfig | None = None,
+        role: AgentRole = AgentRole.DEV,
+    ):
+        super().__init__(role, router, event_stream, config)
+        self.batches: list[list[Message]] = []
+        self.processed = asyncio.Event()
+
+    async def process_messages(self, messages: list[Message]) -> None:
+        self.batches.append(messages)
+        self.processed.set()
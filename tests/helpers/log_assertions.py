@@ -42,7 +42,7 @@ def assert_jsonl_valid(jsonl_path: Path) -> None:
         except json.JSONDecodeError as e:
             raise AssertionError(f"Line {i+1} is not valid JSON: {e}") from e
 
-        required_fields = ["timestamp", "type", "agent", "data"]
+        required_fields = ["timestamp", "seq", "mono_ns", "type", "agent", "data"]
         for field in required_fields:
             assert field in event_data, f"Line {i+1} missing field: {field}"
 
@@ -0,0 +1,602 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from pydantic_ai.messages import ModelMessage, ModelRequest, ModelResponse, TextPart, ToolCallPart, UserPromptPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.usage import RunUsage
+
+from agile_ai_sdk.core.config import AgentConfig, ContextPolicy, SupervisorPolicy
+from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.core.router import MessageRouter
+from agile_ai_sdk.models import (
+    AgentRole,
+    ContextCompactedData,
+    EventType,
+    HumanRole,
+    Message,
+    Priority,
+    SupervisorData,
+    UsageData,
+    Verbosity,
+)
+from tests.helpers.agents import RecordingAgent
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_idle_agent_picks_up_message_without_polling_delay() -> None:
+    """A sleeping run loop wakes as soon as a message is routed to it."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = RecordingAgent(router, stream)
+    router.register_agent(AgentRole.DEV, agent)
+    task = agent.spawn()
+    await asyncio.sleep(0.01)
+
+    await router.send(HumanRole.USER, AgentRole.DEV, "hello")
+    await asyncio.wait_for(agent.processed.wait(), timeout=0.05)
+
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert [m.content for m in agent.batches[0]] == ["hello"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_interrupts_are_processed_before_inbox() -> None:
+    """With both queues non-empty, the interrupt batch is processed first."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = RecordingAgent(router, stream)
+    router.register_agent(AgentRole.DEV, agent)
+
+    await router.send(HumanRole.USER, AgentRole.DEV, "work")
+    await router.send(HumanRole.USER, AgentRole.DEV, "stop", priority=Priority.INTERRUPT)
+
+    task = agent.spawn()
+    while len(agent.batches) < 2:
+        await asyncio.sleep(0)
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert [[m.content for m in batch] for batch in agent.batches] == [["stop"], ["work"]]
+
+
+async def _send_burst(router: MessageRouter, contents: list[str], gap: float) -> None:
+    for content in contents:
+        await router.send(HumanRole.USER, AgentRole.DEV, content)
+        await asyncio.sleep(gap)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_coalescing_window_merges_burst_into_one_batch() -> None:
+    """Messages arriving within coalesce_min_wait of each other form one batch."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = RecordingAgent(router, stream, AgentConfig(coalesce_min_wait=0.05, coalesce_max_wait=1.0))
+    router.register_agent(AgentRole.DEV, agent)
+    task = agent.spawn()
+
+    await _send_burst(router, ["a", "b", "c"], gap=0.01)
+    await asyncio.wait_for(agent.processed.wait(), timeout=1.0)
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert [[m.content for m in batch] for batch in agent.batches] == [["a", "b", "c"]]
+    assert agent.llm_calls_saved == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_coalescing_stops_at_max_batch() -> None:
+    """The window closes once coalesce_max_batch messages are queued."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    config = AgentConfig(coalesce_min_wait=0.05, coalesce_max_wait=1.0, coalesce_max_batch=2)
+    agent = RecordingAgent(router, stream, config)
+    router.register_agent(AgentRole.DEV, agent)
+    task = agent.spawn()
+
+    await _send_burst(router, ["a", "b", "c"], gap=0.01)
+    while sum(len(batch) for batch in agent.batches) < 3:
+        await asyncio.sleep(0.01)
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert [[m.content for m in batch] for batch in agent.batches] == [["a", "b"], ["c"]]
+
+
+@pytest.mark.unit
+def test_coalesce_max_wait_must_cover_min_wait() -> None:
+    """A window whose cap is shorter than its quiet period is rejected."""
+
+    with pytest.raises(ValueError):
+        AgentConfig(coalesce_min_wait=1.0, coalesce_max_wait=0.5)
+
+
+class ReplyingAgent(RecordingAgent):
+    """Answers the EM through respond() for messages that ask for it."""
+
+    async def process_messages(self, messages: list[Message]) -> None:
+        await super().process_messages(messages)
+        for message in messages:
+            if message.content.startswith("answer:"):
+                await self.respond(AgentRole.EM, message.content.removeprefix("answer:"))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_respond_answers_open_request() -> None:
+    """respond() resolves the pending request; unanswered requests get a closing reply."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    router.register_agent(AgentRole.EM, RecordingAgent(router, stream, role=AgentRole.EM))
+    dev = ReplyingAgent(router, stream)
+    router.register_agent(AgentRole.DEV, dev)
+    task = dev.spawn()
+
+    answered = await router.request(AgentRole.EM, AgentRole.DEV, "answer:42", timeout=1.0)
+    unanswered = await router.request(AgentRole.EM, AgentRole.DEV, "no answer", timeout=1.0)
+
+    dev.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert answered.content == "42"
+    assert unanswered.content == "developer finished without sending a reply"
+
+
+class BlockingAgent(RecordingAgent):
+    """Blocks on its first batch until cancelled, like a long LLM call."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cancelled = asyncio.Event()
+
+    async def process_messages(self, messages: list[Message]) -> None:
+        await super().process_messages(messages)
+        if len(self.batches) == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                self.cancelled.set()
+                raise
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_interrupt_preempts_in_flight_batch() -> None:
+    """An interrupt cancels the running batch, which is handled again with it."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = BlockingAgent(router, stream, AgentConfig(preempt_on_interrupt=True))
+    router.register_agent(AgentRole.DEV, agent)
+    task = agent.spawn()
+
+    await router.send(AgentRole.EM, AgentRole.DEV, "long task")
+    await agent.processed.wait()
+    agent.processed.clear()
+
+    await router.send(AgentRole.EM, AgentRole.DEV, "change of plan", priority=Priority.INTERRUPT)
+    await asyncio.wait_for(agent.processed.wait(), timeout=0.1)
+
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert agent.cancelled.is_set()
+    assert [m.content for m in agent.batches[1]] == ["long task", "change of plan"]
+    assert len(agent.interrupt_latencies) == 1
+    assert agent.interrupt_latencies[0] < 0.1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_interrupt_latency_is_measured_from_routing_on_monotonic_clock() -> None:
+    """Latency runs from routing to handling; the wall-clock creation time doesn't matter."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = RecordingAgent(router, stream)
+    router.register_agent(AgentRole.DEV, agent)
+
+    message = Message(
+        source=AgentRole.EM,
+        target=AgentRole.DEV,
+        content="stop",
+        priority=Priority.INTERRUPT,
+        created_at=datetime(2000, 1, 1),
+    )
+    await router.route_message(message)
+    await asyncio.sleep(0.02)
+
+    task = agent.spawn()
+    await asyncio.wait_for(agent.processed.wait(), timeout=1.0)
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+    stream.close()
+
+    reported = [event.payload.latency_ms async for event in stream if event.data.get("status") == "Handling interrupt"]
+
+    assert message.routed_ns is not None
+    assert 0.02 <= agent.interrupt_latencies[0] < 1.0
+    assert reported == [1000.0 * agent.interrupt_latencies[0]]
+
+
+class StepwiseBlockingAgent(RecordingAgent):
+    """Finishes messages one at a time and blocks on "slow" in its first batch."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.handled: list[str] = []
+        self.blocked = asyncio.Event()
+
+    async def process_messages(self, messages: list[Message]) -> None:
+        first_batch = not self.batches
+        self.batches.append(messages)
+        for message in messages:
+            if first_batch and message.content == "slow":
+                self.blocked.set()
+                await asyncio.sleep(10)
+            self.handled.append(message.content)
+            self.mark_finished(message)
+        if not first_batch:
+            self.processed.set()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_preempted_batch_requeues_only_unfinished_messages() -> None:
+    """Messages finished before the interrupt are not handled a second time."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = StepwiseBlockingAgent(router, stream, AgentConfig(preempt_on_interrupt=True))
+    router.register_agent(AgentRole.DEV, agent)
+    for content in ("quick", "slow"):
+        await router.send(AgentRole.EM, AgentRole.DEV, content)
+    task = agent.spawn()
+
+    await asyncio.wait_for(agent.blocked.wait(), timeout=1.0)
+    await router.send(AgentRole.EM, AgentRole.DEV, "change of plan", priority=Priority.INTERRUPT)
+    await asyncio.wait_for(agent.processed.wait(), timeout=1.0)
+
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert agent.handled == ["quick", "slow", "change of plan"]
+    assert [m.content for m in agent.batches[1]] == ["slow", "change of plan"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_interrupt_waits_when_preemption_disabled() -> None:
+    """With preempt_on_interrupt=False the running batch is left to finish."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = BlockingAgent(router, stream, AgentConfig(preempt_on_interrupt=False))
+    router.register_agent(AgentRole.DEV, agent)
+    task = agent.spawn()
+
+    await router.send(AgentRole.EM, AgentRole.DEV, "long task")
+    await agent.processed.wait()
+    await router.send(AgentRole.EM, AgentRole.DEV, "change of plan", priority=Priority.INTERRUPT)
+    await asyncio.sleep(0.05)
+
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert len(agent.batches) == 1
+    assert agent.interrupt_queue.qsize() == 1
+
+
+class FlakyAgent(RecordingAgent):
+    """Fails its first `failures` attempts, like a provider returning 529s."""
+
+    def __init__(self, *args, failures: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.failures = failures
+        self.attempts = 0
+
+    async def process_messages(self, messages: list[Message]) -> None:
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise RuntimeError("overloaded")
+        await super().process_messages(messages)
+
+
+def _fast_retries(max_attempts: int) -> AgentConfig:
+    return AgentConfig(supervisor=SupervisorPolicy(max_attempts=max_attempts, backoff_base=0.001))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_supervisor_retries_transient_failure() -> None:
+    """A failing batch is retried with backoff and the loop keeps running."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = FlakyAgent(router, stream, _fast_retries(3), failures=2)
+    router.register_agent(AgentRole.DEV, agent)
+    task = agent.spawn()
+
+    await router.send(AgentRole.EM, AgentRole.DEV, "build it")
+    await asyncio.wait_for(agent.processed.wait(), timeout=1.0)
+
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+    stream.close()
+    decisions = [event.payload for event in [e async for e in stream] if event.type == EventType.CUSTOM]
+
+    assert agent.attempts == 3
+    assert [m.content for m in agent.batches[0]] == ["build it"]
+    assert [(d.action, d.attempt, d.delay) for d in decisions] == [("restart", 1, 0.001), ("restart", 2, 0.002)]
+    assert all(isinstance(d, SupervisorData) for d in decisions)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_supervisor_quarantines_and_escalates_to_em() -> None:
+    """After max_attempts the batch is quarantined, the EM is told, and new work still runs."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    em = RecordingAgent(router, stream, role=AgentRole.EM)
+    router.register_agent(AgentRole.EM, em)
+    agent = FlakyAgent(router, stream, _fast_retries(2), failures=2)
+    router.register_agent(AgentRole.DEV, agent)
+    task = agent.spawn()
+
+    await router.send(HumanRole.USER, AgentRole.DEV, "poison")
+    escalation = await asyncio.wait_for(em.inbox.get(), timeout=1.0)
+    await router.send(HumanRole.USER, AgentRole.DEV, "next task")
+    await asyncio.wait_for(agent.processed.wait(), timeout=1.0)
+
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert [[m.content for m in batch] for batch in agent.quarantine] == [["poison"]]
+    assert "failed after 2 attempt(s): RuntimeError: overloaded" in escalation.content
+    assert "poison" in escalation.content
+    assert [m.content for m in agent.batches[0]] == ["next task"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_quarantined_request_gets_failure_reply() -> None:
+    """A requester waiting on a batch that is quarantined gets the error as its reply."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    router.register_agent(AgentRole.EM, RecordingAgent(router, stream, role=AgentRole.EM))
+    agent = FlakyAgent(router, stream, _fast_retries(1), failures=1)
+    router.register_agent(AgentRole.DEV, agent)
+    task = agent.spawn()
+
+    reply = await router.request(AgentRole.EM, AgentRole.DEV, "do it", timeout=1.0)
+
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert reply.content == "developer failed after 1 attempt(s): RuntimeError: overloaded"
+
+
+class SequentialAgent(RecordingAgent):
+    """Handles a batch one message at a time, like CodeActAgent, failing once on `fail_on`."""
+
+    def __init__(self, *args, fail_on: str = "", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail_on = fail_on
+        self.handled: list[str] = []
+
+    async def process_messages(self, messages: list[Message]) -> None:
+        self.batches.append(messages)
+        for message in messages:
+            if message.content == self.fail_on:
+                self.fail_on = ""
+                raise RuntimeError("overloaded")
+            self.handled.append(message.content)
+            self.mark_finished(message)
+        self.processed.set()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_supervisor_retries_only_unfinished_messages() -> None:
+    """Messages finished before the failure are not handled again on retry."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = SequentialAgent(router, stream, _fast_retries(3), fail_on="second")
+    router.register_agent(AgentRole.DEV, agent)
+    for content in ("first", "second", "third"):
+        await router.send(AgentRole.EM, AgentRole.DEV, content)
+    task = agent.spawn()
+
+    await asyncio.wait_for(agent.processed.wait(), timeout=1.0)
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert agent.handled == ["first", "second", "third"]
+    assert [[m.content for m in batch] for batch in agent.batches] == [
+        ["first", "second", "third"],
+        ["second", "third"],
+    ]
+
+
+@pytest.mark.unit
+def test_supervisor_backoff_doubles_up_to_max() -> None:
+    """Retry delays grow exponentially and are capped at backoff_max."""
+
+    policy = SupervisorPolicy(backoff_base=1.0, backoff_max=5.0)
+
+    assert [policy.backoff(attempt) for attempt in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("verbosity", "expected"), [(Verbosity.DEBUG, 3), (Verbosity.NORMAL, 0)])
+async def test_received_message_chatter_follows_verbosity(verbosity: Verbosity, expected: int) -> None:
+    """The per-batch and per-message receipt events are only emitted at DEBUG."""
+
+    stream = EventStream(verbosity=verbosity)
+    router = MessageRouter(stream)
+    agent = RecordingAgent(router, stream)
+    router.register_agent(AgentRole.DEV, agent)
+
+    await router.send(AgentRole.EM, AgentRole.DEV, "one")
+    await router.send(AgentRole.EM, AgentRole.DEV, "two")
+    task = agent.spawn()
+    await agent.processed.wait()
+
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+    stream.close()
+    chatter = [e async for e in stream if e.agent == AgentRole.DEV and "message" in e.data]
+
+    assert len(chatter) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_history_is_compacted_before_a_batch() -> None:
+    """An oversized history is compacted before processing, with a CUSTOM event reporting it."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = RecordingAgent(router, stream, config=AgentConfig(context=ContextPolicy(max_tokens=100)))
+    router.register_agent(AgentRole.DEV, agent)
+    for i in range(10):
+        agent.conversation_history += [
+            ModelRequest(parts=[UserPromptPart(f"task {i}")]),
+            ModelResponse(parts=[TextPart("x" * 200)]),
+        ]
+
+    task = agent.spawn()
+    await router.send(AgentRole.EM, AgentRole.DEV, "next")
+    await asyncio.wait_for(agent.processed.wait(), timeout=1.0)
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+    stream.close()
+
+    compactions = [event.payload async for event in stream if event.type == EventType.CUSTOM]
+    assert len(compactions) == 1
+    assert isinstance(compactions[0], ContextCompactedData)
+    assert compactions[0].turns_dropped > 0
+    assert agent.context.count_tokens(agent.conversation_history) == compactions[0].tokens_after
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_history_is_summarized_in_the_background() -> None:
+    """Batches go ahead while the summary is written; it is swapped in before the next batch."""
+
+    release = asyncio.Event()
+
+    async def slow_summary(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        await release.wait()
+        args = {"task": "earlier tasks", "progress": "all done"}
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, args)])
+
+    policy = ContextPolicy(
+        max_tokens=1_000,
+        summarize=True,
+        summarize_at=0.1,
+        keep_recent_turns=1,
+        summary_model=FunctionModel(slow_summary),
+    )
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = RecordingAgent(router, stream, config=AgentConfig(context=policy))
+    router.register_agent(AgentRole.DEV, agent)
+    for i in range(4):
+        agent.conversation_history += [
+            ModelRequest(parts=[UserPromptPart(f"task {i}")]),
+            ModelResponse(parts=[TextPart("x" * 200)]),
+        ]
+    task = agent.spawn()
+
+    # The summary is still being written, so the batch runs on the full history
+    await router.send(AgentRole.EM, AgentRole.DEV, "first")
+    await asyncio.wait_for(agent.processed.wait(), timeout=1.0)
+    assert len(agent.conversation_history) == 8
+    assert agent._summary is not None
+
+    release.set()
+    await asyncio.wait_for(asyncio.shield(agent._summary), timeout=1.0)
+    agent.processed.clear()
+    await router.send(AgentRole.EM, AgentRole.DEV, "second")
+    await asyncio.wait_for(agent.processed.wait(), timeout=1.0)
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+    stream.close()
+
+    # Three turns summarized behind the pinned first task, the latest kept
+    assert len(agent.conversation_history) == 2
+    assert "Progress: all done" in agent.conversation_history[0].parts[1].content
+    assert agent.conversation_history[0].parts[2].content == "task 3"
+
+    compactions = [event.payload async for event in stream if event.type == EventType.CUSTOM]
+    assert [c.turns_summarized for c in compactions] == [3]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_llm_usage_is_totalled_and_reported() -> None:
+    """Each call's usage, cache hits included, is emitted and added to the agent's total."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = RecordingAgent(router, stream)
+
+    for cache_read in (0, 900):
+        usage = RunUsage(
+            requests=1, input_tokens=1_000, cache_read_tokens=cache_read, cache_write_tokens=50, output_tokens=20
+        )
+        await agent._record_usage(usage)
+    stream.close()
+
+    reports = [event.payload async for event in stream]
+    assert [report.cache_read_tokens for report in reports] == [0, 900]
+    assert all(isinstance(report, UsageData) for report in reports)
+    assert (agent.usage.requests, agent.usage.input_tokens, agent.usage.cache_read_tokens) == (2, 2_000, 900)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_history_compaction_failure_is_supervised(monkeypatch) -> None:
+    """A failure preparing a batch, here a summarizer without an API key, doesn't stop the agent."""
+
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    policy = ContextPolicy(max_tokens=1_000, summarize=True, summarize_at=0.1, keep_recent_turns=1)
+    stream = EventStream()
+    router = MessageRouter(stream)
+    config = AgentConfig(supervisor=SupervisorPolicy(max_attempts=2, backoff_base=0.001), context=policy)
+    agent = RecordingAgent(router, stream, config=config)
+    router.register_agent(AgentRole.DEV, agent)
+    for i in range(3):
+        agent.conversation_history += [
+            ModelRequest(parts=[UserPromptPart(f"task {i}")]),
+            ModelResponse(parts=[TextPart("x" * 200)]),
+        ]
+    task = agent.spawn()
+
+    await router.send(AgentRole.EM, AgentRole.DEV, "next")
+    for _ in range(100):
+        if agent.quarantine:
+            break
+        await asyncio.sleep(0.01)
+
+    assert not task.done()
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert [[m.content for m in batch] for batch in agent.quarantine] == [["next"]]
@@ -0,0 +1,161 @@
+import pytest
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+from pydantic_ai.models.test import TestModel
+
+from agile_ai_sdk.core.config import ContextPolicy
+from agile_ai_sdk.core.context import (
+    DROPPED_TURNS_NOTE,
+    ContextSummarizer,
+    ContextWindowManager,
+    ConversationSummary,
+)
+
+
+def _turn(prompt: str, tool_output: str = "", system: str | None = None) -> list[ModelMessage]:
+    """A user turn with one tool call and a final answer."""
+
+    first: list = [SystemPromptPart(system)] if system else []
+    return [
+        ModelRequest(parts=[*first, UserPromptPart(prompt)]),
+        ModelResponse(parts=[ToolCallPart("run_bash", {"command": "ls"}, tool_call_id=prompt)]),
+        ModelRequest(parts=[ToolReturnPart("run_bash", tool_output, tool_call_id=prompt)]),
+        ModelResponse(parts=[TextPart(f"done with {prompt}")]),
+    ]
+
+
+def _prompts(messages: list[ModelMessage]) -> list[str]:
+    return [part.content for message in messages for part in message.parts if isinstance(part, UserPromptPart)]
+
+
+def _history(turns: int, output_size: int = 400) -> list[ModelMessage]:
+    history = _turn("task 0", "x" * output_size, system="You are a developer")
+    for i in range(1, turns):
+        history += _turn(f"task {i}", "x" * output_size)
+    return history
+
+
+@pytest.mark.unit
+def test_history_under_budget_is_untouched() -> None:
+    """Nothing is compacted, or copied, while the estimate is within max_tokens."""
+
+    history = _history(3)
+    manager = ContextWindowManager(ContextPolicy(max_tokens=10_000))
+
+    compacted, stats = manager.compact(history)
+
+    assert compacted is history
+    assert stats is None
+
+
+@pytest.mark.unit
+def test_sliding_window_pins_system_prompt_and_first_task() -> None:
+    """Oldest turns are dropped whole, keeping the system prompt, first task and latest turn."""
+
+    history = _history(10)
+    manager = ContextWindowManager(ContextPolicy(max_tokens=500, tool_output_max_tokens=None))
+
+    compacted, stats = manager.compact(history)
+
+    assert stats is not None
+    assert stats.turns_dropped > 0
+    assert stats.tokens_after <= 375 < stats.tokens_before
+    assert stats.tokens_after == manager.count_tokens(compacted)
+
+    first = compacted[0]
+    assert isinstance(first.parts[0], SystemPromptPart)
+    assert _prompts(compacted)[:2] == ["task 0", DROPPED_TURNS_NOTE]
+    assert _prompts(compacted)[-1] == "task 9"
+    assert compacted[-4:] == history[-4:]
+
+    # Requests and responses still alternate, so every tool call keeps its result
+    kinds = [message.kind for message in compacted]
+    assert kinds == ["request", "response"] * (len(compacted) // 2)
+
+
+@pytest.mark.unit
+def test_unpinned_first_task_is_dropped_but_system_prompt_kept() -> None:
+    history = _history(10)
+    manager = ContextWindowManager(ContextPolicy(max_tokens=500, pin_first_task=False, tool_output_max_tokens=None))
+
+    compacted, _ = manager.compact(history)
+
+    assert isinstance(compacted[0].parts[0], SystemPromptPart)
+    assert "task 0" not in _prompts(compacted)
+
+
+@pytest.mark.unit
+def test_old_tool_outputs_are_truncated_before_turns_are_dropped() -> None:
+    """Truncating large tool outputs can be enough to get under budget; the latest turn is left whole."""
+
+    history = _history(4, output_size=4_000)
+    manager = ContextWindowManager(ContextPolicy(max_tokens=3_000, tool_output_max_tokens=100))
+
+    compacted, stats = manager.compact(history)
+
+    assert stats is not None
+    assert (stats.tool_outputs_truncated, stats.turns_dropped) == (3, 0)
+    assert _prompts(compacted) == _prompts(history)
+    assert compacted[-2].parts[0].content == "x" * 4_000
+
+    # Compacting again does not cut the same outputs twice
+    _, again = ContextWindowManager(ContextPolicy(max_tokens=100, tool_output_max_tokens=100)).compact(compacted)
+    assert again is not None
+    assert again.tool_outputs_truncated == 0
+
+
+@pytest.mark.unit
+def test_repeated_compaction_keeps_a_single_pinned_task() -> None:
+    manager = ContextWindowManager(ContextPolicy(max_tokens=500, tool_output_max_tokens=None))
+
+    history, _ = manager.compact(_history(10))
+    for i in range(10, 20):
+        history += _turn(f"task {i}", "x" * 400)
+        history, _ = manager.compact(history)
+
+    prompts = _prompts(history)
+    assert prompts.count("task 0") == 1
+    assert prompts.count(DROPPED_TURNS_NOTE) == 1
+    assert prompts[-1] == "task 19"
+
+
+@pytest.mark.unit
+def test_summary_replaces_older_turns() -> None:
+    """Past summarize_at, all but the recent turns are summarized in place behind the pinned task."""
+
+    history = _history(6)
+    policy = ContextPolicy(max_tokens=2_000, summarize=True, summarize_at=0.25, keep_recent_turns=2)
+    manager = ContextWindowManager(policy)
+
+    assert ContextWindowManager(ContextPolicy(max_tokens=2_000)).summary_split(history) == 0
+    count = manager.summary_split(history)
+    assert count == 16
+
+    summary = ConversationSummary(task="tasks 0-5", progress="four done", facts=["ls shows x"])
+    compacted, stats = manager.apply_summary(history, count, summary)
+
+    assert stats.turns_summarized == 4
+    assert stats.tokens_after < stats.tokens_before
+    assert isinstance(compacted[0].parts[0], SystemPromptPart)
+    assert _prompts(compacted) == ["task 0", summary.render(), "task 4", "task 5"]
+    assert compacted[1:] == history[17:]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_summarizer_produces_structured_summary() -> None:
+    summarizer = ContextSummarizer(TestModel())
+
+    summary = await summarizer.summarize(_history(2))
+
+    assert isinstance(summary, ConversationSummary)
+    assert "[tool call] run_bash" in ContextSummarizer.transcript(_history(2))
+    assert "You are a developer" not in ContextSummarizer.transcript(_history(2))
@@ -0,0 +1,292 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agile_ai_sdk.core.dispatcher import EventDispatcher
+from agile_ai_sdk.models import AgentRole, DispatchMode, Event, EventType
+
+
+def _event(event_type: EventType, agent: AgentRole = AgentRole.DEV, **data) -> Event:
+    return Event(type=event_type, agent=agent, data=data)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_filters_select_interested_handlers() -> None:
+    """Each handler only sees events passing its type, agent and predicate filters."""
+
+    dispatcher = EventDispatcher()
+    seen: dict[str, list[EventType]] = {"runs": [], "dev": [], "errors": [], "all": []}
+
+    dispatcher.add_handler(
+        lambda e: seen["runs"].append(e.type), event_types={EventType.RUN_STARTED, EventType.RUN_FINISHED}
+    )
+    dispatcher.add_handler(lambda e: seen["dev"].append(e.type), agents={AgentRole.DEV})
+    dispatcher.add_handler(lambda e: seen["errors"].append(e.type), predicate=lambda e: "error" in e.data)
+    dispatcher.add_handler(lambda e: seen["all"].append(e.type))
+
+    await dispatcher.dispatch(_event(EventType.RUN_STARTED, AgentRole.EM))
+    await dispatcher.dispatch(_event(EventType.TEXT_MESSAGE_CONTENT, AgentRole.DEV))
+    await dispatcher.dispatch(_event(EventType.RUN_ERROR, AgentRole.EM, error="boom"))
+
+    assert seen["runs"] == [EventType.RUN_STARTED]
+    assert seen["dev"] == [EventType.TEXT_MESSAGE_CONTENT]
+    assert seen["errors"] == [EventType.RUN_ERROR]
+    assert len(seen["all"]) == 3
+
+
+@pytest.mark.unit
+def test_dispatch_table_only_lists_interested_handlers() -> None:
+    """The precomputed table has no entry for events nobody filtered for."""
+
+    dispatcher = EventDispatcher()
+    registration = dispatcher.add_handler(lambda e: None, event_types={EventType.TOOL_CALL_START})
+
+    assert dispatcher.handlers_for(EventType.TOOL_CALL_START, AgentRole.DEV) == (registration,)
+    assert dispatcher.handlers_for(EventType.TEXT_MESSAGE_CONTENT, AgentRole.DEV) == ()
+
+    dispatcher.remove_handler(registration)
+    assert not dispatcher.has_handlers
+    assert dispatcher.handlers_for(EventType.TOOL_CALL_START, AgentRole.DEV) == ()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_typed_handlers_run_before_catch_all_handlers() -> None:
+    """Type-filtered handlers keep running before on_any_event-style handlers."""
+
+    dispatcher = EventDispatcher()
+    order: list[str] = []
+
+    dispatcher.add_handler(lambda e: order.append("any"))
+    dispatcher.add_handler(lambda e: order.append("typed"), event_types={EventType.RUN_FINISHED})
+
+    await dispatcher.dispatch(_event(EventType.RUN_FINISHED))
+
+    assert order == ["typed", "any"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_block_others() -> None:
+    """A handler that raises is logged and the next handler still runs."""
+
+    dispatcher = EventDispatcher()
+    seen: list[Event] = []
+
+    def broken(event: Event) -> None:
+        raise RuntimeError("boom")
+
+    dispatcher.add_handler(broken)
+    dispatcher.add_handler(seen.append)
+
+    await dispatcher.dispatch(_event(EventType.STEP_STARTED))
+
+    assert len(seen) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_mode_isolates_slow_handler() -> None:
+    """A slow handler does not delay dispatch or other handlers, and order is kept per handler."""
+
+    dispatcher = EventDispatcher(mode=DispatchMode.CONCURRENT)
+    fast: list[int] = []
+    slow: list[int] = []
+    release = asyncio.Event()
+
+    async def slow_handler(event: Event) -> None:
+        await release.wait()
+        slow.append(event.data["step"])
+
+    dispatcher.add_handler(slow_handler)
+    dispatcher.add_handler(lambda e: fast.append(e.data["step"]))
+
+    for i in range(3):
+        await asyncio.wait_for(dispatcher.dispatch(_event(EventType.STEP_STARTED, step=i)), timeout=0.05)
+    await asyncio.sleep(0.01)
+
+    assert fast == [0, 1, 2]
+    assert slow == []
+
+    release.set()
+    await dispatcher.close()
+
+    assert slow == [0, 1, 2]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_circuit_breaker_detaches_handler_that_keeps_timing_out() -> None:
+    """Consecutive timeouts trip the breaker and the handler stops receiving events."""
+
+    dispatcher = EventDispatcher(handler_timeout=0.01, max_failures=2)
+    calls = 0
+
+    async def hung(event: Event) -> None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(1)
+
+    registration = dispatcher.add_handler(hung)
+
+    for _ in range(4):
+        await dispatcher.dispatch(_event(EventType.STEP_STARTED))
+
+    assert calls == 2
+    assert dispatcher.detached == [registration]
+    assert not dispatcher.has_handlers
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_per_handler_timeout_and_failure_limit_override_defaults() -> None:
+    """A handler's own timeout and max_failures win; others fall back to the dispatcher's."""
+
+    dispatcher = EventDispatcher(handler_timeout=1.0, max_failures=10)
+
+    async def slow(event: Event) -> None:
+        await asyncio.sleep(0.05)
+
+    strict = dispatcher.add_handler(slow, timeout=0.01, max_failures=1)
+    default = dispatcher.add_handler(slow)
+
+    await dispatcher.dispatch(_event(EventType.STEP_STARTED))
+
+    assert (strict.timeout, strict.max_failures) == (0.01, 1)
+    assert (default.timeout, default.max_failures) == (None, None)
+    assert dispatcher.detached == [strict]
+    assert dispatcher.handlers_for(EventType.STEP_STARTED, AgentRole.DEV) == (default,)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_success_resets_failure_count() -> None:
+    """Only consecutive failures count towards the breaker."""
+
+    dispatcher = EventDispatcher(max_failures=2)
+
+    def flaky(event: Event) -> None:
+        if event.data["fail"]:
+            raise RuntimeError("boom")
+
+    dispatcher.add_handler(flaky)
+
+    for fail in (True, False, True, False):
+        await dispatcher.dispatch(_event(EventType.STEP_STARTED, fail=fail))
+
+    assert dispatcher.has_handlers
+    assert dispatcher.detached == []
+
+
+@pytest.mark.unit
+def test_handler_kind_is_decided_at_registration() -> None:
+    """Async functions and objects with an async __call__ are both detected as async."""
+
+    class AsyncCallable:
+        async def __call__(self, event: Event) -> None:
+            pass
+
+    async def async_handler(event: Event) -> None:
+        pass
+
+    dispatcher = EventDispatcher()
+
+    assert dispatcher.add_handler(async_handler).is_async
+    assert dispatcher.add_handler(AsyncCallable()).is_async
+    assert not dispatcher.add_handler(lambda e: None).is_async
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sync_handlers_run_in_thread_pool() -> None:
+    """A blocking sync handler runs off the event loop, which stays responsive."""
+
+    dispatcher = EventDispatcher(sync_handlers_in_thread=True, max_sync_workers=1)
+    threads: list[str] = []
+    release = threading.Event()
+
+    def blocking_handler(event: Event) -> None:
+        threads.append(threading.current_thread().name)
+        release.wait(timeout=1)
+
+    dispatcher.add_handler(blocking_handler)
+    dispatch = asyncio.create_task(dispatcher.dispatch(_event(EventType.STEP_STARTED)))
+
+    # The loop still runs while the handler blocks its thread
+    await asyncio.sleep(0.02)
+    assert not dispatch.done()
+
+    release.set()
+    await dispatch
+    await dispatcher.close()
+
+    assert threads[0].startswith("agile-event-handler")
+    assert threads[0] != threading.current_thread().name
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_threaded_sync_handler_timeout_counts_as_failure() -> None:
+    """handler_timeout also bounds sync handlers running in the thread pool."""
+
+    dispatcher = EventDispatcher(sync_handlers_in_thread=True, handler_timeout=0.01, max_failures=1)
+    release = threading.Event()
+
+    registration = dispatcher.add_handler(lambda e: release.wait(timeout=1))
+    await dispatcher.dispatch(_event(EventType.STEP_STARTED))
+    release.set()
+    await dispatcher.close()
+
+    assert dispatcher.detached == [registration]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_timed_out_threaded_handler_never_overlaps_itself() -> None:
+    """Events arriving while a timed-out call still runs are skipped and counted as failures."""
+
+    dispatcher = EventDispatcher(sync_handlers_in_thread=True, handler_timeout=0.01, max_failures=3)
+    lock = threading.Lock()
+    running = 0
+    overlaps = 0
+    calls = 0
+
+    def slow_handler(event: Event) -> None:
+        nonlocal running, overlaps, calls
+        with lock:
+            calls += 1
+            running += 1
+            overlaps += running > 1
+        time.sleep(0.2)
+        with lock:
+            running -= 1
+
+    registration = dispatcher.add_handler(slow_handler)
+    for _ in range(3):
+        await dispatcher.dispatch(_event(EventType.STEP_STARTED))
+    await dispatcher.close()
+
+    assert calls == 1
+    assert overlaps == 0
+    assert dispatcher.detached == [registration]
+
+
+@pytest.mark.unit
+def test_wants_follows_dispatch_table() -> None:
+    """wants() reports interest from type and agent filters, including predicate handlers."""
+
+    dispatcher = EventDispatcher()
+    assert not dispatcher.wants(EventType.RUN_FINISHED, AgentRole.EM)
+
+    dispatcher.add_handler(lambda e: None, event_types={EventType.RUN_FINISHED})
+    registration = dispatcher.add_handler(lambda e: None, agents={AgentRole.DEV}, predicate=lambda e: False)
+
+    assert dispatcher.wants(EventType.RUN_FINISHED, AgentRole.EM)
+    assert dispatcher.wants(EventType.STEP_STARTED, AgentRole.DEV)
+    assert not dispatcher.wants(EventType.STEP_STARTED, AgentRole.EM)
+
+    dispatcher.remove_handler(registration)
+    assert not dispatcher.wants(EventType.STEP_STARTED, AgentRole.DEV)
@@ -0,0 +1,60 @@
+import pytest
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart, ToolCallPart, ToolReturnPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from agile_ai_sdk.agents.em import EngineeringManager
+from agile_ai_sdk.core.deps import AgentDeps
+from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.core.router import MessageRouter
+from agile_ai_sdk.models import AgentRole, Message
+from tests.helpers.agents import RecordingAgent
+
+
+class EchoAgent(RecordingAgent):
+    """Replies to each request with its content."""
+
+    async def process_messages(self, messages: list[Message]) -> None:
+        for message in messages:
+            await self.router.reply(message, self.role, f"done: {message.content}")
+        await super().process_messages(messages)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_ask_all_returns_replies_in_task_order(tmp_path, monkeypatch) -> None:
+    """Several tasks for the same agent each get their own reply, in the order given."""
+
+    # The EM's model is replaced below; building it only checks that a key is set
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    em = EngineeringManager(router, stream)
+    router.register_agent(AgentRole.EM, em)
+    agents = [EchoAgent(router, stream, role=role) for role in (AgentRole.DEV, AgentRole.PLANNER)]
+    for agent in agents:
+        router.register_agent(agent.role, agent)
+        agent.spawn()
+
+    tasks = [["developer", "inspect src/"], ["planner", "plan /health"], ["developer", "run the tests"]]
+    result: list[str] = []
+
+    def model(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        returns = [part for part in messages[-1].parts if isinstance(part, ToolReturnPart)]
+        if returns:
+            result.append(returns[0].content)
+            return ModelResponse(parts=[TextPart("Done.")])
+        return ModelResponse(parts=[ToolCallPart("ask_all", {"tasks": tasks})])
+
+    try:
+        with em.ai_agent.override(model=FunctionModel(model)):
+            await em.ai_agent.run("go", deps=AgentDeps(workspace_dir=tmp_path, router=router, event_stream=stream))
+    finally:
+        for agent in agents:
+            agent.stop()
+
+    assert result == [
+        "[1] Reply from developer:\ndone: inspect src/\n\n"
+        "[2] Reply from planner:\ndone: plan /health\n\n"
+        "[3] Reply from developer:\ndone: run the tests"
+    ]
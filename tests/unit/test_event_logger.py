@@ -0,0 +1,44 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.logging import EventLogger
+from agile_ai_sdk.models import AgentRole, Event, EventType
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_log_event_persists_seq_and_monotonic_stamp(tmp_path: Path) -> None:
+    """Logged lines carry the stream's seq and mono_ns so they can be ordered and timed."""
+
+    stream = EventStream()
+    logger = EventLogger(task="test", run_id="run_test", log_dir=tmp_path)
+
+    for step in range(2):
+        event = Event(type=EventType.STEP_STARTED, agent=AgentRole.DEV, data={"step": step})
+        await stream.emit(event)
+        logger.log_event(event)
+
+    lines = [json.loads(line) for line in logger.events_file.read_text().splitlines()]
+
+    assert [line["seq"] for line in lines] == [1, 2]
+    assert [line["data"]["step"] for line in lines] == [0, 1]
+    assert lines[0]["mono_ns"] <= lines[1]["mono_ns"]
+
+
+@pytest.mark.unit
+def test_log_event_keeps_line_schema(tmp_path: Path) -> None:
+    """Lines keep the original keys and Z-suffixed timestamps, with seq and mono_ns added."""
+
+    logger = EventLogger(task="test", run_id="run_test", log_dir=tmp_path)
+    logger.log_event(Event(type=EventType.RUN_STARTED, agent=AgentRole.EM, data={"task": "Add /health"}))
+
+    line = json.loads(logger.events_file.read_text())
+
+    assert set(line) == {"timestamp", "seq", "mono_ns", "type", "agent", "data"}
+    assert line["timestamp"].endswith("Z")
+    assert line["type"] == EventType.RUN_STARTED.value
+    assert line["agent"] == AgentRole.EM.value
+    assert line["data"] == {"task": "Add /health"}
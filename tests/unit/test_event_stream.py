@@ -0,0 +1,240 @@
+import asyncio
+
+import pytest
+
+from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.models import AgentRole, Event, EventType, OverflowPolicy, Verbosity
+
+
+def _event(step: int = 0) -> Event:
+    return Event(type=EventType.STEP_STARTED, agent=AgentRole.DEV, data={"step": step})
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_close_drains_pending_events() -> None:
+    """Events emitted before close() are still delivered."""
+
+    stream = EventStream()
+    for i in range(3):
+        await stream.emit(_event(i))
+    stream.close()
+
+    received = [event.data["step"] async for event in stream]
+
+    assert received == [0, 1, 2]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_close_wakes_idle_consumer_immediately() -> None:
+    """An idle consumer exits as soon as the stream closes."""
+
+    stream = EventStream()
+
+    async def consume() -> int:
+        return len([event async for event in stream])
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+
+    stream.close()
+
+    assert await asyncio.wait_for(task, timeout=0.05) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_emit_after_close_is_ignored() -> None:
+    """Closing is idempotent and later events are dropped."""
+
+    stream = EventStream()
+    stream.close()
+    stream.close()
+    await stream.emit(_event())
+
+    assert [event async for event in stream] == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_subscribers_each_receive_every_event() -> None:
+    """Fan-out delivers each event to the main iterator and every subscriber."""
+
+    stream = EventStream()
+    first = stream.subscribe()
+    second = stream.subscribe()
+
+    await stream.emit(_event(1))
+    stream.close()
+
+    assert [e.data["step"] async for e in stream] == [1]
+    assert [e.data["step"] async for e in first] == [1]
+    assert [e.data["step"] async for e in second] == [1]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("overflow", "expected"),
+    [
+        (OverflowPolicy.DROP_OLDEST, [3, 4]),
+        (OverflowPolicy.DROP_NEWEST, [0, 1]),
+        (OverflowPolicy.DISCONNECT, [0, 1]),
+    ],
+)
+async def test_slow_subscriber_overflow_policy(overflow: OverflowPolicy, expected: list[int]) -> None:
+    """A full subscriber applies its policy without blocking emit()."""
+
+    stream = EventStream()
+    subscription = stream.subscribe(maxsize=2, overflow=overflow)
+
+    for i in range(5):
+        await asyncio.wait_for(stream.emit(_event(i)), timeout=0.05)
+    stream.close()
+
+    assert [e.data["step"] async for e in subscription] == expected
+    assert subscription.disconnected == (overflow == OverflowPolicy.DISCONNECT)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_blocking_subscriber_applies_backpressure() -> None:
+    """A BLOCK subscriber makes emit() wait until it has room."""
+
+    stream = EventStream()
+    subscription = stream.subscribe(maxsize=1, overflow=OverflowPolicy.BLOCK)
+
+    await stream.emit(_event(0))
+    pending = asyncio.create_task(stream.emit(_event(1)))
+    await asyncio.sleep(0)
+    assert not pending.done()
+
+    async with subscription:
+        async for event in subscription:
+            assert event.data["step"] == 0
+            break
+
+    await asyncio.wait_for(pending, timeout=0.05)
+    assert stream.subscriber_count == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bounded_stream_counts_dropped_events() -> None:
+    """A bounded stream with a drop policy never blocks emit() and counts drops."""
+
+    stream = EventStream(maxsize=2, overflow=OverflowPolicy.DROP_OLDEST)
+
+    for i in range(5):
+        await asyncio.wait_for(stream.emit(_event(i)), timeout=0.05)
+    stream.close()
+
+    assert [e.data["step"] async for e in stream] == [3, 4]
+    assert stream.stats.dropped == 3
+    assert stream.stats.high_watermark == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_emit_assigns_increasing_seq() -> None:
+    """Every emitted event gets the next sequence number on that stream."""
+
+    stream = EventStream()
+    events = [_event(i) for i in range(3)]
+    for event in events:
+        await stream.emit(event)
+
+    assert [e.seq for e in events] == [1, 2, 3]
+    assert stream.last_seq == 3
+    assert events[0].mono_ns <= events[1].mono_ns <= events[2].mono_ns
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_replacement_stream_continues_seq() -> None:
+    """A stream created with start_seq picks up numbering where the old one stopped."""
+
+    stream = EventStream(start_seq=41)
+    event = _event()
+    await stream.emit(event)
+
+    assert event.seq == 42
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_subscriber_resumes_after_seq() -> None:
+    """A resuming subscriber gets missed events from the replay buffer, then live ones."""
+
+    stream = EventStream(replay_size=10)
+    for i in range(5):
+        await stream.emit(_event(i))
+
+    subscription = stream.subscribe(after_seq=3)
+    await stream.emit(_event(5))
+    stream.close()
+
+    assert [e.data["step"] async for e in subscription] == [3, 4, 5]
+    assert subscription.missed == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_resume_reports_events_evicted_from_replay_buffer() -> None:
+    """Falling further behind than the buffer holds replays what is left and counts the gap."""
+
+    stream = EventStream(replay_size=3)
+    for i in range(10):
+        await stream.emit(_event(i))
+
+    subscription = stream.subscribe(after_seq=2)
+    stream.close()
+
+    assert [e.seq async for e in subscription] == [8, 9, 10]
+    assert subscription.missed == 5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unwanted_events_are_not_queued() -> None:
+    """With a primary_interest filter, events it rejects never enter the queue or take a seq."""
+
+    stream = EventStream(primary_interest=lambda event_type, agent: event_type == EventType.RUN_FINISHED)
+
+    assert not stream.wants(EventType.STEP_STARTED, AgentRole.DEV)
+    await stream.emit(_event())
+    await stream.emit(Event(type=EventType.RUN_FINISHED, agent=AgentRole.EM, data={"status": "done"}))
+    stream.close()
+
+    assert [(e.type, e.seq) async for e in stream] == [(EventType.RUN_FINISHED, 1)]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_subscriber_interest_makes_events_wanted() -> None:
+    """A subscriber filtered by type only receives, and only makes wanted, those types."""
+
+    stream = EventStream(primary_interest=lambda event_type, agent: False)
+    subscription = stream.subscribe(event_types={EventType.STEP_STARTED})
+
+    assert stream.wants(EventType.STEP_STARTED, AgentRole.DEV)
+    assert not stream.wants(EventType.RUN_FINISHED, AgentRole.DEV)
+
+    await stream.emit(_event(1))
+    await stream.emit(Event(type=EventType.RUN_FINISHED, agent=AgentRole.EM))
+    stream.close()
+
+    assert [e.data["step"] async for e in subscription] == [1]
+    assert stream.stats.enqueued == 0
+
+
+@pytest.mark.unit
+def test_replay_buffer_and_debug_affect_wants() -> None:
+    """A replay buffer wants everything; debug events also need DEBUG verbosity."""
+
+    nobody = lambda event_type, agent: False  # noqa: E731
+
+    assert EventStream(primary_interest=nobody, replay_size=10).wants(EventType.STEP_STARTED, AgentRole.DEV)
+    assert EventStream().wants(EventType.STEP_STARTED, AgentRole.DEV, debug=True)
+    assert not EventStream(verbosity=Verbosity.NORMAL).wants(EventType.STEP_STARTED, AgentRole.DEV, debug=True)
@@ -0,0 +1,21 @@
+import pytest
+
+from agile_ai_sdk.llm import anthropic, default, openai
+
+
+@pytest.mark.unit
+def test_prompt_cache_breakpoints_cover_tools_system_prompt_and_history() -> None:
+    settings = anthropic.get_model_settings(cache_ttl="1h")
+
+    assert settings == {
+        "anthropic_cache_tool_definitions": "1h",
+        "anthropic_cache_instructions": "1h",
+        "anthropic_cache_messages": "1h",
+    }
+    assert default.get_model_settings(anthropic.MODEL_NAME, prompt_cache=False) == {}
+
+
+@pytest.mark.unit
+def test_default_model_settings_follow_the_model_provider() -> None:
+    assert default.get_model_settings(anthropic.MODEL_NAME) == anthropic.get_model_settings()
+    assert default.get_model_settings(openai.MODEL_NAME) == {}
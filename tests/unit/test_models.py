@@ -0,0 +1,115 @@
+import json
+import uuid
+
+import pytest
+
+from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.models import (
+    AgentRole,
+    Event,
+    EventType,
+    MessageReceivedData,
+    MessageSentData,
+    RunFinishedData,
+    RunStartedData,
+    TextMessageData,
+)
+from agile_ai_sdk.models.base import new_id
+
+
+@pytest.mark.unit
+def test_new_id_is_unique_uuid4() -> None:
+    """Generated ids are distinct, valid UUID4 strings."""
+
+    ids = [new_id() for _ in range(1000)]
+
+    assert len(set(ids)) == len(ids)
+    assert all(uuid.UUID(i).version == 4 for i in ids)
+
+
+@pytest.mark.unit
+def test_new_model_has_matching_timestamps() -> None:
+    """created_at and updated_at come from a single clock reading."""
+
+    event = Event(type=EventType.STEP_STARTED, agent=AgentRole.DEV)
+
+    assert event.updated_at == event.created_at
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("data", "payload_type"),
+    [
+        ({"action": "sent", "to": "developer", "content": "hi", "priority": "normal"}, MessageSentData),
+        (
+            {"action": "received", "from_": "engineering_manager", "content": "hi", "priority": "normal"},
+            MessageReceivedData,
+        ),
+        ({"message": "Done"}, TextMessageData),
+    ],
+)
+def test_text_message_payload_is_discriminated_by_action(data: dict, payload_type: type) -> None:
+    """TEXT_MESSAGE_CONTENT data resolves to the payload model matching its action."""
+
+    event = Event(type=EventType.TEXT_MESSAGE_CONTENT, agent=AgentRole.DEV, data=data)
+
+    assert isinstance(event.payload, payload_type)
+
+
+@pytest.mark.unit
+def test_payload_model_is_stored_as_dict() -> None:
+    """Typed payloads are accepted as data and stored without unset optional fields."""
+
+    event = Event(type=EventType.RUN_FINISHED, agent=AgentRole.EM, data=RunFinishedData(status="done"))
+
+    assert event.data == {"status": "done"}
+    assert event.payload == RunFinishedData(status="done")
+
+
+@pytest.mark.unit
+def test_payload_model_is_kept_and_validated_once() -> None:
+    """A payload model given as data is the payload; dict data is validated on first access only."""
+
+    given = MessageSentData(to="developer", content="hi", priority="normal")
+    typed = Event(type=EventType.TEXT_MESSAGE_CONTENT, agent=AgentRole.EM, data=given)
+    raw = Event(type=EventType.TEXT_MESSAGE_CONTENT, agent=AgentRole.EM, data=given.model_dump())
+
+    assert typed.payload is given
+    assert raw.payload is raw.payload
+    assert raw.payload == given
+
+
+@pytest.mark.unit
+def test_custom_event_without_payload_model_has_no_payload() -> None:
+    """CUSTOM events with a name that has no payload model keep their raw data."""
+
+    event = Event(type=EventType.CUSTOM, agent=AgentRole.DEV, data={"foo": 1})
+
+    assert event.payload is None
+    assert event.data == {"foo": 1}
+
+
+@pytest.mark.unit
+def test_event_round_trips_through_json() -> None:
+    """An event rebuilt from its JSON encoding has the same data and payload."""
+
+    event = Event(type=EventType.RUN_FINISHED, agent=AgentRole.EM, data=RunFinishedData(status="done"))
+    restored = Event.model_validate_json(event.to_json_bytes())
+
+    assert restored.data == {"status": "done"}
+    assert restored.payload == event.payload
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_json_encoding_is_cached_and_refreshed_on_emit() -> None:
+    """Consumers share one encoding, which emit() invalidates when it stamps seq."""
+
+    event = Event(type=EventType.RUN_STARTED, agent=AgentRole.EM, data=RunStartedData(task="x"))
+    assert json.loads(event.to_json_bytes())["seq"] is None
+
+    await EventStream().emit(event)
+    encoded = event.to_json_bytes()
+
+    assert encoded is event.to_json_bytes()
+    assert json.loads(encoded)["seq"] == 1
@@ -0,0 +1,243 @@
+import asyncio
+
+import pytest
+
+from agile_ai_sdk import AgentTeam
+from agile_ai_sdk.core.config import AgentConfig
+from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.core.router import MessageRouter
+from agile_ai_sdk.models import AgentRole, Message, OverflowPolicy, PoolPolicy, Priority
+from tests.helpers.agents import RecordingAgent
+
+
+class SlowAgent(RecordingAgent):
+    """Takes a while per batch, so work queues up behind it."""
+
+    async def process_messages(self, messages: list[Message]) -> None:
+        await super().process_messages(messages)
+        await asyncio.sleep(0.05)
+
+
+class HeldAgent(RecordingAgent):
+    """Stays busy with its first batch until released."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.release = asyncio.Event()
+
+    async def process_messages(self, messages: list[Message]) -> None:
+        await super().process_messages(messages)
+        await self.release.wait()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_least_loaded_spreads_messages_across_members() -> None:
+    """Each message goes to the member with the shortest queue."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    members = [RecordingAgent(router, stream) for _ in range(3)]
+    router.register_pool(AgentRole.DEV, members)
+
+    for i in range(6):
+        await router.send(AgentRole.EM, AgentRole.DEV, f"task {i}")
+
+    assert [member.inbox.qsize() for member in members] == [2, 2, 2]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_least_loaded_skips_busy_member() -> None:
+    """A member processing a batch counts as loaded."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    busy, idle = SlowAgent(router, stream), RecordingAgent(router, stream)
+    router.register_pool(AgentRole.DEV, [busy, idle])
+    task = busy.spawn()
+
+    await router.send(AgentRole.EM, AgentRole.DEV, "first")
+    await busy.processed.wait()
+    await router.send(AgentRole.EM, AgentRole.DEV, "second")
+
+    busy.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert idle.inbox.get_nowait().content == "second"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_idle_member_steals_from_busy_member() -> None:
+    """With WORK_STEALING, work queued behind a busy member is picked up by an idle one."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    members = [SlowAgent(router, stream) for _ in range(2)]
+    pool = router.register_pool(AgentRole.DEV, members, PoolPolicy.WORK_STEALING)
+    tasks = [member.spawn() for member in members]
+    await asyncio.sleep(0.01)
+
+    # Dealt round-robin: member 0 gets tasks 0 and 2, member 1 gets tasks 1 and 3
+    for i in range(4):
+        await router.send(AgentRole.EM, AgentRole.DEV, f"task {i}")
+        if i == 0:
+            await members[0].processed.wait()
+    await asyncio.sleep(0.2)
+
+    for member in members:
+        member.stop()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    processed = sorted(m.content for member in members for batch in member.batches for m in batch)
+    assert processed == ["task 0", "task 1", "task 2", "task 3"]
+    assert pool.load == 0
+    assert all(member.batches for member in members)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_steal_takes_oldest_queued_message() -> None:
+    """steal() moves work only from a member with more than it is about to handle."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    victim, thief = RecordingAgent(router, stream), RecordingAgent(router, stream)
+    pool = router.register_pool(AgentRole.DEV, [victim, thief], PoolPolicy.WORK_STEALING)
+
+    await victim.inbox.offer(Message(source=AgentRole.EM, target=AgentRole.DEV, content="a"))
+    assert not await pool.steal(thief)
+
+    await victim.inbox.offer(Message(source=AgentRole.EM, target=AgentRole.DEV, content="b"))
+    assert await pool.steal(thief)
+
+    assert (await thief.inbox.get()).content == "a"
+    assert victim.inbox.stats.stolen == 1
+    assert pool.stolen == {("developer#1", "developer#2"): 1}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_member_events_carry_member_id() -> None:
+    """Events a member emits are tagged with its id; the role stays the same."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    members = [RecordingAgent(router, stream) for _ in range(2)]
+    router.register_pool(AgentRole.DEV, members)
+    tasks = [member.spawn() for member in members]
+    await asyncio.sleep(0.01)
+
+    for member in members:
+        member.stop()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    stream.close()
+
+    started = [(event.agent, event.agent_id) async for event in stream if event.data.get("status") == "Agent started"]
+
+    assert [member.agent_id for member in members] == ["developer#1", "developer#2"]
+    assert started == [(AgentRole.DEV, "developer#1"), (AgentRole.DEV, "developer#2")]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_interrupt_goes_to_member_handling_senders_batch() -> None:
+    """An interrupt reaches only the member busy with the sender's work, not the whole pool."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    members = [HeldAgent(router, stream) for _ in range(3)]
+    router.register_pool(AgentRole.DEV, members)
+
+    await members[1].inbox.offer(Message(source=AgentRole.PLANNER, target=AgentRole.DEV, content="plan work"))
+    await members[2].inbox.offer(Message(source=AgentRole.EM, target=AgentRole.DEV, content="em work"))
+    tasks = [member.spawn() for member in members]
+    await asyncio.gather(members[1].processed.wait(), members[2].processed.wait())
+
+    assert await router.send(AgentRole.EM, AgentRole.DEV, "stop", priority=Priority.INTERRUPT)
+    queued = [member.interrupt_queue.qsize() for member in members]
+
+    for member in members:
+        member.release.set()
+        member.stop()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert queued == [0, 0, 1]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_interrupt_to_idle_pool_goes_to_one_member() -> None:
+    """With nobody busy, a single member gets the interrupt."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    members = [RecordingAgent(router, stream) for _ in range(3)]
+    router.register_pool(AgentRole.DEV, members)
+
+    assert await router.send(AgentRole.EM, AgentRole.DEV, "stop", priority=Priority.INTERRUPT)
+
+    assert sum(member.interrupt_queue.qsize() for member in members) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_steal_leaves_message_with_victim_when_thief_is_full() -> None:
+    """A thief without room steals nothing, so no message is lost or miscounted."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    config = AgentConfig(inbox_maxsize=1, inbox_overflow=OverflowPolicy.DROP_NEWEST)
+    victim, thief = RecordingAgent(router, stream), RecordingAgent(router, stream, config=config)
+    pool = router.register_pool(AgentRole.DEV, [victim, thief], PoolPolicy.WORK_STEALING)
+
+    await thief.inbox.offer(Message(source=AgentRole.EM, target=AgentRole.DEV, content="own"))
+    for content in ("a", "b"):
+        await victim.inbox.offer(Message(source=AgentRole.EM, target=AgentRole.DEV, content=content))
+
+    assert not await pool.steal(thief)
+
+    assert [victim.inbox.get_nowait().content for _ in range(2)] == ["a", "b"]
+    assert (victim.inbox.stats.stolen, thief.inbox.stats.dropped) == (0, 0)
+    assert pool.stolen == {}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_steal_puts_message_back_in_order() -> None:
+    """If the thief rejects the message anyway, it returns to the front of the victim's inbox."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    victim, thief = RecordingAgent(router, stream), RecordingAgent(router, stream)
+    pool = router.register_pool(AgentRole.DEV, [victim, thief], PoolPolicy.WORK_STEALING)
+    thief.inbox.release()
+
+    for content in ("a", "b"):
+        await victim.inbox.offer(Message(source=AgentRole.EM, target=AgentRole.DEV, content=content))
+
+    assert not await pool.steal(thief)
+
+    assert [victim.inbox.get_nowait().content for _ in range(2)] == ["a", "b"]
+    assert victim.inbox.stats.stolen == 0
+    assert pool.stolen == {}
+
+
+@pytest.mark.unit
+def test_team_builds_pool_from_pool_sizes(monkeypatch) -> None:
+    """pool_sizes creates separate instances behind one role; the EM cannot be pooled."""
+
+    # Building the agents only checks that a key is set; no model is called
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+
+    team = AgentTeam(agents=[AgentRole.EM, AgentRole.DEV], pool_sizes={AgentRole.DEV: 3}, log_dir=None)
+
+    developers = team.pool_members[AgentRole.DEV]
+    assert len(developers) == 3
+    assert len({id(dev.conversation_history) for dev in developers}) == 3
+    assert team.agents[AgentRole.DEV] is developers[0]
+    assert all(dev.pool is developers[0].pool for dev in developers)
+
+    with pytest.raises(ValueError, match="cannot be pooled"):
+        AgentTeam(pool_sizes={AgentRole.EM: 2}, log_dir=None)
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from agile_ai_sdk.core.queues import BoundedQueue
+from agile_ai_sdk.models import OverflowPolicy
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_drop_policies_count_dropped_items() -> None:
+    """Dropped items are counted for both drop policies."""
+
+    oldest: BoundedQueue[int] = BoundedQueue(maxsize=1, overflow=OverflowPolicy.DROP_OLDEST)
+    newest: BoundedQueue[int] = BoundedQueue(maxsize=1, overflow=OverflowPolicy.DROP_NEWEST)
+
+    for i in range(3):
+        assert await oldest.offer(i)
+        assert await newest.offer(i) == (i == 0)
+
+    assert oldest.get_nowait() == 2
+    assert newest.get_nowait() == 0
+    assert oldest.stats.dropped == 2
+    assert newest.stats.dropped == 2
+    assert oldest.stats.enqueued == 3
+    assert newest.stats.enqueued == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_block_records_blocked_time() -> None:
+    """A blocked offer completes once space frees up and its wait is recorded."""
+
+    queue: BoundedQueue[int] = BoundedQueue(maxsize=1)
+    await queue.offer(0)
+
+    pending = asyncio.create_task(queue.offer(1))
+    await asyncio.sleep(0.02)
+    assert not pending.done()
+
+    assert await queue.get() == 0
+    assert await pending
+    assert queue.stats.blocked == 1
+    assert queue.stats.blocked_seconds >= 0.01
+    assert queue.stats.high_watermark == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_block_timeout_drops_item() -> None:
+    """A BLOCK offer gives up after block_timeout and counts the drop."""
+
+    queue: BoundedQueue[int] = BoundedQueue(maxsize=1, block_timeout=0.01)
+    await queue.offer(0)
+
+    assert not await queue.offer(1)
+    assert queue.stats.dropped == 1
+    assert queue.qsize() == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_release_unblocks_waiting_producers() -> None:
+    """release() discards queued items and fails every pending offer."""
+
+    queue: BoundedQueue[int] = BoundedQueue(maxsize=1)
+    await queue.offer(0)
+    pending = [asyncio.create_task(queue.offer(i)) for i in range(1, 4)]
+    await asyncio.sleep(0)
+
+    assert queue.release() == 1
+    assert await asyncio.gather(*pending) == [False, False, False]
+    assert queue.empty()
@@ -0,0 +1,246 @@
+import asyncio
+
+import pytest
+
+from agile_ai_sdk.core.config import AgentConfig
+from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.core.router import MessageRouter
+from agile_ai_sdk.models import (
+    AgentRole,
+    MessageReceivedData,
+    MessageRoutedData,
+    MessageSentData,
+    OverflowPolicy,
+    Priority,
+    RoutingEventMode,
+)
+from tests.helpers.agents import RecordingAgent
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_full_inbox_rejects_with_drop_newest() -> None:
+    """route_message reports and counts drops when the inbox is full."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = RecordingAgent(router, stream, AgentConfig(inbox_maxsize=1, inbox_overflow=OverflowPolicy.DROP_NEWEST))
+    router.register_agent(AgentRole.DEV, agent)
+
+    assert await router.send(AgentRole.EM, AgentRole.DEV, "first")
+    assert not await router.send(AgentRole.EM, AgentRole.DEV, "second")
+
+    assert agent.inbox.qsize() == 1
+    assert agent.inbox.stats.dropped == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_interrupts_bypass_full_inbox() -> None:
+    """Interrupts go to their own queue even when the inbox is full."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    agent = RecordingAgent(router, stream, AgentConfig(inbox_maxsize=1, inbox_overflow=OverflowPolicy.DROP_NEWEST))
+    router.register_agent(AgentRole.DEV, agent)
+
+    await router.send(AgentRole.EM, AgentRole.DEV, "work")
+    assert await router.send(AgentRole.EM, AgentRole.DEV, "stop", priority=Priority.INTERRUPT)
+
+    assert agent.interrupt_queue.qsize() == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_routing_events_match_payload_models() -> None:
+    """Sent and received events carry exactly the MessageSentData / MessageReceivedData fields."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    router.register_agent(AgentRole.DEV, RecordingAgent(router, stream))
+
+    await router.send(AgentRole.EM, AgentRole.DEV, "hello")
+    stream.close()
+    sent, received = [event async for event in stream]
+
+    assert sent.data == MessageSentData(to="developer", content="hello", priority="normal").model_dump()
+    assert (
+        received.data
+        == MessageReceivedData(
+            from_="engineering_manager", content="hello", priority="normal", message_id=received.data["message_id"]
+        ).model_dump()
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_compact_routing_carries_content_once() -> None:
+    """COMPACT mode puts the content in the routed event only; the received echo refers to it by id."""
+
+    stream = EventStream()
+    router = MessageRouter(stream, routing_events=RoutingEventMode.COMPACT)
+    router.register_agent(AgentRole.DEV, RecordingAgent(router, stream))
+
+    await router.send(AgentRole.EM, AgentRole.DEV, "x" * 20_000)
+    stream.close()
+    routed_event, received_event = [event async for event in stream]
+
+    routed = routed_event.payload
+    assert isinstance(routed, MessageRoutedData)
+    assert routed_event.agent == AgentRole.EM
+    assert routed.content == "x" * 20_000
+
+    received = received_event.payload
+    assert isinstance(received, MessageReceivedData)
+    assert received_event.agent == AgentRole.DEV
+    assert received.content is None
+    assert received.message_id == routed.message_id
+    assert router.get_message(routed.message_id).content == "x" * 20_000
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_compact_routing_skips_received_echo_for_dropped_message() -> None:
+    """A message the target's inbox rejects is recorded as routed but never as received."""
+
+    stream = EventStream()
+    router = MessageRouter(stream, routing_events=RoutingEventMode.COMPACT)
+    config = AgentConfig(inbox_maxsize=1, inbox_overflow=OverflowPolicy.DROP_NEWEST)
+    router.register_agent(AgentRole.DEV, RecordingAgent(router, stream, config=config))
+
+    assert await router.send(AgentRole.EM, AgentRole.DEV, "first")
+    assert not await router.send(AgentRole.EM, AgentRole.DEV, "second")
+    stream.close()
+
+    actions = [(event.data["action"], event.data.get("content")) for event in [e async for e in stream]]
+    assert actions == [("routed", "first"), ("received", None), ("routed", "second")]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_compact_message_store_is_bounded() -> None:
+    """Only the most recent message_store_size messages can be fetched."""
+
+    stream = EventStream()
+    router = MessageRouter(stream, routing_events=RoutingEventMode.COMPACT, message_store_size=2)
+    router.register_agent(AgentRole.DEV, RecordingAgent(router, stream))
+
+    for i in range(3):
+        await router.send(AgentRole.EM, AgentRole.DEV, f"message {i}")
+    stream.close()
+    ids = [event.data["message_id"] async for event in stream if event.data["action"] == "routed"]
+
+    assert router.get_message(ids[0]) is None
+    assert [router.get_message(i).content for i in ids[1:]] == ["message 1", "message 2"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_request_resolves_with_reply_instead_of_inbox() -> None:
+    """A reply to a pending request goes to the requester's future, not its inbox."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    em = RecordingAgent(router, stream, role=AgentRole.EM)
+    dev = RecordingAgent(router, stream)
+    router.register_agent(AgentRole.EM, em)
+    router.register_agent(AgentRole.DEV, dev)
+
+    pending = asyncio.create_task(router.request(AgentRole.EM, AgentRole.DEV, "list files", timeout=1.0))
+    await asyncio.sleep(0)
+
+    request = await dev.inbox.get()
+    assert request.is_request
+    assert await router.reply(request, AgentRole.DEV, "main.py")
+
+    reply = await pending
+    assert reply.content == "main.py"
+    assert reply.in_reply_to == request.id
+    assert reply.correlation_id == request.correlation_id
+    assert em.inbox.empty()
+    assert router.pending_requests == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_late_reply_after_timeout_is_enqueued() -> None:
+    """A request that times out raises, and its eventual reply lands in the inbox."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    em = RecordingAgent(router, stream, role=AgentRole.EM)
+    dev = RecordingAgent(router, stream)
+    router.register_agent(AgentRole.EM, em)
+    router.register_agent(AgentRole.DEV, dev)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await router.request(AgentRole.EM, AgentRole.DEV, "slow task", timeout=0.01)
+    assert router.pending_requests == 0
+
+    await router.reply(await dev.inbox.get(), AgentRole.DEV, "done eventually")
+
+    assert (await em.inbox.get()).content == "done eventually"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_dropped_request_raises() -> None:
+    """A request rejected by a full inbox fails immediately rather than timing out."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    dev = RecordingAgent(router, stream, AgentConfig(inbox_maxsize=1, inbox_overflow=OverflowPolicy.DROP_NEWEST))
+    router.register_agent(AgentRole.DEV, dev)
+    await router.send(AgentRole.EM, AgentRole.DEV, "busy")
+
+    with pytest.raises(RuntimeError, match="dropped"):
+        await router.request(AgentRole.EM, AgentRole.DEV, "one more", timeout=1.0)
+    assert router.pending_requests == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_request_all_overlaps_requests_and_times_out_stragglers() -> None:
+    """Requests are in flight together; the barrier returns None for unanswered ones."""
+
+    stream = EventStream()
+    router = MessageRouter(stream)
+    em = RecordingAgent(router, stream, role=AgentRole.EM)
+    dev = RecordingAgent(router, stream)
+    planner = RecordingAgent(router, stream, role=AgentRole.PLANNER)
+    for agent in (em, dev, planner):
+        router.register_agent(agent.role, agent)
+
+    barrier = asyncio.create_task(
+        router.request_all(AgentRole.EM, [(AgentRole.PLANNER, "plan"), (AgentRole.DEV, "inspect")], timeout=0.1)
+    )
+    await asyncio.sleep(0)
+
+    # Both requests are delivered before either is answered
+    plan_request = await planner.inbox.get()
+    assert not dev.inbox.empty()
+    await router.reply(plan_request, AgentRole.PLANNER, "1. add route")
+
+    plan, inspection = await barrier
+
+    assert plan.content == "1. add route"
+    assert inspection is None
+    assert router.pending_requests == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", [RoutingEventMode.FULL, RoutingEventMode.COMPACT])
+async def test_routing_builds_no_events_nobody_wants(mode: RoutingEventMode) -> None:
+    """Without an interested consumer the message is delivered but no event is built or stored."""
+
+    stream = EventStream(primary_interest=lambda event_type, agent: False)
+    router = MessageRouter(stream, routing_events=mode)
+    agent = RecordingAgent(router, stream)
+    router.register_agent(AgentRole.DEV, agent)
+
+    assert await router.send(AgentRole.EM, AgentRole.DEV, "hello")
+
+    assert agent.inbox.qsize() == 1
+    assert stream.last_seq == 0
+    assert router._messages == {}
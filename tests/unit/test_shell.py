@@ -0,0 +1,192 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from agile_ai_sdk.core.config import AgentConfig
+from agile_ai_sdk.core.events import EventStream
+from agile_ai_sdk.core.router import MessageRouter
+from agile_ai_sdk.utils.shell import ShellSession, run_shell
+from tests.helpers.agents import RecordingAgent
+
+
+def _running(pid: int) -> bool:
+    """Whether pid is alive; a killed process nobody reaped yet shows as a zombie."""
+
+    try:
+        state = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()[0]
+    except FileNotFoundError:
+        return False
+    return state != "Z"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_shell_collects_output_and_exit_code(tmp_path) -> None:
+    """stdout, stderr and the exit code are returned."""
+
+    stdout, stderr, code = await run_shell("echo out; echo err >&2; exit 3", cwd=tmp_path, timeout=5.0)
+
+    assert (stdout, stderr, code) == (b"out\n", b"err\n", 3)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.skipif(not Path("/proc").is_dir(), reason="needs /proc")
+async def test_cancelled_command_is_killed(tmp_path) -> None:
+    """Cancelling the caller kills commands the shell forked, not just the shell."""
+
+    pid_file = tmp_path / "pid"
+    task = asyncio.create_task(run_shell(f"sleep 30 & echo $! > {pid_file}; wait", cwd=tmp_path, timeout=60.0))
+    while not pid_file.exists() or not pid_file.read_text().strip():
+        await asyncio.sleep(0.01)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    await asyncio.sleep(0.05)
+    assert not _running(int(pid_file.read_text()))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_session_keeps_cwd_and_environment(tmp_path) -> None:
+    """cd and export in one command still apply in the next, in the same shell."""
+
+    (tmp_path / "sub").mkdir()
+    session = ShellSession(tmp_path)
+    try:
+        assert await session.run("cd sub && export GREETING=hi", timeout=5.0) == (b"", b"", 0)
+        stdout, stderr, code = await session.run(
+            "pwd; echo $GREETING; echo oops >&2; exit_code() { return 3; }; exit_code", timeout=5.0
+        )
+    finally:
+        await session.close()
+
+    assert stdout == f"{tmp_path / 'sub'}\nhi\n".encode()
+    assert (stderr, code, session.starts) == (b"oops\n", 3, 1)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_session_frames_awkward_output(tmp_path) -> None:
+    """Output without a trailing newline, large output, stdin readers and syntax errors stay framed."""
+
+    session = ShellSession(tmp_path)
+    try:
+        assert await session.run("printf 'no newline'", timeout=5.0) == (b"no newline", b"", 0)
+        assert await session.run("cat", timeout=5.0) == (b"", b"", 0)
+
+        stdout, _, code = await session.run("seq 1 100000", timeout=5.0)
+        assert (stdout.count(b"\n"), stdout.endswith(b"100000\n"), code) == (100000, True, 0)
+
+        _, stderr, code = await session.run("echo 'unbalanced", timeout=5.0)
+        assert stderr and code != 0
+        assert await session.run("echo still framed", timeout=5.0) == (b"still framed\n", b"", 0)
+    finally:
+        await session.close()
+
+    assert session.starts == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_output_after_marker_line_is_kept_for_next_frame() -> None:
+    """Bytes after the marker line are the next command's output, not part of the exit code."""
+
+    stream = asyncio.StreamReader()
+    buffer = bytearray()
+    stream.feed_data(b"out\n\n__m1__ 0\nx\n123")
+
+    assert await ShellSession._read_frame(stream, buffer, b"__m1__") == (b"out\n", b"0")
+
+    stream.feed_data(b"\n\n__m2__ 5\n")
+    stream.feed_eof()
+
+    assert await ShellSession._read_frame(stream, buffer, b"__m2__") == (b"x\n123\n", b"5")
+    assert buffer == b""
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_session_returns_background_output_with_next_command(tmp_path) -> None:
+    """A background job writing after its command finished doesn't break the session."""
+
+    session = ShellSession(tmp_path)
+    try:
+        assert await session.run("(sleep 0.1; echo late) &", timeout=5.0) == (b"", b"", 0)
+        await asyncio.sleep(0.3)
+        assert await session.run("echo next", timeout=5.0) == (b"late\nnext\n", b"", 0)
+    finally:
+        await session.close()
+
+    assert session.starts == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.skipif(not Path("/proc").is_dir(), reason="needs /proc")
+async def test_session_timeout_kills_command_and_restarts(tmp_path) -> None:
+    """A timed-out command is killed with the shell, and the next command gets a fresh session."""
+
+    pid_file = tmp_path / "pid"
+    session = ShellSession(tmp_path)
+    try:
+        await session.run("cd /", timeout=5.0)
+        with pytest.raises(asyncio.TimeoutError):
+            await session.run(f"sleep 30 & echo $! > {pid_file}; wait", timeout=0.5)
+
+        await asyncio.sleep(0.05)
+        assert not session.alive
+        assert not _running(int(pid_file.read_text()))
+
+        # The new session starts in the original cwd
+        assert await session.run("pwd", timeout=5.0) == (f"{tmp_path}\n".encode(), b"", 0)
+        assert await session.run("exit 7", timeout=5.0) == (b"", b"", 7)
+        assert await session.run("true", timeout=5.0) == (b"", b"", 0)
+    finally:
+        await session.close()
+
+    assert session.starts == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("persistent", [True, False])
+async def test_agent_commands_share_a_session_unless_disabled(tmp_path, persistent: bool) -> None:
+    stream = EventStream()
+    agent = RecordingAgent(MessageRouter(stream), stream, config=AgentConfig(persistent_shell=persistent))
+    agent.workspace_dir = tmp_path
+    (tmp_path / "sub").mkdir()
+
+    await agent.run_command("cd sub", timeout=5.0)
+    stdout, _, _ = await agent.run_command("pwd", timeout=5.0)
+    if agent.shell is not None:
+        await agent.shell.close()
+
+    assert stdout == f"{tmp_path / 'sub' if persistent else tmp_path}\n".encode()
+    assert (agent.shell is not None) == persistent
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.skipif(not Path("/proc").is_dir(), reason="needs /proc")
+async def test_stopped_agent_reaps_its_shell(tmp_path) -> None:
+    """stop() kills the shell and the run loop waits for it and closes its pipes."""
+
+    stream = EventStream()
+    agent = RecordingAgent(MessageRouter(stream), stream, config=AgentConfig(persistent_shell=True))
+    agent.workspace_dir = tmp_path
+    await agent.run_command("true", timeout=5.0)
+    assert agent.shell is not None and agent.shell._process is not None
+    pid = agent.shell._process.pid
+
+    task = agent.spawn()
+    await asyncio.sleep(0.05)
+    agent.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert not agent.shell.alive
+    assert agent.shell._process is None
+    assert not _running(pid) and not Path(f"/proc/{pid}").exists()
@@ -0,0 +1,100 @@
+import re
+
+import pytest
+
+from agile_ai_sdk.core.config import ToolOutputPolicy
+from agile_ai_sdk.core.tool_output import ToolOutputStore
+
+
+def _numbered(count: int) -> str:
+    return "".join(f"line {i}\n" for i in range(1, count + 1))
+
+
+def _spill_id(capped: str) -> str:
+    match = re.search(r'read_output\("(\w+)", start_line=(\d+)\)', capped)
+    assert match is not None
+    return match.group(1)
+
+
+@pytest.mark.unit
+def test_short_output_is_returned_whole(tmp_path) -> None:
+    store = ToolOutputStore(ToolOutputPolicy(head_lines=5, tail_lines=5), directory=tmp_path)
+
+    assert store.cap(_numbered(10)) == _numbered(10)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.unit
+def test_long_output_keeps_head_and_tail_and_spills_the_rest(tmp_path) -> None:
+    """The model sees the first and last lines and a pointer; the full text is on disk."""
+
+    store = ToolOutputStore(ToolOutputPolicy(head_lines=3, tail_lines=2), directory=tmp_path)
+    output = _numbered(1_000)
+
+    capped = store.cap(output)
+
+    lines = capped.splitlines()
+    assert lines[:3] == ["line 1", "line 2", "line 3"]
+    assert lines[-2:] == ["line 999", "line 1000"]
+    assert "lines 4-998 of 1000 omitted" in lines[3]
+    assert (tmp_path / f"{_spill_id(capped)}.txt").read_text() == output
+
+
+@pytest.mark.unit
+def test_spilled_output_is_read_a_page_at_a_time(tmp_path) -> None:
+    store = ToolOutputStore(ToolOutputPolicy(head_lines=1, tail_lines=1, page_lines=10), directory=tmp_path)
+    spill_id = _spill_id(store.cap(_numbered(25)))
+
+    page = store.read(spill_id, start_line=2)
+    last = store.read(spill_id, start_line=22)
+
+    assert page.splitlines()[0] == f"[{spill_id}: lines 2-11 of 25; continue with start_line=12]"
+    assert page.splitlines()[1:] == [f"line {i}" for i in range(2, 12)]
+    assert last.splitlines() == [f"[{spill_id}: lines 22-25 of 25]", "line 22", "line 23", "line 24", "line 25"]
+
+
+@pytest.mark.unit
+def test_long_lines_are_capped_by_characters(tmp_path) -> None:
+    store = ToolOutputStore(ToolOutputPolicy(max_chars=100), directory=tmp_path)
+
+    capped = store.cap("x" * 10_000)
+
+    assert capped.startswith("x" * 50 + "\n[... lines 1-1 of 1 omitted")
+    assert capped.endswith("]\n" + "x" * 50)
+
+
+@pytest.mark.unit
+def test_read_rejects_ids_outside_the_spill_directory(tmp_path) -> None:
+    store = ToolOutputStore(ToolOutputPolicy(), directory=tmp_path)
+
+    with pytest.raises(ValueError):
+        store.read("../../etc/passwd")
+    with pytest.raises(FileNotFoundError):
+        store.read("0123abcd")
+
+
+@pytest.mark.unit
+def test_spill_directory_defaults_to_a_temporary_one() -> None:
+    store = ToolOutputStore(ToolOutputPolicy(head_lines=1, tail_lines=1))
+
+    spill_id = _spill_id(store.cap(_numbered(5)))
+
+    assert (store.directory / f"{spill_id}.txt").exists()
+
+
+@pytest.mark.unit
+def test_close_removes_temporary_directory_only(tmp_path) -> None:
+    """A directory the store created is removed on close; a given one is kept."""
+
+    policy = ToolOutputPolicy(head_lines=1, tail_lines=1)
+    temporary = ToolOutputStore(policy)
+    temporary.cap(_numbered(10))
+    created = temporary.directory
+    given = ToolOutputStore(policy, directory=tmp_path)
+    given.cap(_numbered(10))
+
+    temporary.close()
+    given.close()
+
+    assert not created.exists()
+    assert len(list(tmp_path.iterdir())) == 1